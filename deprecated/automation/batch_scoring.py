@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Batch fit scoring over a document-term matrix
+
+Scores a whole batch of jobs with the same rules as
+bulk_analyze.calculate_fit_score, but rule by rule instead of job by job:
+
+1. Every title and description is matched once against the compiled
+   preference vocabulary (KeywordMatcher). The matches form a sparse
+   document-term matrix in CSR form: `indptr` / `indices` arrays of term
+   ids, one row per job.
+2. The matrix is transposed into one column per term. A column is a bitset
+   over the batch, stored as a Python int with bit d set if job d mentions
+   the term.
+3. Each rule is evaluated for all jobs at once with bitwise operations on
+   those columns. Examples: "any reject location", "first matching
+   location" (a running mask of jobs already assigned), and "any
+   industry to avoid". Per-job arithmetic (keyword weights, bonuses) only
+   touches the jobs a rule selected.
+
+The numbers, reasons and concerns are identical to calculate_fit_score. Use
+this when re-scoring many stored postings at once, e.g. after a preferences
+change (see bulk_analyze.score_jobs).
+
+Usage:
+    from batch_scoring import score_batch
+    scores = score_batch(jobs, preferences, DOMAIN_BONUSES, matcher_for(preferences))
+    fit_score, reasons, concerns = scores[0]
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from keyword_matcher import KeywordMatcher
+
+
+# Seniority levels worth the full bonus (others in seniority_target get half)
+TOP_SENIORITY = ('director', 'head of', 'vp', 'vice president')
+
+# Points taken off jobs in an industry the profile avoids
+AVOIDED_INDUSTRY_PENALTY = 2.0
+
+Score = Tuple[float, List[str], List[str]]
+
+
+@dataclass
+class DocTermMatrix:
+    """Sparse document-term matrix (CSR) over a fixed vocabulary"""
+    vocabulary: List[str]
+    indptr: array
+    indices: array
+
+    @property
+    def n_docs(self) -> int:
+        return len(self.indptr) - 1
+
+    @classmethod
+    def build(cls, texts: Iterable[str], matcher: KeywordMatcher, vocabulary: Sequence[str]) -> 'DocTermMatrix':
+        """One matcher pass per text; row d holds the ids of the terms text d contains"""
+        column = {term: i for i, term in enumerate(vocabulary)}
+        indptr = array('q', [0])
+        indices = array('l')
+        for text in texts:
+            indices.extend(sorted(column[term] for term in matcher.find_all(text) if term in column))
+            indptr.append(len(indices))
+        return cls(list(vocabulary), indptr, indices)
+
+    def columns(self) -> Dict[str, int]:
+        """Term -> bitset of the documents containing it"""
+        bits = [bytearray((self.n_docs + 7) // 8) for _ in self.vocabulary]
+        indptr, indices = self.indptr, self.indices
+        for doc in range(self.n_docs):
+            byte, bit = doc >> 3, 1 << (doc & 7)
+            for term_id in indices[indptr[doc]:indptr[doc + 1]]:
+                bits[term_id][byte] |= bit
+        return {term: int.from_bytes(column, 'little') for term, column in zip(self.vocabulary, bits)}
+
+
+def members(mask: int) -> List[int]:
+    """Document indices set in a bitset, ascending"""
+    if not mask:
+        return []
+    binary = bin(mask)[:1:-1]
+    return [doc for doc, bit in enumerate(binary) if bit == '1']
+
+
+def mask_of(flags: Iterable[bool]) -> int:
+    """Bitset from one boolean per document"""
+    binary = ''.join('1' if flag else '0' for flag in flags)
+    return int(binary[::-1], 2) if binary else 0
+
+
+def role_reject(title: str, reject_keywords: Sequence[str]) -> Optional[str]:
+    """First role type to avoid named in a (lowercase) title, unless it is a product role"""
+    if 'product' in title:
+        return None
+    return next((keyword for keyword in reject_keywords if keyword in title), None)
+
+
+def score_batch(jobs: Sequence[Dict], preferences: Dict, domain_bonuses: Sequence,
+                matcher: KeywordMatcher = None) -> List[Score]:
+    """(fit_score, reasons, concerns) for every job, as calculate_fit_score would return them"""
+    n = len(jobs)
+    if not n:
+        return []
+
+    vocabulary = list(dict.fromkeys(
+        [term for values in preferences.values() for term in values]
+        + [term for domain_terms, _, _ in domain_bonuses for term in domain_terms]))
+    if matcher is None:
+        matcher = KeywordMatcher(vocabulary)
+
+    titles = [job.get('job_title', '').lower() for job in jobs]
+    descriptions = [job.get('description', '').lower() for job in jobs]
+    title_columns = DocTermMatrix.build(titles, matcher, vocabulary).columns()
+    text_columns = DocTermMatrix.build(descriptions, matcher, vocabulary).columns()
+    matched = {term: title_columns[term] | text_columns[term] for term in vocabulary}
+
+    def any_of(terms, columns=matched):
+        mask = 0
+        for term in terms:
+            mask |= columns[term]
+        return mask
+
+    scores = array('d', [5.0]) * n
+    reasons: List[List[str]] = [[] for _ in range(n)]
+    concerns: List[List[str]] = [[] for _ in range(n)]
+    everyone = (1 << n) - 1
+
+    # Auto-rejects: first reject location mentioned, then role types to avoid
+    rejected = 0
+    reject_reason = {}
+    for location in preferences['locations_reject']:
+        for doc in members(matched[location] & ~rejected):
+            reject_reason[doc] = (1.0, [f"❌ Requires relocation to {location}"], [])
+        rejected |= matched[location]
+    for doc, title in enumerate(titles):
+        role = role_reject(title, preferences['role_reject_keywords'])
+        if role and doc not in reject_reason:
+            reject_reason[doc] = (2.0, [f"❌ {role.title()} role, not Product Management"], [])
+            rejected |= 1 << doc
+    active = everyone & ~rejected
+
+    # Location: first high-priority match, else first medium-priority match
+    located = 0
+    for locations, points, marker in ((preferences['locations_high_priority'], 2.0, "✅"),
+                                      (preferences['locations_medium_priority'], 1.0, "⭐")):
+        for location in locations:
+            hits = matched[location] & active & ~located
+            for doc in members(hits):
+                scores[doc] += points
+                reasons[doc].append(f"{marker} Location: {location.title()}")
+            located |= hits
+    for doc in members(active & ~located):
+        concerns[doc].append("⚠️ Location not in preferred list")
+        scores[doc] -= 1.0
+
+    # High-value keywords: their weights summed, capped at 3
+    weights = preferences['keyword_weights']
+    found = 0
+    keyword_scores = [0.0] * n
+    keywords: List[List[str]] = [[] for _ in range(n)]
+    for keyword in preferences['keywords_high_value']:
+        hits = matched[keyword] & active
+        found |= hits
+        for doc in members(hits):
+            keyword_scores[doc] += weights[keyword]
+            keywords[doc].append(keyword)
+    for doc in members(found):
+        scores[doc] += min(keyword_scores[doc], 3.0)
+        reasons[doc].append(f"✅ Keywords: {', '.join(keywords[doc][:3])}")
+
+    # Medium-value keywords: the best weight, once
+    best = [0.0] * n
+    for keyword in preferences['keywords_medium_value']:
+        for doc in members(matched[keyword] & active):
+            best[doc] = max(best[doc], weights[keyword])
+    for doc in members(any_of(preferences['keywords_medium_value']) & active):
+        scores[doc] += best[doc]
+
+    # Industries to avoid
+    avoided: List[List[str]] = [[] for _ in range(n)]
+    for industry in preferences['industries_avoid']:
+        for doc in members(matched[industry] & active):
+            avoided[doc].append(industry)
+    for doc in members(any_of(preferences['industries_avoid']) & active):
+        concerns[doc].append(f"⚠️ Industry to avoid: {', '.join(avoided[doc][:3])}")
+        scores[doc] -= AVOIDED_INDUSTRY_PENALTY
+
+    # Seniority: first target level in the title
+    senior = 0
+    for level in preferences['seniority_target']:
+        hits = title_columns[level] & active & ~senior
+        top = level.startswith(TOP_SENIORITY)
+        for doc in members(hits):
+            scores[doc] += 2.0 if top else 1.0
+            reasons[doc].append(f"{'✅' if top else '⭐'} Seniority: {level.title()}")
+        senior |= hits
+    senior_titles = mask_of('senior' in title for title in titles)
+    for doc in members(active & ~senior & ~senior_titles):
+        concerns[doc].append("⚠️ May be junior role")
+        scores[doc] -= 0.5
+
+    # Industry/domain bonuses
+    for domain_terms, points, reason in domain_bonuses:
+        for doc in members(any_of(domain_terms) & active):
+            scores[doc] += points
+            reasons[doc].append(reason)
+
+    results = []
+    for doc in range(n):
+        if doc in reject_reason:
+            results.append(reject_reason[doc])
+        else:
+            score = max(min(scores[doc], 10.0), 1.0)
+            results.append((round(score, 1), reasons[doc][:5], concerns[doc][:3]))
+    return results
@@ -1,14 +1,36 @@
 #!/usr/bin/env python3
 """
 Bulk analyze job postings from staging folder
+
+Usage: python bulk_analyze.py [staging_dir] [--workers N] [--no-cache]
+
+Scored jobs are cached in <staging_dir>/.fit-scores.json (see score_cache.py),
+so unchanged files are not extracted again - by later bulk runs or by
+organize_staging.py.
+
+Jobs whose description nearly duplicates a tracked application or another
+file of the batch are flagged (see scripts/near_duplicates.py).
 """
 
+import argparse
+import hashlib
+import json
+import os
 import re
 import sys
 import codecs
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from extract_mhtml import extract_job_info_from_mhtml
+from batch_scoring import AVOIDED_INDUSTRY_PENALTY, TOP_SENIORITY, role_reject, score_batch
+from keyword_matcher import KeywordMatcher
+from score_cache import SCORE_CACHE_NAME, ScoreCache
+
+# Shared modules (career_profile, ...) live in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+from career_profile import ScoringProfile, load_profile
+from near_duplicates import NEAR_DUPLICATES_PATH, NearDuplicateIndex, application_descriptions, minhash
 
 # Force UTF-8 output on Windows
 if sys.platform == 'win32':
@@ -16,56 +38,88 @@ if sys.platform == 'win32':
     sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'ignore')
 
 
-# Career preferences for filtering and scoring
-PREFERENCES = {
-    'locations_high_priority': ['london', 'remote uk', 'uk', 'united kingdom'],
-    'locations_medium_priority': ['amsterdam', 'dublin', 'berlin', 'cologne', 'eu', 'europe', 'singapore', 'dubai', 'manila', 'seoul', 'bangkok'],
-    'locations_reject': ['saudi arabia', 'vietnam', 'united states', 'san francisco'],
-    'keywords_high_value': [
-        'data platform', 'cdp', 'customer data platform', 'martech', 'adtech',
-        'growth', 'experimentation', 'a/b testing', 'marketplace', 'two-sided platform',
-        'travel', 'hospitality', 'hotels', 'airline'
-    ],
-    'keywords_medium_value': [
-        'product management', 'product manager', 'product lead', 'director',
-        'ai product', 'ml product', 'platform', 'payments', 'fintech'
-    ],
-    'seniority_target': ['director', 'head of', 'vp', 'vice president', 'lead', 'principal'],
-    'role_reject_keywords': ['engineer', 'engineering manager', 'software engineer', 'b2b only']
-}
-
-
-def calculate_fit_score(job_info):
+# Built-in preferences for filtering and scoring. main() and analyze_all_jobs
+# score with the compiled career-preferences.md instead (see scripts/career_profile.py),
+# loaded when they run rather than at import (worker processes import this module)
+PREFERENCES = ScoringProfile().preferences()
+
+
+# Domain bonuses: (terms, points, reason)
+DOMAIN_BONUSES = [
+    (['travel', 'hospitality', 'hotel', 'airline', 'booking'], 1.5, "✅ Travel/hospitality domain (strong fit)"),
+    (['martech', 'adtech', 'advertising', 'marketing technology'], 1.0, "✅ MarTech/AdTech domain"),
+]
+
+
+def compile_matcher(preferences, domain_bonuses=DOMAIN_BONUSES):
+    """Compile every preference term (keyword_weights adds no new ones) into one matcher"""
+    terms = [term for values in preferences.values() for term in values]
+    terms.extend(term for domain_terms, _, _ in domain_bonuses for term in domain_terms)
+    return KeywordMatcher(terms)
+
+
+# Bump when calculate_fit_score's rules change; preference edits are picked up automatically
+SCORING_VERSION = 3
+
+
+def scoring_key(preferences=PREFERENCES, domain_bonuses=DOMAIN_BONUSES):
+    """Fingerprint of everything a cached fit score depends on"""
+    rules = json.dumps([SCORING_VERSION, preferences, domain_bonuses], sort_keys=True)
+    return hashlib.sha256(rules.encode('utf-8')).hexdigest()
+
+
+_MATCHERS = {}
+
+
+def matcher_for(preferences):
+    """Compiled matcher for a preferences dict (compiled once per process)"""
+    key = scoring_key(preferences)
+    if key not in _MATCHERS:
+        _MATCHERS[key] = compile_matcher(preferences)
+    return _MATCHERS[key]
+
+
+PREFERENCE_MATCHER = matcher_for(PREFERENCES)
+
+
+def calculate_fit_score(job_info, preferences=PREFERENCES):
     """Calculate fit score based on quick heuristics"""
     description = job_info.get('description', '').lower()
     job_title = job_info.get('job_title', '').lower()
     company = job_info.get('company', '').lower()
+    weights = preferences['keyword_weights']
+
+    # One pass over each text finds every preference term (whole words)
+    matcher = matcher_for(preferences)
+    title_terms = matcher.find_all(job_title)
+    matched = title_terms | matcher.find_all(description)
 
     score = 5.0  # Base score
     reasons = []
     concerns = []
 
     # Auto-reject based on location
-    for reject_loc in PREFERENCES['locations_reject']:
-        if reject_loc in description or reject_loc in job_title:
+    for reject_loc in preferences['locations_reject']:
+        if reject_loc in matched:
             return 1.0, [f"❌ Requires relocation to {reject_loc}"], []
 
-    # Auto-reject if pure engineering role
-    if 'engineer' in job_title and 'product' not in job_title:
-        return 2.0, [f"❌ Engineering role, not Product Management"], []
+    # Auto-reject role types to avoid (e.g. pure engineering roles)
+    rejected_role = role_reject(job_title, preferences['role_reject_keywords'])
+    if rejected_role:
+        return 2.0, [f"❌ {rejected_role.title()} role, not Product Management"], []
 
     # Location scoring
     location_match = False
-    for loc in PREFERENCES['locations_high_priority']:
-        if loc in description or loc in job_title:
+    for loc in preferences['locations_high_priority']:
+        if loc in matched:
             score += 2.0
             reasons.append(f"✅ Location: {loc.title()}")
             location_match = True
             break
 
     if not location_match:
-        for loc in PREFERENCES['locations_medium_priority']:
-            if loc in description or loc in job_title:
+        for loc in preferences['locations_medium_priority']:
+            if loc in matched:
                 score += 1.0
                 reasons.append(f"⭐ Location: {loc.title()}")
                 location_match = True
@@ -78,26 +132,31 @@ def calculate_fit_score(job_info):
     # High-value keyword matching
     keyword_score = 0
     matched_keywords = []
-    for keyword in PREFERENCES['keywords_high_value']:
-        if keyword in description or keyword in job_title:
-            keyword_score += 1.5
+    for keyword in preferences['keywords_high_value']:
+        if keyword in matched:
+            keyword_score += weights[keyword]
             matched_keywords.append(keyword)
 
     if matched_keywords:
         score += min(keyword_score, 3.0)  # Cap at 3 points
         reasons.append(f"✅ Keywords: {', '.join(matched_keywords[:3])}")
 
-    # Medium-value keyword matching
-    for keyword in PREFERENCES['keywords_medium_value']:
-        if keyword in description or keyword in job_title:
-            score += 0.5
-            break
+    # Medium-value keyword matching: the best weight, once
+    medium_weights = [weights[keyword] for keyword in preferences['keywords_medium_value'] if keyword in matched]
+    if medium_weights:
+        score += max(medium_weights)
+
+    # Industries to avoid
+    avoided = [industry for industry in preferences['industries_avoid'] if industry in matched]
+    if avoided:
+        concerns.append(f"⚠️ Industry to avoid: {', '.join(avoided[:3])}")
+        score -= AVOIDED_INDUSTRY_PENALTY
 
     # Seniority match
     seniority_match = False
-    for level in PREFERENCES['seniority_target']:
-        if level in job_title:
-            if level in ['director', 'head of', 'vp', 'vice president']:
+    for level in preferences['seniority_target']:
+        if level in title_terms:
+            if level.startswith(TOP_SENIORITY):
                 score += 2.0
                 reasons.append(f"✅ Seniority: {level.title()}")
             else:
@@ -111,13 +170,10 @@ def calculate_fit_score(job_info):
         score -= 0.5
 
     # Industry/domain bonuses
-    if any(word in description or word in job_title for word in ['travel', 'hospitality', 'hotel', 'airline', 'booking']):
-        score += 1.5
-        reasons.append("✅ Travel/hospitality domain (strong fit)")
-
-    if any(word in description or word in job_title for word in ['martech', 'adtech', 'advertising', 'marketing technology']):
-        score += 1.0
-        reasons.append("✅ MarTech/AdTech domain")
+    for domain_terms, points, reason in DOMAIN_BONUSES:
+        if any(term in matched for term in domain_terms):
+            score += points
+            reasons.append(reason)
 
     # Cap score at 10
     score = min(score, 10.0)
@@ -126,40 +182,162 @@ def calculate_fit_score(job_info):
     return round(score, 1), reasons[:5], concerns[:3]
 
 
-def analyze_all_jobs(staging_dir='staging'):
-    """Analyze all jobs in staging directory"""
+def score_jobs(jobs, preferences=PREFERENCES):
+    """calculate_fit_score for a whole batch at once (see batch_scoring.py)"""
+    return score_batch(jobs, preferences, DOMAIN_BONUSES, matcher_for(preferences))
+
+
+def analyze_job_file(filepath, preferences=PREFERENCES):
+    """Extract and score one saved job (runs in a worker process); errors are returned, not raised"""
+    filepath = Path(filepath)
+    try:
+        job_info = extract_job_info_from_mhtml(filepath)
+        if not job_info:
+            return {'filename': filepath.name, 'filepath': filepath, 'error': 'No HTML content found'}
+        if 'error' in job_info:
+            return {'filename': filepath.name, 'filepath': filepath, 'error': job_info['error']}
+
+        fit_score, reasons, concerns = calculate_fit_score(job_info, preferences)
+        return {
+            'filename': filepath.name,
+            'filepath': filepath,
+            'company': job_info['company'],
+            'job_title': job_info['job_title'],
+            'fit_score': fit_score,
+            'reasons': reasons,
+            'concerns': concerns,
+            'description': job_info['description']
+        }
+    except OSError as e:
+        # Unreadable right now (locked by OneDrive, deleted mid-run): retry next time
+        return {'filename': filepath.name, 'filepath': filepath, 'error': str(e), 'transient': True}
+    except Exception as e:
+        return {'filename': filepath.name, 'filepath': filepath, 'error': str(e)}
+
+
+def iter_analyses(mhtml_files, workers, preferences=PREFERENCES):
+    """Analyses in input order; files are processed in a pool when workers > 1"""
+    if workers <= 1 or len(mhtml_files) < 2:
+        for filepath in mhtml_files:
+            yield analyze_job_file(filepath, preferences)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(mhtml_files))) as executor:
+        futures = [executor.submit(analyze_job_file, filepath, preferences) for filepath in mhtml_files]
+        for filepath, future in zip(mhtml_files, futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                # Worker crashed (e.g. killed): only this file is lost
+                yield {'filename': filepath.name, 'filepath': filepath,
+                       'error': str(e) or type(e).__name__, 'transient': True}
+
+
+def flag_near_duplicates(results, known=None):
+    """
+    Flag jobs whose description nearly duplicates a tracked application
+    (the `known` index) or an earlier job of the batch (results order)
+
+    Flagged jobs get 'duplicate_of' (folder or file name) and a concern.
+    Returns the number flagged.
+    """
+    batch = NearDuplicateIndex()
+    flagged = 0
+    for result in results:
+        signature = minhash(result.get('description', ''))
+        if signature is None:
+            continue
+        match = (known.match(signature) if known is not None else None) or batch.match(signature)
+        if match is None:
+            batch.insert(result['filename'], signature)
+            continue
+        duplicate_of, score = Path(match[0]).name, match[1]
+        result['duplicate_of'] = duplicate_of
+        result['concerns'] = result['concerns'] + [f"⚠️ Near-duplicate of {duplicate_of} ({score:.0%} similar)"]
+        flagged += 1
+    return flagged
+
+
+def analyze_all_jobs(staging_dir='staging', workers=None, use_cache=True, known_jobs=None, preferences=None):
+    """
+    Analyze all jobs in staging directory
+
+    Jobs are scored with `preferences` (default: the compiled
+    career-preferences.md, loaded now), which are passed to the workers.
+
+    Files are extracted and scored in a process pool of `workers` processes
+    (default: CPU count; 1 = in-process). Files scored by an earlier run and
+    unchanged since come from the score cache without being extracted; if
+    the preferences changed in between, their stored job info is re-scored
+    in one batch (score_jobs). Results are collected in file-name order and
+    returned sorted by fit score (highest first).
+
+    Near-duplicates (flag_near_duplicates) are checked against known_jobs, a
+    NearDuplicateIndex of tracked applications, and within the batch.
+    """
     staging_path = Path(staging_dir)
+    workers = workers or os.cpu_count() or 1
+    if preferences is None:
+        preferences = load_profile().preferences()
 
     # Find all mhtml files
-    mhtml_files = list(staging_path.glob('*.mhtml'))
+    mhtml_files = sorted(staging_path.glob('*.mhtml'))
 
     print(f"📊 Found {len(mhtml_files)} job postings to analyze...")
     print()
 
+    cache = ScoreCache.load(staging_path / SCORE_CACHE_NAME, scoring_key(preferences))
     results = []
+    pending = []
+    rescore = []
+
+    for filepath in mhtml_files:
+        cached = cache.get(filepath) if use_cache else None
+        if cached is None and use_cache:
+            # Scored under other preferences: the extracted job info is still valid
+            cached = cache.get_previous(filepath)
+            if cached is not None:
+                if 'error' not in cached:
+                    rescore.append(cached)
+                    continue
+                cache.carry_over(filepath, cached)
+        if cached is None:
+            pending.append(filepath)
+        elif 'error' not in cached:
+            results.append(cached)
+        else:
+            print(f"⚠️ {cached['filename'][:60]}: {cached['error']} (unchanged, skipped)")
+
+    reused = len(mhtml_files) - len(pending) - len(rescore)
+    if reused:
+        print(f"♻️ {reused} unchanged files reused from {SCORE_CACHE_NAME}")
+
+    if rescore:
+        print(f"🔁 Re-scoring {len(rescore)} unchanged jobs with the current preferences")
+        for job, (fit_score, reasons, concerns) in zip(rescore, score_jobs(rescore, preferences)):
+            job.update(fit_score=fit_score, reasons=reasons, concerns=concerns)
+            results.append(job)
+            cache.carry_over(job['filepath'], job)
+
+    for i, result in enumerate(iter_analyses(pending, workers, preferences), 1):
+        print(f"Analyzing {i}/{len(pending)}: {result['filename'][:60]}...")
+
+        if not result.get('transient'):
+            cache.put(result['filepath'], result)
+        if 'error' not in result:
+            results.append(result)
+        else:
+            print(f"  ⚠️ Error extracting: {result['error']}")
 
-    for i, filepath in enumerate(mhtml_files, 1):
-        print(f"Analyzing {i}/{len(mhtml_files)}: {filepath.name[:60]}...")
-
-        job_info = extract_job_info_from_mhtml(filepath)
+    cache.save()
 
-        if job_info and 'error' not in job_info:
-            fit_score, reasons, concerns = calculate_fit_score(job_info)
-
-            results.append({
-                'filename': filepath.name,
-                'filepath': filepath,
-                'company': job_info['company'],
-                'job_title': job_info['job_title'],
-                'fit_score': fit_score,
-                'reasons': reasons,
-                'concerns': concerns,
-                'description': job_info['description']
-            })
-        else:
-            print(f"  ⚠️ Error extracting: {job_info.get('error', 'Unknown error')}")
+    # Later files of a repost are flagged, in file-name order
+    results.sort(key=lambda x: x['filename'])
+    flagged = flag_near_duplicates(results, known_jobs)
+    if flagged:
+        print(f"🔁 {flagged} near-duplicate jobs flagged")
 
-    # Sort by fit score (highest first)
+    # Sort by fit score (highest first), ties in file-name order
     results.sort(key=lambda x: x['fit_score'], reverse=True)
 
     return results
@@ -192,6 +370,7 @@ def generate_markdown_report(results):
 - ⭐ **Medium Priority (6-7):** {len(medium_priority)} jobs - Apply if time
 - ⚠️ **Low Priority (4-5):** {len(low_priority)} jobs - Only if strategic
 - ❌ **Skip (1-3):** {len(skip)} jobs - Poor fit
+- 🔁 **Near-duplicates:** {sum('duplicate_of' in r for r in results)} jobs - already tracked or repeated (see concerns)
 
 **Time Investment Estimate:**
 - Top 5 high-priority roles: ~15-20 hours (3-4 hours each)
@@ -362,10 +541,29 @@ mkdir -p staging/archive
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description='Bulk analyze saved job postings')
+    parser.add_argument('staging_dir', nargs='?', default='staging',
+                        help='Folder containing .mhtml files (default: staging)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes (default: CPU count; 1 = no pool)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-analyze every file, ignoring cached scores')
+    args = parser.parse_args()
+
     print("🚀 Bulk Job Analysis Starting...")
     print()
 
-    results = analyze_all_jobs('staging')
+    # Applications already tracked, for near-duplicate detection
+    known_jobs = NearDuplicateIndex.load(NEAR_DUPLICATES_PATH)
+    known_jobs.refresh(application_descriptions(Path('applications')))
+    if known_jobs.dirty:
+        known_jobs.save(NEAR_DUPLICATES_PATH)
+
+    # Career preferences, compiled from career-preferences.md (see scripts/career_profile.py)
+    preferences = load_profile().preferences()
+
+    results = analyze_all_jobs(args.staging_dir, workers=args.workers, use_cache=not args.no_cache,
+                               known_jobs=known_jobs, preferences=preferences)
 
     print()
     print(f"✅ Analysis complete! {len(results)} jobs analyzed")
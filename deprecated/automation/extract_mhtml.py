@@ -1,80 +1,341 @@
 #!/usr/bin/env python3
 """
 Extract job descriptions from LinkedIn MHTML files
+
+MHTML files are read as a stream of MIME parts: only the text/html part is
+decoded (quoted-printable/base64 via binascii, charset via codecs), and
+reading stops once it has been found. Its HTML is parsed incrementally and
+parsing stops once a known job description container has been read.
 """
 
+import binascii
+import codecs
+import io
 import re
 import sys
+from email.parser import BytesHeaderParser
+from html.parser import HTMLParser
 from pathlib import Path
 
 
-def decode_quoted_printable(text):
-    """Decode quoted-printable encoding"""
-    # Remove soft line breaks (= at end of line)
-    text = text.replace('=\n', '')
-    text = text.replace('=\r\n', '')
-
-    # Decode =XX hex codes
-    def hex_replacer(match):
+DEFAULT_CHARSET = 'utf-8'
+READ_SIZE = 64 * 1024
+FEED_SIZE = 8 * 1024  # HTML is parsed in slices so parsing can stop mid-block
+HEADER_PARSER = BytesHeaderParser()
+
+# Job description containers: (attribute, value, id of a required ancestor)
+DESCRIPTION_CONTAINERS = (
+    ('class', 'jobs-description__content', None),    # LinkedIn (signed in)
+    ('id', 'job-details', None),                     # LinkedIn (signed in, inner)
+    ('class', 'show-more-less-html__markup', None),  # LinkedIn (guest view)
+    ('class', 'job__description', None),             # Greenhouse job boards
+    ('id', 'content', 'app_body'),                   # Greenhouse classic boards
+    ('class', 'posting-page', None),                 # Lever
+)
+
+# Elements whose text is never visible
+HIDDEN_TAGS = frozenset(('script', 'style', 'noscript', 'template', 'svg'))
+VOID_TAGS = frozenset(('area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+                       'meta', 'param', 'source', 'track', 'wbr'))
+
+WHITESPACE_RE = re.compile(r'\s+')
+ABOUT_HEADING_RE = re.compile(r'^About the job\s*', re.IGNORECASE)
+
+
+class MhtmlPart:
+    """One MIME part of an MHTML file; the body is read lazily, in blocks"""
+
+    def __init__(self, headers, body_chunks):
+        self.headers = headers
+        self._body_chunks = body_chunks
+
+    @property
+    def content_type(self):
+        return self.headers.get_content_type()
+
+    @property
+    def charset(self):
+        return self.headers.get_content_charset() or DEFAULT_CHARSET
+
+    @property
+    def transfer_encoding(self):
+        return str(self.headers.get('Content-Transfer-Encoding', '7bit')).strip().lower()
+
+    @property
+    def location(self):
+        return self.headers.get('Content-Location')
+
+    def iter_bytes(self):
+        """Body decoded from its transfer encoding"""
+        if self.transfer_encoding == 'quoted-printable':
+            # Chunks end at line breaks, so escapes and soft breaks are never split
+            for chunk in self._body_chunks:
+                yield binascii.a2b_qp(chunk)
+        elif self.transfer_encoding == 'base64':
+            pending = b''
+            for chunk in self._body_chunks:
+                pending += chunk.translate(None, b' \t\r\n')
+                usable = len(pending) - len(pending) % 4
+                if usable:
+                    try:
+                        yield binascii.a2b_base64(pending[:usable])
+                    except binascii.Error:
+                        pass
+                    pending = pending[usable:]
+        else:
+            yield from self._body_chunks
+
+    def iter_text(self):
+        """Body decoded to text with the part's charset (invalid bytes replaced)"""
         try:
-            return chr(int(match.group(1), 16))
-        except:
-            return match.group(0)
-
-    text = re.sub(r'=([0-9A-F]{2})', hex_replacer, text, flags=re.IGNORECASE)
-    return text
+            decoder = codecs.getincrementaldecoder(self.charset)(errors='replace')
+        except LookupError:
+            decoder = codecs.getincrementaldecoder(DEFAULT_CHARSET)(errors='replace')
+        for chunk in self.iter_bytes():
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+    def skip(self):
+        """Discard the rest of the body without decoding it"""
+        for _ in self._body_chunks:
+            pass
+
+
+class MhtmlReader:
+    """
+    Streaming reader for MHTML (multipart/related) files.
+
+    Reads a binary stream in fixed-size blocks and walks its MIME parts. Part
+    bodies are located with a boundary search over each block, so parts that
+    are not read (images, CSS, fonts) are skipped without being decoded or
+    buffered, and the caller can stop as soon as it has the part it needs.
+    """
+
+    def __init__(self, stream, read_size=READ_SIZE):
+        self._stream = stream
+        self._read_size = read_size
+        self._buffer = b''
+        self._finished = False
+        self.headers = self._read_headers()
+        boundary = self.headers.get_param('boundary')
+        self._delimiter = b'--' + boundary.encode('ascii', 'ignore') if boundary else None
+
+    def _fill(self):
+        data = self._stream.read(self._read_size)
+        if not data:
+            return False
+        self._buffer += data
+        return True
+
+    def _readline(self):
+        start = 0
+        while True:
+            end = self._buffer.find(b'\n', start)
+            if end >= 0:
+                line, self._buffer = self._buffer[:end + 1], self._buffer[end + 1:]
+                return line
+            start = len(self._buffer)
+            if not self._fill():
+                line, self._buffer = self._buffer, b''
+                return line
+
+    def _read_headers(self):
+        block = []
+        while True:
+            line = self._readline()
+            if not line:
+                self._finished = True
+                break
+            if not line.strip():
+                break
+            block.append(line)
+        return HEADER_PARSER.parsebytes(b''.join(block))
+
+    def _end_of_part(self):
+        """Consume a delimiter line at the start of the buffer"""
+        if self._readline().rstrip() == self._delimiter + b'--':
+            self._finished = True
+
+    def _body(self):
+        """Body chunks, each ending at a line break, up to the next boundary"""
+        if self._delimiter is None:
+            while self._buffer or self._fill():
+                chunk, self._buffer = self._buffer, b''
+                yield chunk
+            self._finished = True
+            return
+
+        marker = b'\n' + self._delimiter
+        while len(self._buffer) < len(self._delimiter) and self._fill():
+            pass
+        if self._buffer.startswith(self._delimiter):
+            self._end_of_part()
+            return
+
+        while True:
+            position = self._buffer.find(marker)
+            if position >= 0:
+                chunk, self._buffer = self._buffer[:position + 1], self._buffer[position + 1:]
+                if chunk:
+                    yield chunk
+                self._end_of_part()
+                return
+
+            # Emit whole lines that cannot be the start of a marker split across blocks
+            cut = self._buffer.rfind(b'\n', 0, len(self._buffer) - len(marker) + 1)
+            if cut >= 0:
+                chunk, self._buffer = self._buffer[:cut + 1], self._buffer[cut + 1:]
+                yield chunk
+            if not self._fill():
+                if self._buffer:
+                    chunk, self._buffer = self._buffer, b''
+                    yield chunk
+                self._finished = True
+                return
+
+    def parts(self):
+        """Yield each MIME part; unread bodies are skipped when iteration continues"""
+        if self._delimiter is None:
+            # Single-part document: the top-level headers describe the body
+            yield MhtmlPart(self.headers, self._body())
+            return
+
+        for _ in self._body():  # preamble
+            pass
+        while not self._finished:
+            part = MhtmlPart(self._read_headers(), self._body())
+            if self._finished and not part.headers.keys():
+                return
+            yield part
+            part.skip()
+
+
+def find_html_part(stream):
+    """First text/html part of an MHTML stream (None if there is none)"""
+    for part in MhtmlReader(stream).parts():
+        if part.content_type == 'text/html':
+            return part
+    return None
+
+
+def read_html_from_mhtml(filepath):
+    """HTML of a saved job page; reading stops after the text/html part"""
+    with open(filepath, 'rb') as f:
+        part = find_html_part(f)
+        return ''.join(part.iter_text()) if part else None
 
 
 def extract_html_from_mhtml(mhtml_content):
-    """Extract HTML content from MHTML file"""
-    # Find the text/html section
-    html_match = re.search(
-        r'Content-Type: text/html.*?\n\n(.*?)(?=\n------MultipartBoundary|$)',
-        mhtml_content,
-        re.DOTALL
-    )
-
-    if not html_match:
-        return None
-
-    html_content = html_match.group(1)
-
-    # Decode quoted-printable
-    html_content = decode_quoted_printable(html_content)
-
-    return html_content
+    """Extract HTML content from MHTML content already read into a string"""
+    part = find_html_part(io.BytesIO(mhtml_content.encode('utf-8', errors='ignore')))
+    return ''.join(part.iter_text()) if part else None
+
+
+class VisibleTextParser(HTMLParser):
+    """
+    Incremental visible-text extractor.
+
+    Collects text nodes as HTML is fed in (script, style and other invisible
+    elements are skipped; entities are decoded by HTMLParser). Text inside a
+    known job description container is flagged, and description_complete is
+    set once that container's end tag has been seen (later text is dropped
+    when stop_at_description is set).
+    """
+
+    def __init__(self, stop_at_description=True):
+        super().__init__(convert_charrefs=True)
+        self.stop_at_description = stop_at_description
+        self.pending = []  # (text, in_description) since the last drain
+        self.description_complete = False
+        self._open = []  # (tag, id) of open elements
+        self._hidden_depth = 0
+        self._description_depth = None
+        self._description_has_text = False
+
+    def _is_description_container(self, attrs):
+        attributes = dict(attrs)
+        for attribute, value, scope_id in DESCRIPTION_CONTAINERS:
+            actual = attributes.get(attribute)
+            if not actual:
+                continue
+            matched = value in actual.split() if attribute == 'class' else actual == value
+            if matched and (scope_id is None or any(element_id == scope_id for _, element_id in self._open)):
+                return True
+        return False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_TAGS:
+            return
+        if tag in HIDDEN_TAGS:
+            self._hidden_depth += 1
+        self._open.append((tag, dict(attrs).get('id')))
+        if (self._description_depth is None and not self.description_complete
+                and self._is_description_container(attrs)):
+            self._description_depth = len(self._open)
+            self._description_has_text = False
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS or not any(open_tag == tag for open_tag, _ in self._open):
+            return
+        # Pop up to the matching tag (closes elements left open in between)
+        while self._open:
+            open_tag, _ = self._open.pop()
+            if open_tag in HIDDEN_TAGS:
+                self._hidden_depth -= 1
+            if self._description_depth is not None and len(self._open) < self._description_depth:
+                self._description_depth = None
+                # An empty placeholder container does not end the search
+                self.description_complete = self._description_has_text
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._hidden_depth or not data.strip():
+            return
+        if self.stop_at_description and self.description_complete:
+            return
+        in_description = self._description_depth is not None
+        if in_description:
+            self._description_has_text = True
+        self.pending.append((data, in_description))
+
+
+def iter_visible_text(html_chunks, stop_at_description=True):
+    """
+    Yield (text, in_description) for each visible text node of streamed HTML.
+
+    With stop_at_description, parsing stops as soon as a job description
+    container has been read completely; the rest of the page is never parsed.
+    """
+    parser = VisibleTextParser(stop_at_description)
+    for chunk in html_chunks:
+        for start in range(0, len(chunk), FEED_SIZE):
+            parser.feed(chunk[start:start + FEED_SIZE])
+            pending, parser.pending = parser.pending, []
+            yield from pending
+            if stop_at_description and parser.description_complete:
+                return
+    parser.close()
+    yield from parser.pending
+
+
+def normalize_text(pieces):
+    """Join text nodes and collapse whitespace"""
+    return WHITESPACE_RE.sub(' ', ' '.join(pieces)).strip()
 
 
 def extract_text_from_html(html):
     """Extract visible text from HTML"""
-    # Remove script and style tags
-    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-
-    # Remove HTML tags but keep spacing
-    text = re.sub(r'<[^>]+>', ' ', html)
-
-    # Decode HTML entities
-    text = text.replace('&nbsp;', ' ')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
-
-    # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-
-    return text
+    return normalize_text(text for text, _ in iter_visible_text([html], stop_at_description=False))
 
 
 def extract_job_info_from_mhtml(filepath):
     """Extract job information from LinkedIn MHTML file"""
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            mhtml_content = f.read()
-
         # Extract filename info
         filename = Path(filepath).name
 
@@ -109,23 +370,28 @@ def extract_job_info_from_mhtml(filepath):
                         company = parts[1].strip()
                     break
 
-        # Extract HTML content
-        html = extract_html_from_mhtml(mhtml_content)
-        if not html:
-            return None
+        # Stream the HTML part through the text extractor; parsing stops once a
+        # LinkedIn/Greenhouse/Lever description container has been read
+        with open(filepath, 'rb') as f:
+            html_part = find_html_part(f)
+            if html_part is None:
+                return None
 
-        # Extract all text
-        full_text = extract_text_from_html(html)
+            visible, description = [], []
+            for text, in_description in iter_visible_text(html_part.iter_text()):
+                visible.append(text)
+                if in_description:
+                    description.append(text)
 
-        # Try to find job description section
-        # Look for common LinkedIn job page markers
-        desc_section = ""
+        full_text = normalize_text(visible)
+        desc_section = ABOUT_HEADING_RE.sub('', normalize_text(description))
 
         # Method 1: Look for "About the job" section
-        about_match = re.search(r'About the job(.*?)(?=Show more|Show less|Apply|Easy Apply|Save|$)',
-                               full_text, re.DOTALL | re.IGNORECASE)
-        if about_match:
-            desc_section = about_match.group(1).strip()
+        if not desc_section:
+            about_match = re.search(r'About the job(.*?)(?=Show more|Show less|Apply|Easy Apply|Save|$)',
+                                   full_text, re.DOTALL | re.IGNORECASE)
+            if about_match:
+                desc_section = about_match.group(1).strip()
 
         # Method 2: Look for sections after company name
         if not desc_section and company in full_text:
@@ -144,7 +410,8 @@ def extract_job_info_from_mhtml(filepath):
             'company': company,
             'job_title': job_title,
             'description': desc_section[:1500],  # Limit to 1500 chars
-            'full_text_length': len(full_text)
+            # Visible text read before parsing stopped (not the whole page)
+            'extracted_text_length': len(full_text)
         }
 
     except Exception as e:
@@ -155,9 +422,6 @@ def extract_job_info_from_mhtml(filepath):
 
 
 if __name__ == '__main__':
-    import sys
-    import codecs
-
     # Force UTF-8 output
     if sys.platform == 'win32':
         sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'ignore')
@@ -175,7 +439,8 @@ if __name__ == '__main__':
         # Clean up any problematic characters
         desc = result['description'][:500].encode('ascii', 'ignore').decode('ascii')
         print(desc)
-        print(f"\n... (full text length: {result['full_text_length']} chars)")
+        print(f"\n... (extracted text length: {result['extracted_text_length']} chars, "
+              f"read up to the end of the description)")
     elif result:
         print(f"Error: {result['error']}")
     else:
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compiled multi-keyword matcher for job scoring
+
+The preference vocabulary (single words and phrases such as "data platform"
+or "head of") is compiled once into a trie over words, plus an alias table
+mapping every accepted plural of a vocabulary word ("hotels", "platforms")
+back to that word. Matching tokenizes a document once and
+walks the trie from each word that is in the alias table, so one pass finds
+every term - including overlapping ones like "data platform" and
+"platform" - and the cost grows with document length, not vocabulary size.
+
+Terms match at word boundaries, case-insensitively: "uk" does not match
+"bulk" and "lead" does not match "mislead". Words of four or more letters
+also match their plurals (see INFLECTIONS); other derived words are
+different terms, so "lead" does not match "leadership" and "head" does not
+match "heading".
+
+Usage:
+    from keyword_matcher import KeywordMatcher
+    matcher = KeywordMatcher(['london', 'data platform', 'head of'])
+    matcher.find_all("Head of Data Platforms, London")
+    # {'head of', 'data platform', 'london'}
+"""
+
+import re
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+WORD_RE = re.compile(r"\w+")
+
+# Plural suffixes accepted after vocabulary words of MIN_INFLECTED_LENGTH+ letters
+INFLECTIONS = ('s', 'es')
+MIN_INFLECTED_LENGTH = 4
+
+# Trie node key holding the terms that end at that node (words are never None)
+TERMS = None
+
+
+class KeywordMatcher:
+    """Word-boundary phrase matcher compiled from a fixed vocabulary"""
+
+    def __init__(self, terms: Iterable[str]):
+        self._root: Dict = {}
+        self._aliases: Dict[str, Tuple[str, ...]] = {}
+        self.terms: List[str] = []
+
+        for term in terms:
+            words = WORD_RE.findall(term.lower())
+            if not words:
+                continue
+            node = self._root
+            for word in words:
+                node = node.setdefault(word, {})
+                self._add_aliases(word)
+            node.setdefault(TERMS, []).append(term)
+            self.terms.append(term)
+
+        # Single-word terms are resolved with set operations; only tokens that
+        # can start a phrase need the trie walk
+        self._single_words: Dict[str, List[str]] = {}
+        phrase_words = {word for word, node in self._root.items() if node.keys() - {TERMS}}
+        for form, words in self._aliases.items():
+            terms = [term for word in words for term in self._root.get(word, {}).get(TERMS, ())]
+            if terms:
+                self._single_words[form] = terms
+        self._phrase_starts = frozenset(form for form, words in self._aliases.items()
+                                        if phrase_words.intersection(words))
+
+    def _add_aliases(self, word: str):
+        forms = [word]
+        if len(word) >= MIN_INFLECTED_LENGTH:
+            forms.extend(word + suffix for suffix in INFLECTIONS)
+        for form in forms:
+            known = self._aliases.get(form, ())
+            if word not in known:
+                # The exact word always comes first
+                self._aliases[form] = (word,) + known if form == word else known + (word,)
+
+    def find_all(self, *texts: str) -> Set[str]:
+        """All vocabulary terms occurring in any of the texts"""
+        found = set()
+        for text in texts:
+            if not text:
+                continue
+            tokens = WORD_RE.findall(text.lower())
+            present = self._aliases.keys() & set(tokens)
+            if not present:
+                continue
+            for form in present:
+                terms = self._single_words.get(form)
+                if terms:
+                    found.update(terms)
+            if not present.isdisjoint(self._phrase_starts):
+                self._find_phrases(tokens, found)
+        return found
+
+    def _find_phrases(self, tokens: List[str], found: Set[str]):
+        """Walk the trie from every token that can start a multi-word term"""
+        root = self._root
+        aliases = self._aliases
+        phrase_starts = self._phrase_starts
+        for start, token in enumerate(tokens):
+            if token not in phrase_starts:
+                continue
+            frontier = [root[word] for word in aliases[token] if word in root]
+            position = start + 1
+            while frontier and position < len(tokens):
+                next_words = aliases.get(tokens[position])
+                if not next_words:
+                    break
+                frontier = [node[word] for node in frontier for word in next_words if word in node]
+                for node in frontier:
+                    terms = node.get(TERMS)
+                    if terms:
+                        found.update(terms)
+                position += 1
@@ -4,7 +4,7 @@
 Job Processing Script - ToS-Compliant Job Organization
 
 Processes manually saved jobs (via bookmarklet) to:
-- Deduplicate against existing applications
+- Deduplicate against existing applications (company/title and near-duplicate descriptions)
 - Organize into proper folder structure
 - Validate job description format
 - Generate batch summary
@@ -16,6 +16,10 @@ Usage:
     python scripts/process_saved_jobs.py
     python scripts/process_saved_jobs.py --batch staging/my-batch
     python scripts/process_saved_jobs.py --dry-run
+
+Each input folder gets its own batch folder, staging/<input>-processed-batch.
+An interrupted run is resumed by running it again on the same input: every
+finished file is appended to the batch's PROCESSING-JOURNAL.jsonl.
 """
 
 import argparse
@@ -23,10 +27,19 @@ import json
 import re
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+# Shared modules (dedup_index, ...) live in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'scripts'))
+from dedup_index import DedupIndex
+from report_writer import write_report
+from near_duplicates import NearDuplicateIndex, application_descriptions
+
 # Fix Windows console encoding for emojis
 if sys.platform == 'win32':
     try:
@@ -39,8 +52,31 @@ if sys.platform == 'win32':
 class JobDeduplicator:
     """Check if job already exists in applications folder."""
 
-    def __init__(self, applications_dir: Path):
+    def __init__(self, applications_dir: Path, index_path: Optional[Path] = None,
+                 near_duplicates_path: Optional[Path] = None):
         self.applications_dir = applications_dir
+        self.index_path = index_path
+        self.near_duplicates_path = near_duplicates_path
+        self._index = None
+        self._near_duplicates = None
+
+    @property
+    def index(self) -> DedupIndex:
+        """Deduplication index, built on first use (once per batch)"""
+        if self._index is None:
+            self._index = DedupIndex.load(self.applications_dir, self.index_path)
+        return self._index
+
+    @property
+    def near_duplicates(self) -> NearDuplicateIndex:
+        """Description-similarity index, synced with the application folders on first use"""
+        if self._near_duplicates is None:
+            if self.near_duplicates_path:
+                self._near_duplicates = NearDuplicateIndex.load(self.near_duplicates_path)
+            else:
+                self._near_duplicates = NearDuplicateIndex()
+            self._near_duplicates.refresh(application_descriptions(self.applications_dir))
+        return self._near_duplicates
 
     def is_duplicate(self, company: str, title: str) -> Optional[Path]:
         """
@@ -49,31 +85,34 @@ class JobDeduplicator:
         Returns:
             Path to existing application if duplicate, None otherwise
         """
-        if not self.applications_dir.exists():
-            return None
+        existing = self.index.find(company, title)
+        return Path(existing) if existing else None
 
-        # Normalize for comparison
-        company_norm = self._normalize(company)
-        title_norm = self._normalize(title)
-
-        for app_folder in self.applications_dir.iterdir():
-            if not app_folder.is_dir() or app_folder.name.startswith('_'):
-                continue
+    def is_near_duplicate(self, content: str) -> Optional[Tuple[Path, float]]:
+        """
+        Check if the same description is already tracked (reposts, other boards).
 
-            folder_name = app_folder.name.lower()
+        Returns:
+            (path to existing application, estimated similarity) if found, None otherwise
+        """
+        match = self.near_duplicates.find(content)
+        return (Path(match[0]), match[1]) if match else None
 
-            # Check if company and partial title match
-            if company_norm in folder_name:
-                # Allow partial title match (first 3 words)
-                title_words = title_norm.split()[:3]
-                if all(word in folder_name for word in title_words):
-                    return app_folder
+    def add(self, company: str, title: str, folder: Path, content: Optional[str] = None):
+        """Remember a job accepted in this batch so later repeats are caught."""
+        self.index.add(company, title, folder)
+        if content is not None:
+            self.near_duplicates.add(folder, content)
 
-        return None
+    def remove(self, company: str, folder: Path):
+        """Forget a batch job that was not saved after all (its copy failed)."""
+        self.index.remove(company, folder)
+        self.near_duplicates.remove(folder)
 
-    def _normalize(self, text: str) -> str:
-        """Normalize text for comparison."""
-        return re.sub(r'[^a-z0-9\s]', '', text.lower())
+    def save(self):
+        """Persist the description index if this batch changed it."""
+        if self._near_duplicates is not None and self._near_duplicates.dirty and self.near_duplicates_path:
+            self._near_duplicates.save(self.near_duplicates_path)
 
 
 class JobProcessor:
@@ -83,15 +122,26 @@ class JobProcessor:
         self.project_root = project_root
         self.applications_dir = project_root / 'applications'
         self.staging_dir = project_root / 'staging'
-        self.deduplicator = JobDeduplicator(self.applications_dir)
+        self.deduplicator = JobDeduplicator(self.applications_dir,
+                                            project_root / 'insights' / '.dedup-index.json',
+                                            project_root / 'insights' / '.near-duplicates.json')
 
-    def process_batch(self, input_dir: Path, dry_run: bool = False) -> Dict:
+    def process_batch(self, input_dir: Path, dry_run: bool = False, workers: Optional[int] = None) -> Dict:
         """
         Process a batch of saved jobs.
 
+        Files are parsed and copied in a thread pool; duplicate checks run
+        in file-name order, so the first of two repeats is the one kept.
+        The batch folder is named after input_dir. Every finished file
+        (duplicate or copied) is appended to the batch's
+        PROCESSING-JOURNAL.jsonl as it completes, and a re-run of an
+        interrupted batch only processes the files not finished yet (failed
+        files are retried). PROCESSING-SUMMARY.json is written at the end.
+
         Args:
             input_dir: Directory containing saved job markdown files
             dry_run: If True, show what would happen without actually processing
+            workers: Threads for parsing and copying (default: ThreadPoolExecutor's)
 
         Returns:
             Summary dict with processing statistics
@@ -105,16 +155,18 @@ class JobProcessor:
         print(f"Input: {input_dir}")
 
         # Find all job markdown files
-        job_files = list(input_dir.glob('*.md'))
+        job_files = sorted(input_dir.glob('*.md'))
         print(f"Found {len(job_files)} job files\n")
 
         if not job_files:
             print("No job files found. Make sure files are saved to this directory.")
             return {'total': 0, 'processed': 0, 'duplicates': 0, 'errors': 0}
 
-        # Create output batch directory
-        batch_name = datetime.now().strftime('%Y-%m-%d-processed-batch')
+        # Create output batch directory (one per input folder, so a re-run on another day resumes it)
+        batch_name = f"{input_dir.resolve().name}-processed-batch"
         output_dir = self.staging_dir / batch_name
+        summary_file = output_dir / 'PROCESSING-SUMMARY.json'
+        journal_file = output_dir / 'PROCESSING-JOURNAL.jsonl'
 
         if not dry_run:
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -128,66 +180,53 @@ class JobProcessor:
             'jobs': []
         }
 
-        for i, job_file in enumerate(job_files, 1):
-            print(f"[{i}/{len(job_files)}] Processing: {job_file.name}")
-
-            try:
-                # Parse job file
-                job_data = self._parse_job_file(job_file)
-
-                if not job_data:
-                    print(f"  ❌ Failed to parse job file")
-                    results['errors'] += 1
-                    continue
-
-                # Check for duplicates
-                existing = self.deduplicator.is_duplicate(
-                    job_data['company'],
-                    job_data['title']
-                )
-
-                if existing:
-                    print(f"  ⏭️  Duplicate: Already tracked in {existing.name}")
-                    results['duplicates'] += 1
-                    results['jobs'].append({
-                        'company': job_data['company'],
-                        'title': job_data['title'],
-                        'status': 'duplicate',
-                        'existing_folder': str(existing)
-                    })
+        # Resume: files journaled by an earlier run of this batch are done
+        finished = set()
+        if not dry_run:
+            names = {job_file.name for job_file in job_files}
+            for job in self._load_journal(journal_file, output_dir):
+                if job['file'] not in names:
                     continue
-
-                # Create folder name
-                folder_name = self._create_folder_name(
-                    job_data['company'],
-                    job_data['title']
-                )
-
-                # Save to output directory
-                if not dry_run:
-                    job_folder = output_dir / folder_name
-                    job_folder.mkdir(parents=True, exist_ok=True)
-
-                    # Copy job description
-                    shutil.copy2(job_file, job_folder / 'job-description.md')
-
-                    print(f"  ✅ Saved to: {folder_name}/")
-                else:
-                    print(f"  ✓ Would save to: {folder_name}/")
-
-                results['processed'] += 1
-                results['jobs'].append({
-                    'company': job_data['company'],
-                    'title': job_data['title'],
-                    'location': job_data.get('location', 'Unknown'),
-                    'url': job_data.get('url', ''),
-                    'status': 'processed',
-                    'folder': folder_name
-                })
-
-            except Exception as e:
-                print(f"  ❌ Error: {e}")
-                results['errors'] += 1
+                self._record(results, job)
+                finished.add(job['file'])
+            if finished:
+                print(f"Resuming batch: {len(finished)} files already done\n")
+        pending = [job_file for job_file in job_files if job_file.name not in finished]
+
+        # Copies are journaled from their done-callbacks as they land (also when the
+        # run is interrupted: leaving the pool waits for the copies already submitted)
+        lock = threading.Lock()
+        journal_context = nullcontext() if dry_run else open(journal_file, 'a', encoding='utf-8')
+        with journal_context as journal, ThreadPoolExecutor(max_workers=workers) as pool:
+            parsed = pool.map(self._parse_job_file, pending)
+
+            for i, (job_file, job_data) in enumerate(zip(pending, parsed), 1):
+                print(f"[{i}/{len(pending)}] Processing: {job_file.name}")
+
+                try:
+                    if not job_data:
+                        print(f"  ❌ Failed to parse job file")
+                        results['errors'] += 1
+                        continue
+
+                    with lock:
+                        job = self._check_job(job_file, job_data, output_dir)
+                        if job['status'] == 'duplicate':
+                            self._record(results, job, journal)
+                        elif dry_run:
+                            print(f"  ✓ Would save to: {job['folder']}/")
+                            self._record(results, job)
+                    if job['status'] == 'processed' and not dry_run:
+                        future = pool.submit(self._save_job, job_file, output_dir / job['folder'])
+                        future.add_done_callback(
+                            lambda future, job=job: self._copy_done(future, job, output_dir, results, journal, lock))
+
+                except Exception as e:
+                    print(f"  ❌ Error: {e}")
+                    with lock:
+                        results['errors'] += 1
+
+        results['jobs'].sort(key=lambda job: job['file'])
 
         # Generate summary
         print(f"\n{'='*80}")
@@ -198,14 +237,12 @@ class JobProcessor:
         print(f"⏭️  Duplicates: {results['duplicates']}")
         print(f"❌ Errors: {results['errors']}")
 
+        if not dry_run:
+            write_report(summary_file, [json.dumps(results, indent=2, ensure_ascii=False)])
+
         if not dry_run and results['processed'] > 0:
+            self.deduplicator.save()
             print(f"\n📁 Saved to: {output_dir}")
-
-            # Save summary JSON
-            summary_file = output_dir / 'PROCESSING-SUMMARY.json'
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False)
-
             print(f"📄 Summary saved: {summary_file}")
 
             # Print next steps
@@ -216,6 +253,130 @@ class JobProcessor:
 
         return results
 
+    def _check_job(self, job_file: Path, job_data: Dict, output_dir: Path) -> Dict:
+        """Deduplicate one parsed job; returns its journal entry (status 'duplicate' or 'processed')."""
+        # Check for duplicates
+        existing = self.deduplicator.is_duplicate(
+            job_data['company'],
+            job_data['title']
+        )
+
+        if existing:
+            print(f"  ⏭️  Duplicate: Already tracked in {existing.name}")
+            return {
+                'file': job_file.name,
+                'company': job_data['company'],
+                'title': job_data['title'],
+                'status': 'duplicate',
+                'existing_folder': str(existing)
+            }
+
+        # Same description under another title or from another board
+        near = self.deduplicator.is_near_duplicate(job_data['content'])
+
+        if near:
+            existing, score = near
+            print(f"  ⏭️  Near-duplicate ({score:.0%} similar): Already tracked in {existing.name}")
+            return {
+                'file': job_file.name,
+                'company': job_data['company'],
+                'title': job_data['title'],
+                'status': 'duplicate',
+                'existing_folder': str(existing),
+                'similarity': round(score, 2)
+            }
+
+        # Create folder name
+        folder_name = self._create_folder_name(
+            job_data['company'],
+            job_data['title']
+        )
+
+        self.deduplicator.add(job_data['company'], job_data['title'],
+                              output_dir / folder_name, job_data['content'])
+
+        return {
+            'file': job_file.name,
+            'company': job_data['company'],
+            'title': job_data['title'],
+            'location': job_data.get('location', 'Unknown'),
+            'url': job_data.get('url', ''),
+            'status': 'processed',
+            'folder': folder_name
+        }
+
+    def _copy_done(self, future, job: Dict, output_dir: Path, results: Dict, journal, lock: threading.Lock):
+        """
+        Journal a finished copy (runs in the thread that completed it).
+
+        A failed copy is forgotten by the deduplicator and its partial folder
+        removed, so the next run retries the file instead of matching it
+        against its own empty folder.
+        """
+        job_folder = output_dir / job['folder']
+        error = future.exception()
+        with lock:
+            if error is not None:
+                print(f"  ❌ Error saving {job['file']}: {error}")
+                results['errors'] += 1
+                self.deduplicator.remove(job['company'], job_folder)
+                shutil.rmtree(job_folder, ignore_errors=True)
+                return
+            print(f"  ✅ Saved to: {job['folder']}/")
+            self._record(results, job, journal)
+
+    @staticmethod
+    def _save_job(job_file: Path, job_folder: Path):
+        """Copy the job description into its folder (runs in the thread pool)."""
+        job_folder.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(job_file, job_folder / 'job-description.md')
+
+    @staticmethod
+    def _record(results: Dict, job: Dict, journal=None):
+        """Count a finished job in the summary and append it to the journal."""
+        results['processed' if job['status'] == 'processed' else 'duplicates'] += 1
+        results['jobs'].append(job)
+        if journal is not None:
+            journal.write(json.dumps(job, ensure_ascii=False) + "\n")
+            journal.flush()
+
+    def _load_journal(self, journal_file: Path, output_dir: Path) -> List[Dict]:
+        """
+        Jobs finished by an earlier run of this batch.
+
+        Processed jobs whose copy is missing are not finished. Finished jobs
+        are re-added to the deduplicator so repeats of them are still caught.
+        A line cut short by an interruption is skipped; a file journaled
+        twice keeps its last record.
+        """
+        try:
+            lines = journal_file.read_text(encoding='utf-8').splitlines()
+        except FileNotFoundError:
+            return []
+        except OSError as e:
+            print(f"Ignoring unreadable {journal_file.name}: {e}")
+            return []
+
+        journaled = {}
+        for line in lines:
+            try:
+                job = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(job, dict) and 'file' in job:
+                journaled[job['file']] = job
+
+        finished = []
+        for job in journaled.values():
+            if job['status'] == 'processed':
+                saved = output_dir / job['folder'] / 'job-description.md'
+                if not saved.exists():
+                    continue
+                content = saved.read_text(encoding='utf-8', errors='ignore')
+                self.deduplicator.add(job['company'], job['title'], output_dir / job['folder'], content)
+            finished.append(job)
+        return finished
+
     def _parse_job_file(self, file_path: Path) -> Optional[Dict]:
         """Parse job markdown file and extract metadata."""
         try:
@@ -282,6 +443,11 @@ def main():
         action='store_true',
         help='Show what would happen without actually processing'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Threads for parsing and copying files (default: automatic)'
+    )
 
     args = parser.parse_args()
 
@@ -301,7 +467,7 @@ def main():
 
     # Process jobs
     processor = JobProcessor(project_root)
-    results = processor.process_batch(input_dir, dry_run=args.dry_run)
+    results = processor.process_batch(input_dir, dry_run=args.dry_run, workers=args.workers)
 
     # Exit code
     if results['errors'] > 0:
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Scored-results cache for bulk job analysis
+
+bulk_analyze records every scored job (company, title, fit score, reasons,
+concerns, description) and every file that could not be extracted, keyed by:
+- the resolved path of the .mhtml file
+- the SHA-256 of its contents
+- the scoring key (a fingerprint of the preferences and scoring rules)
+
+Later runs of bulk_analyze and organize_staging reuse the stored result
+instead of extracting and scoring the file again. Each entry also remembers
+the file's size and mtime, so unchanged files are recognised without being
+re-hashed; a touched file is hashed and only re-analyzed if its content
+changed.
+
+Changing the preferences changes the scoring key. Entries scored under the
+old key are kept as previous results: their extracted job info is still
+valid for unchanged files, so bulk_analyze re-scores them in one batch
+(batch_scoring.py) instead of extracting the files again.
+
+Storage: JSON file in the staging folder (default staging/.fit-scores.json)
+    {"version": N, "scoring_key": "...", "entries": {"<path>": {"sha256": ..., "result": {...}}}}
+
+Usage:
+    from score_cache import ScoreCache
+    cache = ScoreCache.load(staging_path / SCORE_CACHE_NAME, scoring_key())
+    result = cache.get(filepath)
+    if result is None:
+        result = analyze_job_file(filepath)
+        cache.put(filepath, result)
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+
+CACHE_VERSION = 1
+SCORE_CACHE_NAME = '.fit-scores.json'
+
+# Result fields that are stored; 'filepath' is rebuilt from the entry path
+CACHED_FIELDS = ('filename', 'company', 'job_title', 'fit_score', 'reasons', 'concerns', 'description')
+CACHED_ERROR_FIELDS = ('filename', 'error')
+
+
+def content_hash(path) -> str:
+    """SHA-256 of file contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ScoreCache:
+    """Fit-score results keyed by file path and content hash"""
+
+    def __init__(self, cache_path: Path, scoring_key: str):
+        self.cache_path = Path(cache_path)
+        self.scoring_key = scoring_key
+        self.entries: Dict[str, Dict] = {}
+        # Entries scored under a different scoring key (job info still valid)
+        self.previous: Dict[str, Dict] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, cache_path: Path, scoring_key: str) -> 'ScoreCache':
+        """Load a cache from disk (missing, corrupt or outdated files give an empty cache)"""
+        cache = cls(cache_path, scoring_key)
+        if not cache.cache_path.exists():
+            return cache
+
+        try:
+            data = json.loads(cache.cache_path.read_text(encoding='utf-8'))
+            if data.get('version') != CACHE_VERSION:
+                cache.dirty = True
+            elif data.get('scoring_key') == scoring_key:
+                cache.entries = dict(data['entries'])
+            else:
+                cache.previous = dict(data['entries'])
+                cache.dirty = True
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"⚠️ Ignoring unreadable score cache {cache.cache_path}: {e}")
+            cache.entries = {}
+            cache.previous = {}
+
+        return cache
+
+    @staticmethod
+    def _entry_name(filepath) -> str:
+        return Path(filepath).resolve().as_posix()
+
+    def get(self, filepath) -> Optional[dict]:
+        """Stored result if the file is unchanged since it was scored"""
+        return self._lookup(self.entries, filepath)
+
+    def get_previous(self, filepath) -> Optional[dict]:
+        """Result scored under the previous scoring key, if the file is unchanged
+
+        The job info (company, title, description) can be re-scored; error
+        results are returned as they were stored.
+        """
+        return self._lookup(self.previous, filepath)
+
+    def _lookup(self, entries: Dict[str, Dict], filepath) -> Optional[dict]:
+        entry = entries.get(self._entry_name(filepath))
+        if not entry:
+            return None
+
+        try:
+            stat = os.stat(filepath)
+            if (stat.st_size, stat.st_mtime_ns) != (entry['size'], entry['mtime_ns']):
+                if stat.st_size != entry['size'] or content_hash(filepath) != entry['sha256']:
+                    return None
+                # Touched but identical: remember the new mtime
+                entry['mtime_ns'] = stat.st_mtime_ns
+                self.dirty = True
+            result = dict(entry['result'])
+        except (OSError, KeyError, TypeError):
+            return None
+
+        result['filepath'] = Path(filepath)
+        return result
+
+    def put(self, filepath, result: dict):
+        """Record a freshly scored job, or the error it could not be scored with"""
+        fields = CACHED_ERROR_FIELDS if 'error' in result else CACHED_FIELDS
+        try:
+            stat = os.stat(filepath)
+            sha256 = content_hash(filepath)
+        except OSError:
+            return
+        self.entries[self._entry_name(filepath)] = {
+            'sha256': sha256,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'result': {field: result[field] for field in fields},
+        }
+        self.dirty = True
+
+    def carry_over(self, filepath, result: dict):
+        """Store a re-scored previous result under the current key (no re-hash)"""
+        name = self._entry_name(filepath)
+        entry = self.previous.pop(name)
+        fields = CACHED_ERROR_FIELDS if 'error' in result else CACHED_FIELDS
+        self.entries[name] = dict(entry, result={field: result[field] for field in fields})
+        self.dirty = True
+
+    def prune(self) -> int:
+        """Drop entries whose file no longer exists (e.g. moved to a tier folder)"""
+        stale = [name for name in self.entries if not Path(name).exists()]
+        for name in stale:
+            del self.entries[name]
+        if stale:
+            self.dirty = True
+        return len(stale)
+
+    def save(self):
+        """Write the cache atomically (no-op if nothing changed)"""
+        self.prune()
+        if not self.dirty:
+            return
+        data = {'version': CACHE_VERSION, 'scoring_key': self.scoring_key, 'entries': self.entries}
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, prefix='.tmp-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.dirty = False
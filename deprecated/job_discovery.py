@@ -23,6 +23,10 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from playwright.sync_api import sync_playwright, Page, Browser
 
+# Shared modules (dedup_index, ...) live in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+from dedup_index import DedupIndex
+
 # Fix Windows console encoding for emojis
 if sys.platform == 'win32':
     try:
@@ -527,30 +531,8 @@ class JobDeduplicator:
             applications_dir: Path to applications/ folder
         """
         self.applications_dir = applications_dir
-        self.existing_jobs = self._load_existing_jobs()
-
-    def _load_existing_jobs(self) -> List[Dict[str, str]]:
-        """Load all existing applications."""
-        existing = []
-
-        if not self.applications_dir.exists():
-            return existing
-
-        for app_folder in self.applications_dir.iterdir():
-            if app_folder.is_dir():
-                # Extract company and role from folder name
-                # Format: YYYY-MM-CompanyName-RoleTitle
-                parts = app_folder.name.split('-', 3)
-                if len(parts) >= 4:
-                    company = parts[2]
-                    role = parts[3]
-                    existing.append({
-                        'company': company.lower(),
-                        'role': role.lower(),
-                        'folder': app_folder.name
-                    })
-
-        return existing
+        # Built once: company key -> title tokens (see scripts/dedup_index.py)
+        self.index = DedupIndex.build(applications_dir)
 
     def is_duplicate(self, company: str, title: str) -> Optional[str]:
         """
@@ -563,19 +545,8 @@ class JobDeduplicator:
         Returns:
             Existing folder name if duplicate, None otherwise
         """
-        company_clean = company.lower().replace(' ', '')
-        title_clean = title.lower().replace(' ', '')
-
-        for existing in self.existing_jobs:
-            existing_company = existing['company'].replace(' ', '')
-            existing_role = existing['role'].replace(' ', '')
-
-            # Check for close match (allows for slight variations)
-            if (existing_company in company_clean or company_clean in existing_company):
-                if (existing_role in title_clean or title_clean in existing_role):
-                    return existing['folder']
-
-        return None
+        existing = self.index.find(company, title)
+        return Path(existing).name if existing else None
 
 
 def sanitize_filename(text: str) -> str:
@@ -661,24 +632,29 @@ def main():
     print("🤖 LinkedIn Job Discovery Automation")
     print("=" * 80)
 
-    # Define searches (TODO: Load from career-preferences.md in --auto mode)
+    # Define searches
     searches = []
 
     if args.auto:
-        # TODO: Parse career-preferences.md for keywords and locations
-        print("\n⚠️ --auto mode not yet implemented, using defaults")
-        searches = [
-            {
-                'keywords': 'Director Product Data Platform',
-                'location': 'London, United Kingdom',
-                'experience_level': ['director']
-            },
-            {
-                'keywords': 'Head of Product Growth',
-                'location': 'London, United Kingdom',
-                'experience_level': ['director']
-            }
-        ]
+        # Ideal role titles from career-preferences.md (see scripts/career_profile.py)
+        from career_profile import load_profile
+        searches = [query.to_dict() for query in load_profile(project_root / 'career-preferences.md').searches]
+        if searches:
+            print(f"\n📋 Loaded {len(searches)} searches from career-preferences.md")
+        else:
+            print("\n⚠️ No role titles in career-preferences.md, using defaults")
+            searches = [
+                {
+                    'keywords': 'Director Product Data Platform',
+                    'location': 'London, United Kingdom',
+                    'experience_level': ['director']
+                },
+                {
+                    'keywords': 'Head of Product Growth',
+                    'location': 'London, United Kingdom',
+                    'experience_level': ['director']
+                }
+            ]
     elif args.keywords and args.location:
         searches = [{
             'keywords': args.keywords,
@@ -26,31 +26,41 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from job_discovery import LinkedInJobSearcher, JobDeduplicator, save_to_staging
 
+# Shared modules (career_profile, ...) live in scripts/
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+from career_profile import load_profile
+
+
+# Used when career-preferences.md lists no role titles
+DEFAULT_SEARCHES = [
+    {
+        'keywords': 'Director Product Data Platform',
+        'location': 'London, United Kingdom',
+        'experience_level': ['director']
+    },
+    {
+        'keywords': 'Head of Product Growth',
+        'location': 'London, United Kingdom',
+        'experience_level': ['director']
+    },
+    {
+        'keywords': 'VP Product',
+        'location': 'Remote, United Kingdom',
+        'experience_level': ['executive', 'director']
+    }
+]
+
 
 def load_search_criteria(preferences_file: Path) -> List[Dict]:
     """
     Load search criteria from career-preferences.md.
 
-    For now, returns hardcoded searches. TODO: Parse from file.
+    One search per title listed under Ideal Role Types, in the first primary
+    location (see scripts/career_profile.py). Falls back to DEFAULT_SEARCHES
+    when the file lists no titles.
     """
-    # TODO: Parse career-preferences.md
-    return [
-        {
-            'keywords': 'Director Product Data Platform',
-            'location': 'London, United Kingdom',
-            'experience_level': ['director']
-        },
-        {
-            'keywords': 'Head of Product Growth',
-            'location': 'London, United Kingdom',
-            'experience_level': ['director']
-        },
-        {
-            'keywords': 'VP Product',
-            'location': 'Remote, United Kingdom',
-            'experience_level': ['executive', 'director']
-        }
-    ]
+    searches = [query.to_dict() for query in load_profile(preferences_file).searches]
+    return searches or [dict(search) for search in DEFAULT_SEARCHES]
 
 
 def send_email_notification(
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Persistent application index for incremental sync
+
+Caches the parsed status.md record of every application folder together with
+a fingerprint (mtime, size, content hash) of its status.md, analysis.md and
+job-description.md. On the next run only folders whose files changed are
+re-read and re-parsed; everything else is served from the index.
+
+Storage: compact JSON-lines file (default insights/.application-index.jsonl)
+- Line 1:  {"version": N}
+- Line 2+: one entry per application folder (paths relative to applications/)
+
+Usage:
+    from application_index import ApplicationIndex
+    index = ApplicationIndex.load(index_path, applications_path)
+    records = index.refresh(status_files)
+    index.save()
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from status_parser import StatusRecord, parse_status_file
+
+
+INDEX_VERSION = 1
+TRACKED_FILES = ('status.md', 'analysis.md', 'job-description.md')
+
+ANALYSIS_FIT_RE = re.compile(r'Fit Score:\s*([\d.]+)/10')
+
+
+def file_hash(path: Path) -> str:
+    """SHA-1 of file contents"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parse_analysis_fit_score(analysis_file: Path) -> Optional[float]:
+    """Extract fit score from analysis.md (None if missing)"""
+    try:
+        content = analysis_file.read_text(encoding='utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+    match = ANALYSIS_FIT_RE.search(content)
+    if not match:
+        return None
+    try:
+        return float(match.group(1))
+    except ValueError:
+        return None
+
+
+class ApplicationIndex:
+    """mtime/size/hash keyed cache of parsed application folders"""
+
+    def __init__(self, index_path: Path, applications_path: Path):
+        self.index_path = index_path
+        self.applications_path = applications_path
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+
+        # Files modified at or after the index was written may have changed
+        # without a visible mtime change ("racy" entries) and are always re-hashed
+        self.racy_cutoff_ns = 0
+
+        # Statistics for the last refresh()
+        self.reparsed = 0
+        self.reused = 0
+
+    @classmethod
+    def load(cls, index_path: Path, applications_path: Path) -> 'ApplicationIndex':
+        """Load an index from disk (missing, corrupt or outdated files give an empty index)"""
+        index = cls(index_path, applications_path)
+        if not index_path.exists():
+            return index
+
+        try:
+            index.racy_cutoff_ns = index_path.stat().st_mtime_ns
+            with open(index_path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or '{}')
+                if header.get('version') != INDEX_VERSION:
+                    return index
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        index.entries[entry['folder']] = entry
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable application index {index_path}: {e}")
+            index.entries = {}
+            index.racy_cutoff_ns = 0
+
+        return index
+
+    def _fingerprint(self, folder: Path, cached: Dict) -> Dict:
+        """Stat tracked files; hash only those whose mtime/size changed"""
+        fingerprint = {}
+        for name in TRACKED_FILES:
+            path = folder / name
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+
+            previous = cached.get(name)
+            if (previous and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size
+                    and stat.st_mtime_ns < self.racy_cutoff_ns):
+                fingerprint[name] = previous
+            else:
+                fingerprint[name] = [stat.st_mtime_ns, stat.st_size, file_hash(path)]
+        return fingerprint
+
+    def _is_current(self, entry: Optional[Dict], fingerprint: Dict) -> bool:
+        if entry is None:
+            return False
+        cached = entry['files']
+        if cached.keys() != fingerprint.keys():
+            return False
+        # Content hashes decide: touching a file without changing it is not a change
+        return all(cached[name][2] == fingerprint[name][2] for name in fingerprint)
+
+    def get(self, status_file: Path) -> Optional[Dict]:
+        """Index entry for an application folder (None if not indexed)"""
+        return self.entries.get(self._key(status_file.parent))
+
+    def _key(self, folder: Path) -> str:
+        try:
+            return folder.relative_to(self.applications_path).as_posix()
+        except ValueError:
+            return folder.as_posix()
+
+    def refresh_one(self, status_file: Path) -> StatusRecord:
+        """Return the record for one status.md, reparsing only if its folder changed"""
+        folder = status_file.parent
+        key = self._key(folder)
+        entry = self.entries.get(key)
+        fingerprint = self._fingerprint(folder, entry['files'] if entry else {})
+
+        if self._is_current(entry, fingerprint):
+            self.reused += 1
+            if entry['files'] != fingerprint:
+                entry['files'] = fingerprint
+                self.dirty = True
+            record_data = dict(entry['record'], path=str(status_file))
+            return StatusRecord.from_dict(record_data)
+
+        record = parse_status_file(status_file)
+        record_data = record.to_dict()
+        record_data['path'] = 'status.md'
+        self.entries[key] = {
+            'folder': key,
+            'files': fingerprint,
+            'record': record_data,
+            'analysis_fit_score': parse_analysis_fit_score(folder / 'analysis.md'),
+        }
+        self.reparsed += 1
+        self.dirty = True
+        return record
+
+    def refresh(self, status_files: Iterable[Path]) -> List[StatusRecord]:
+        """
+        Bring the index up to date with the given status.md files.
+
+        Folders no longer present are dropped. Unparseable files are reported
+        and skipped.
+        """
+        self.reparsed = 0
+        self.reused = 0
+
+        records = []
+        seen = set()
+        for status_file in status_files:
+            seen.add(self._key(status_file.parent))
+            try:
+                records.append(self.refresh_one(status_file))
+            except Exception as e:
+                print(f"Error parsing {status_file}: {e}")
+
+        stale = set(self.entries) - seen
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+
+        return records
+
+    def discard(self, status_file: Path):
+        """Forget an application folder (e.g. after it was moved or deleted)"""
+        if self.entries.pop(self._key(status_file.parent), None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """Write the index atomically (no-op if nothing changed)"""
+        if not self.dirty:
+            return
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'version': INDEX_VERSION}) + '\n')
+            for key in sorted(self.entries):
+                f.write(json.dumps(self.entries[key], ensure_ascii=False, separators=(',', ':')) + '\n')
+        os.replace(tmp_path, self.index_path)
+        self.racy_cutoff_ns = self.index_path.stat().st_mtime_ns
+        self.dirty = False
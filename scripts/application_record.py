@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Compact application model shared by the dashboards and analytics
+
+sync-status.py used to turn every parsed status.md into a fresh 17-key dict,
+and each consumer re-parsed the date strings it needed. ApplicationRecord
+holds the same fields in __slots__ (no per-instance dict), with:
+- status interned: known statuses are Status enum members (plain strings
+  for comparisons, formatting and dict keys), others sys.intern()-ed, so
+  every record shares one object per status
+- dates parsed once at construction into datetime.date attributes
+  (analyzed_on, applied_on, rejected_on, withdrawn_on, updated_on, None
+  when unknown); the original text fields are kept for display
+
+Records also support the dict-style access the report sections use
+(app['company'], app.get('location', 'N/A')), so sections work with records
+and with plain dicts alike.
+
+Usage:
+    from application_record import ApplicationRecord, Status
+    app = ApplicationRecord.from_status_record(parse_status_file(path))
+    if app.status == Status.APPLIED and app.applied_on:
+        days_waiting = (date.today() - app.applied_on).days
+"""
+
+import sys
+from enum import Enum
+from typing import Dict, Optional
+
+from status_parser import StatusRecord, parse_date
+
+
+class Status(str, Enum):
+    """Statuses written to status.md (lowercased)"""
+    ANALYZING = 'analyzing'
+    ANALYSIS = 'analysis'
+    ANALYSIS_PHASE = 'analysis phase'
+    ANALYZED = 'analyzed'
+    DRAFTING = 'drafting'
+    APPLIED = 'applied'
+    SUBMITTED = 'submitted'
+    INTERVIEWING = 'interviewing'
+    INTERVIEW_SCHEDULED = 'interview scheduled'
+    INTERVIEW_INVITED = 'interview invited'
+    OFFER = 'offer'
+    ACCEPTED = 'accepted'
+    REJECTED = 'rejected'
+    WITHDRAWN = 'withdrawn'
+    UNKNOWN = 'unknown'
+
+    # Behave exactly like the status string (Enum hashes and formats by name)
+    __str__ = str.__str__
+    __format__ = str.__format__
+    __hash__ = str.__hash__
+
+
+STATUSES = {status.value: status for status in Status}
+
+
+def intern_status(status: Optional[str]) -> str:
+    """The Status member for a known status (any case), otherwise the interned lowercase string"""
+    if not status:
+        return Status.UNKNOWN
+    status = status.lower()
+    return STATUSES.get(status) or sys.intern(status)
+
+
+# Application fields (the keys of the former application dict)
+FIELDS = ('file_path', 'folder_name', 'status', 'fit_score', 'last_updated', 'analyzed_date',
+          'company', 'role', 'location', 'days_waiting', 'cv_generated', 'cover_letter_generated',
+          'applied_date', 'interview_dates', 'rejected_date', 'withdrawn_date', 'outcome')
+
+# Text field -> parsed date attribute
+DATE_FIELDS = {
+    'analyzed_date': 'analyzed_on',
+    'applied_date': 'applied_on',
+    'rejected_date': 'rejected_on',
+    'withdrawn_date': 'withdrawn_on',
+    'last_updated': 'updated_on',
+}
+KEYS = frozenset(FIELDS) | frozenset(DATE_FIELDS.values())
+
+
+class ApplicationRecord:
+    """One application as the dashboards see it (timeline events applied)"""
+
+    __slots__ = FIELDS + tuple(DATE_FIELDS.values())
+
+    def __init__(self, file_path: str, folder_name: str, status: Optional[str], fit_score: Optional[float] = None,
+                 last_updated: Optional[str] = None, analyzed_date: Optional[str] = None,
+                 company: Optional[str] = None, role: Optional[str] = None, location: Optional[str] = None,
+                 days_waiting: int = 0, cv_generated: bool = False, cover_letter_generated: bool = False,
+                 applied_date: Optional[str] = None, interview_dates=(), rejected_date: Optional[str] = None,
+                 withdrawn_date: Optional[str] = None, outcome: Optional[str] = None):
+        self.file_path = file_path
+        self.folder_name = folder_name
+        self.status = intern_status(status)
+        self.fit_score = fit_score
+        self.last_updated = last_updated
+        self.analyzed_date = analyzed_date
+        self.company = company
+        self.role = role
+        self.location = location
+        self.days_waiting = days_waiting
+        self.cv_generated = cv_generated
+        self.cover_letter_generated = cover_letter_generated
+        self.applied_date = applied_date
+        self.interview_dates = list(interview_dates)
+        self.rejected_date = rejected_date
+        self.withdrawn_date = withdrawn_date
+        self.outcome = outcome
+
+        for text_field, date_field in DATE_FIELDS.items():
+            setattr(self, date_field, parse_date(getattr(self, text_field)))
+
+    @classmethod
+    def from_status_record(cls, record: StatusRecord) -> 'ApplicationRecord':
+        """Application from a parsed status.md (terminal timeline events override the status)"""
+        status = record.status
+        applied = record.first_event('Applied')
+        withdrawn = record.first_event('Withdrawn')
+        rejected = record.first_event('Rejected')
+        if withdrawn:
+            status = 'withdrawn'
+        if rejected:
+            status = 'rejected'
+
+        return cls(
+            file_path=str(record.path),
+            folder_name=record.folder_name,
+            status=status,
+            fit_score=record.fit_score,
+            last_updated=record.last_updated,
+            analyzed_date=record.analyzed_on,
+            company=record.company,
+            role=record.role,
+            location=record.location,
+            cv_generated=record.cv_generated,
+            cover_letter_generated=record.cover_letter_generated,
+            applied_date=applied.when if applied else None,
+            interview_dates=[event.date or event.when for event in record.events_starting_with('Interview ')],
+            rejected_date=rejected.when if rejected else None,
+            withdrawn_date=withdrawn.when if withdrawn else None,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ApplicationRecord':
+        return cls(**{key: data[key] for key in FIELDS if key in data})
+
+    def to_dict(self) -> Dict:
+        return {key: getattr(self, key) for key in FIELDS}
+
+    # --- Mapping-style access (sections written against application dicts) ---
+
+    def __getitem__(self, key: str):
+        if key not in KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in KEYS
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in KEYS else default
+
+    def __repr__(self) -> str:
+        return f"ApplicationRecord({self.folder_name!r}, status={str(self.status)!r}, fit_score={self.fit_score!r})"
+
+
+def application_date(app, field: str):
+    """Date of a text field (e.g. 'applied_date') of a record (parsed at load) or an application dict"""
+    if isinstance(app, ApplicationRecord):
+        return getattr(app, DATE_FIELDS[field])
+    return parse_date(app.get(field))
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Columnar snapshot of the parsed application set
+
+sync-status.py exports every application it parsed into one column per
+field instead of a list of dicts:
+- status: categorical int16 codes plus a category list
+- fit score: float64 (NaN when unknown)
+- dates (analyzed, applied, rejected, withdrawn, last updated): int64 days
+  since 1970-01-01 (MISSING_DAY when unknown)
+- applied / rejected / withdrawn flags: the event is recorded, even when its
+  date text has no parseable YYYY-MM-DD (these are what the counts use)
+- interview count and CV / cover letter flags
+- folder, company, role: fixed-width strings
+
+Aggregates are then computed column by column (counts over the status
+codes, sums over the fit array, comparisons over the date arrays) rather
+than field lookups per dict, so queries over the full history stay fast.
+
+Storage: NumPy .npz (default insights/applications-snapshot.npz): a zip
+with one .npy file per column, written and read with the standard library
+into array.array columns. numpy.load() reads the same file if numpy is
+installed. Zip entries carry a fixed timestamp, so the same applications
+always give the same bytes and an unchanged snapshot is not rewritten.
+
+Usage:
+    from application_snapshot import ApplicationSnapshot, snapshot_metrics
+    snapshot = ApplicationSnapshot.from_applications(applications)
+    snapshot.save(Path("insights/applications-snapshot.npz"))
+
+    snapshot = ApplicationSnapshot.load(Path("insights/applications-snapshot.npz"))
+    snapshot_metrics(snapshot)                     # same numbers as sync-status calculate_metrics
+    snapshot.count_by_status()                     # {'applied': 12, 'rejected': 30, ...}
+    snapshot.select(snapshot.days_since('applied_day', 14))  # rows applied 14+ days ago
+"""
+
+import ast
+import io
+import math
+import os
+import struct
+import sys
+import tempfile
+import zipfile
+from array import array
+from collections import Counter
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from application_record import application_date
+from status_parser import parse_date
+
+
+SNAPSHOT_VERSION = 2
+SNAPSHOT_PATH = Path('insights') / 'applications-snapshot.npz'
+
+# int64 "no date" marker (numpy's NaT)
+MISSING_DAY = -2 ** 63
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Column name -> (source field in the application dict, array typecode, .npy dtype)
+DATE_COLUMNS = {
+    'analyzed_day': 'analyzed_date',
+    'applied_day': 'applied_date',
+    'rejected_day': 'rejected_date',
+    'withdrawn_day': 'withdrawn_date',
+    'last_updated_day': 'last_updated',
+}
+STRING_COLUMNS = ('folder_name', 'company', 'role')
+# Flag column -> text field: set when the field is filled in, whether or not it parses as a date
+STAGE_COLUMNS = {
+    'applied': 'applied_date',
+    'rejected': 'rejected_date',
+    'withdrawn': 'withdrawn_date',
+}
+
+# array typecode -> .npy dtype (little-endian)
+NPY_DTYPES = {'d': '<f8', 'q': '<i8', 'h': '<i2', 'i': '<i4', 'b': '|i1'}
+NPY_MAGIC = b'\x93NUMPY\x01\x00'
+# Timestamp of every zip entry (the earliest zip allows), so saves are byte-for-byte reproducible
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+def date_to_day(value: Optional[date]) -> int:
+    """Days since 1970-01-01, MISSING_DAY for None"""
+    return MISSING_DAY if value is None else value.toordinal() - EPOCH_ORDINAL
+
+
+def to_day(text: Optional[str]) -> int:
+    """Days since 1970-01-01 of the first YYYY-MM-DD in text, MISSING_DAY if none"""
+    return date_to_day(parse_date(text))
+
+
+def from_day(day: int) -> Optional[date]:
+    return None if day == MISSING_DAY else date.fromordinal(day + EPOCH_ORDINAL)
+
+
+# === .npy encoding ===
+
+def _npy_header(descr: str, length: int) -> bytes:
+    header = f"{{'descr': '{descr}', 'fortran_order': False, 'shape': ({length},), }}"
+    # Magic + version + 2-byte length + header + newline, padded to a multiple of 64
+    padding = -(len(NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header = (header + ' ' * padding + '\n').encode('latin1')
+    return NPY_MAGIC + struct.pack('<H', len(header)) + header
+
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def encode_array(values: array) -> bytes:
+    """.npy file for a numeric array.array"""
+    return _npy_header(NPY_DTYPES[values.typecode], len(values)) + _little_endian(values)
+
+
+def encode_strings(values: List[str]) -> bytes:
+    """.npy file of fixed-width unicode strings (<U)"""
+    width = max((len(value) for value in values), default=1) or 1
+    body = b''.join(value.ljust(width, '\0').encode('utf-32-le') for value in values)
+    return _npy_header(f'<U{width}', len(values)) + body
+
+
+def _write_npy(npz: zipfile.ZipFile, name: str, data: bytes):
+    """Add one .npy entry with a fixed timestamp and mode"""
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    npz.writestr(info, data)
+
+
+def decode_npy(data: bytes):
+    """array.array (numeric) or list of str from a .npy file written by encode_*"""
+    if not data.startswith(NPY_MAGIC):
+        raise ValueError("not a version 1.0 .npy file")
+    header_length = struct.unpack('<H', data[8:10])[0]
+    header = ast.literal_eval(data[10:10 + header_length].decode('latin1'))
+    body = data[10 + header_length:]
+    descr, (length,) = header['descr'], header['shape']
+
+    if descr.startswith('<U'):
+        width = int(descr[2:])
+        return [body[i * width * 4:(i + 1) * width * 4].decode('utf-32-le').rstrip('\0') for i in range(length)]
+
+    typecode = {dtype: code for code, dtype in NPY_DTYPES.items()}[descr]
+    values = array(typecode)
+    values.frombytes(body[:length * values.itemsize])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+# === Snapshot ===
+
+class ApplicationSnapshot:
+    """Parsed applications as columns (array.array per numeric field)"""
+
+    def __init__(self, columns: Dict, status_categories: List[str]):
+        self.columns = columns
+        self.status_categories = status_categories
+
+    def __len__(self) -> int:
+        return len(self.columns['fit_score'])
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    @classmethod
+    def from_applications(cls, applications: Iterable) -> 'ApplicationSnapshot':
+        """Materialize the ApplicationRecords built by sync-status.py (or application dicts)"""
+        applications = list(applications)
+        status_categories = sorted({app['status'] for app in applications})
+        code = {status: i for i, status in enumerate(status_categories)}
+
+        columns = {
+            'status': array('h', (code[app['status']] for app in applications)),
+            'fit_score': array('d', (app['fit_score'] if app['fit_score'] else math.nan
+                                     for app in applications)),
+            'interview_count': array('i', (len(app['interview_dates']) for app in applications)),
+            'cv_generated': array('b', (bool(app['cv_generated']) for app in applications)),
+            'cover_letter_generated': array('b', (bool(app['cover_letter_generated']) for app in applications)),
+        }
+        for column, field in DATE_COLUMNS.items():
+            columns[column] = array('q', (date_to_day(application_date(app, field)) for app in applications))
+        for column, field in STAGE_COLUMNS.items():
+            columns[column] = array('b', (bool(app[field]) for app in applications))
+        for column in STRING_COLUMNS:
+            columns[column] = [app[column] or '' for app in applications]
+        return cls(columns, status_categories)
+
+    def save(self, path: Path) -> bool:
+        """
+        Write the .npz atomically
+
+        Returns True if the file was written, False if it already held
+        these exact bytes and was left alone.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as npz:
+            _write_npy(npz, 'version.npy', encode_array(array('i', [SNAPSHOT_VERSION])))
+            _write_npy(npz, 'status_categories.npy', encode_strings(self.status_categories))
+            for name, values in self.columns.items():
+                data = encode_strings(values) if isinstance(values, list) else encode_array(values)
+                _write_npy(npz, f'{name}.npy', data)
+        content = buffer.getvalue()
+
+        try:
+            if path.read_bytes() == content:
+                return False
+        except OSError:
+            pass
+
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with open(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return True
+
+    @classmethod
+    def load(cls, path: Path) -> 'ApplicationSnapshot':
+        """Read a snapshot written by save() (ValueError if it is from another version)"""
+        with zipfile.ZipFile(path) as npz:
+            arrays = {name[:-4]: decode_npy(npz.read(name)) for name in npz.namelist() if name.endswith('.npy')}
+        if list(arrays.pop('version', [])) != [SNAPSHOT_VERSION]:
+            raise ValueError(f"{path}: unsupported snapshot version")
+        status_categories = arrays.pop('status_categories')
+        return cls(arrays, status_categories)
+
+    # --- Column queries ---
+
+    def status_mask(self, *statuses: str) -> List[bool]:
+        """Row mask: status is one of statuses"""
+        wanted = {i for i, status in enumerate(self.status_categories) if status in statuses}
+        return [code in wanted for code in self.columns['status']]
+
+    def has_date(self, column: str) -> List[bool]:
+        return [day != MISSING_DAY for day in self.columns[column]]
+
+    def days_since(self, column: str, days: int, today: Optional[date] = None) -> List[bool]:
+        """Row mask: the date column is at least `days` days before today"""
+        cutoff = ((today or date.today()).toordinal() - EPOCH_ORDINAL) - days
+        return [day != MISSING_DAY and day <= cutoff for day in self.columns[column]]
+
+    def select(self, mask: Iterable[bool], column: str = 'folder_name') -> List:
+        """Values of one column for the rows set in mask"""
+        return [value for value, keep in zip(self.columns[column], mask) if keep]
+
+    def count_by_status(self) -> Dict[str, int]:
+        counts = Counter(self.columns['status'])
+        return {self.status_categories[code]: count for code, count in sorted(counts.items())}
+
+    def fit_scores(self) -> List[float]:
+        """Known fit scores (NaN dropped)"""
+        return [score for score in self.columns['fit_score'] if score == score]
+
+
+def snapshot_metrics(snapshot: ApplicationSnapshot) -> Dict:
+    """sync-status calculate_metrics, computed from the columns"""
+    fit_scores = snapshot.fit_scores()
+    by_fit_score = Counter(f"{int(score)}-{int(score) + 0.9}" for score in fit_scores)
+    analysis_codes = {i for i, status in enumerate(snapshot.status_categories) if 'analysis' in status}
+
+    return {
+        'total': len(snapshot),
+        'by_status': snapshot.count_by_status(),
+        'by_fit_score': dict(by_fit_score),
+        'avg_fit_score': round(sum(fit_scores) / len(fit_scores), 2) if fit_scores else 0,
+        'high_priority_count': sum(score >= 8 for score in fit_scores),
+        'cv_generated_count': sum(snapshot['cv_generated']),
+        'cover_letter_count': sum(snapshot['cover_letter_generated']),
+        'applied_count': sum(snapshot['applied']),
+        'interview_count': sum(count > 0 for count in snapshot['interview_count']),
+        'rejected_count': sum(snapshot['rejected']),
+        'withdrawn_count': sum(snapshot['withdrawn']),
+        'analysis_phase_count': sum(code in analysis_codes for code in snapshot['status']),
+    }
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Per-quarter summary manifests for the application archive
+
+Archived applications live in archive/<YYYY-Qn>/<outcome>/<folder>/ (see
+migrate-to-status-folders.py). Each quarter folder gets a manifest
+(archive/<YYYY-Qn>/.quarter-manifest.json) holding what historical reports
+need from its applications:
+- one row per application: folder, company, role, status, fit score,
+  applied/response dates and days to response
+- precomputed counts by status, a fit-score histogram (whole points) and
+  response-time totals
+
+Readers aggregate years of archive from a handful of manifests instead of
+parsing every status.md. A manifest is rebuilt when its quarter changes:
+its signature holds the names and mtimes of the quarter's outcome folders
+(rejected/, withdrawn/...), which change whenever an application is
+archived, moved or removed. Archived status.md files are final; after
+editing one by hand, rebuild with --rebuild.
+
+Usage:
+    from archive_manifest import load_archive, combine
+    manifests = load_archive(Path("applications/archive"))
+    totals = combine(manifests)        # counts, histogram, response times
+    rows = [row for m in manifests for row in m['applications']]
+
+    python scripts/archive_manifest.py [--rebuild]
+"""
+
+import argparse
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from application_index import parse_analysis_fit_score
+from report_writer import write_report
+from status_parser import StatusRecord, extract_date, parse_date, parse_status_file
+
+
+MANIFEST_VERSION = 1
+MANIFEST_NAME = '.quarter-manifest.json'
+QUARTER_RE = re.compile(r'^\d{4}-Q[1-4]$')
+ARCHIVE_PATH = Path('applications') / 'archive'
+
+
+def response_dates(record: StatusRecord) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+    """(applied date, first response date, days to response) from a status record"""
+    applied_date = extract_date(record.applied_on)
+
+    # First response: interview invitation or rejection
+    response_event = record.first_event('Interview-Invited', 'Rejected')
+    response_date = response_event.date if response_event else None
+
+    time_to_response = None
+    applied_day, response_day = parse_date(applied_date), parse_date(response_date)
+    if applied_day and response_day:
+        time_to_response = (response_day - applied_day).days
+
+    return applied_date, response_date, time_to_response
+
+
+def quarter_folders(archive_path: Path) -> List[Path]:
+    """archive/<YYYY-Qn> folders, oldest first"""
+    try:
+        entries = list(os.scandir(archive_path))
+    except OSError:
+        return []
+    return sorted(Path(entry.path) for entry in entries if entry.is_dir() and QUARTER_RE.match(entry.name))
+
+
+def _outcome_folders(quarter_path: Path) -> List[Path]:
+    return sorted(Path(entry.path) for entry in os.scandir(quarter_path)
+                  if entry.is_dir() and not entry.name.startswith(('.', '_')))
+
+
+def quarter_signature(quarter_path: Path) -> Dict[str, int]:
+    """Outcome folder name -> mtime_ns (the quarter folder itself holds the manifest)"""
+    return {folder.name: os.stat(folder).st_mtime_ns for folder in _outcome_folders(quarter_path)}
+
+
+def application_row(folder: Path) -> Optional[Dict]:
+    """Manifest row for one archived application (None without a readable status.md)"""
+    try:
+        record = parse_status_file(folder / 'status.md')
+    except Exception:
+        return None
+
+    applied_date, response_date, time_to_response = response_dates(record)
+    fit_score = parse_analysis_fit_score(folder / 'analysis.md')
+    return {
+        'folder': folder.name,
+        'outcome': folder.parent.name,
+        'company': record.company,
+        'role': record.role,
+        'status': record.status if record.current_status else None,
+        'fit_score': fit_score if fit_score is not None else record.fit_score,
+        'applied_date': applied_date,
+        'response_date': response_date,
+        'time_to_response': time_to_response,
+    }
+
+
+def summarize(rows: List[Dict]) -> Dict:
+    """Counts, fit histogram and response-time totals of manifest rows"""
+    fit_scores = [row['fit_score'] for row in rows if row['fit_score'] is not None]
+    response_days = [row['time_to_response'] for row in rows if row['time_to_response'] is not None]
+    return {
+        'count': len(rows),
+        'by_status': dict(Counter(row['status'] or 'unknown' for row in rows)),
+        'fit_histogram': {str(score): count for score, count in
+                          sorted(Counter(int(fit) for fit in fit_scores).items())},
+        'fit_total': round(sum(fit_scores), 2),
+        'fit_count': len(fit_scores),
+        'response_days_total': sum(response_days),
+        'response_count': len(response_days),
+    }
+
+
+def build_manifest(quarter_path: Path) -> Dict:
+    """Parse every application of a quarter into its manifest"""
+    signature = quarter_signature(quarter_path)
+    rows = []
+    for outcome in _outcome_folders(quarter_path):
+        for entry in sorted(os.scandir(outcome), key=lambda entry: entry.name):
+            if entry.is_dir():
+                row = application_row(Path(entry.path))
+                if row is not None:
+                    rows.append(row)
+
+    return {
+        'version': MANIFEST_VERSION,
+        'quarter': quarter_path.name,
+        'signature': signature,
+        'summary': summarize(rows),
+        'applications': rows,
+    }
+
+
+def load_manifest(quarter_path: Path, rebuild: bool = False) -> Dict:
+    """The quarter's manifest, rebuilt and saved if missing or out of date"""
+    manifest_path = quarter_path / MANIFEST_NAME
+    if not rebuild and manifest_path.exists():
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+            if (manifest.get('version') == MANIFEST_VERSION
+                    and manifest.get('signature') == quarter_signature(quarter_path)):
+                return manifest
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable manifest {manifest_path}: {e}")
+
+    manifest = build_manifest(quarter_path)
+    write_report(manifest_path, [json.dumps(manifest, indent=2, ensure_ascii=False), "\n"])
+    return manifest
+
+
+def load_archive(archive_path: Path = ARCHIVE_PATH, rebuild: bool = False) -> List[Dict]:
+    """Manifests of every archive quarter, oldest first"""
+    return [load_manifest(quarter, rebuild) for quarter in quarter_folders(archive_path)]
+
+
+def combine(manifests: List[Dict]) -> Dict:
+    """Add up the summaries of several quarters"""
+    total = {'count': 0, 'by_status': Counter(), 'fit_histogram': Counter(), 'fit_total': 0.0,
+             'fit_count': 0, 'response_days_total': 0, 'response_count': 0}
+    for manifest in manifests:
+        summary = manifest['summary']
+        for key in ('count', 'fit_total', 'fit_count', 'response_days_total', 'response_count'):
+            total[key] += summary[key]
+        total['by_status'].update(summary['by_status'])
+        total['fit_histogram'].update(summary['fit_histogram'])
+
+    total['by_status'] = dict(total['by_status'])
+    total['fit_histogram'] = dict(sorted(total['fit_histogram'].items(), key=lambda item: int(item[0])))
+    total['fit_total'] = round(total['fit_total'], 2)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and show per-quarter archive manifests')
+    parser.add_argument('archive', nargs='?', default=str(ARCHIVE_PATH),
+                        help=f'Archive folder (default: {ARCHIVE_PATH})')
+    parser.add_argument('--rebuild', action='store_true', help='Re-parse every quarter')
+    args = parser.parse_args()
+
+    manifests = load_archive(Path(args.archive), rebuild=args.rebuild)
+    for manifest in manifests + ([{'quarter': 'Total', 'summary': combine(manifests)}] if manifests else []):
+        summary = manifest['summary']
+        avg_fit = summary['fit_total'] / summary['fit_count'] if summary['fit_count'] else 0
+        avg_days = summary['response_days_total'] / summary['response_count'] if summary['response_count'] else 0
+        print(f"{manifest['quarter']:>8}: {summary['count']:4} archived, "
+              f"avg fit {avg_fit:.1f}, avg {avg_days:.1f} days to response")
+    if not manifests:
+        print(f"No archive quarters in {args.archive}")
+
+
+if __name__ == '__main__':
+    main()
@@ -14,11 +14,13 @@ Output: insights/application-quality-audit-YYYY-MM-DD.md
 
 from pathlib import Path
 from datetime import datetime
-import subprocess
 import re
 from typing import List, Dict
 import sys
 
+from pdf_metadata import get_pdf_info
+from report_writer import write_report
+
 
 class ApplicationAuditor:
     def __init__(self, applications_path: Path = Path("applications")):
@@ -28,38 +30,22 @@ class ApplicationAuditor:
         self.successes = []
 
     def get_pdf_info(self, pdf_path: Path) -> Dict:
-        """Extract PDF metadata using pdfinfo command"""
-        try:
-            result = subprocess.run(
-                ['pdfinfo', str(pdf_path)],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            info = {}
-            for line in result.stdout.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    info[key.strip()] = value.strip()
-
-            # Extract specific fields
-            pages_match = re.search(r'Pages:\s*(\d+)', result.stdout)
-            size_match = re.search(r'Page size:\s*([\d.]+)\s*x\s*([\d.]+)\s*pts', result.stdout)
-
-            return {
-                'pages': int(pages_match.group(1)) if pages_match else None,
-                'width': float(size_match.group(1)) if size_match else None,
-                'height': float(size_match.group(2)) if size_match else None,
-            }
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # pdfinfo not available, fall back to file size only
+        """Extract PDF metadata (in-process reader, pdfinfo as fallback)"""
+        info = get_pdf_info(pdf_path)
+        if info is None:
+            # Metadata unavailable, fall back to file size only
             return {
                 'pages': None,
                 'width': None,
                 'height': None,
             }
 
+        return {
+            'pages': info.pages,
+            'width': info.width,
+            'height': info.height,
+        }
+
     def check_cv_format(self, cv_path: Path, company: str):
         """Validate CV format requirements"""
         if not cv_path.exists():
@@ -375,8 +361,10 @@ cd applications/[Company]/
         filename = f"application-quality-audit-{datetime.now().strftime('%Y-%m-%d')}.md"
         output_path = insights_path / filename
 
-        output_path.write_text(report, encoding='utf-8')
-        print(f"📄 Report saved to: {output_path}")
+        if write_report(output_path, [report]):
+            print(f"📄 Report saved to: {output_path}")
+        else:
+            print(f"📄 Report unchanged: {output_path}")
 
         return output_path
 
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+career-preferences.md compiler
+
+Parses career-preferences.md (see career-preferences.template.md) into a
+typed ScoringProfile used by the scoring and filtering tools:
+
+- Geographic Preferences
+    ### Primary Locations       -> locations_high_priority (+ search location)
+    ### Open to Relocation      -> locations_medium_priority (incl. nested cities)
+    ### Not Open to Relocation  -> locations_reject (incl. "(US, Canada, etc.)")
+- Role Preferences / ### Ideal Role Types -> searches (one per listed title)
+- Industry Preferences
+    **Tier 1 ...**              -> keywords_high_value
+    **Tier 2 ...**              -> keywords_medium_value
+    ### Industries to Avoid     -> industries_avoid
+- Seniority Level
+    ### Target Levels           -> seniority_target
+    ### Avoid                   -> role_reject_keywords
+- Role Preferences / **Avoid:** items -> role_reject_keywords
+
+Every industry keyword also gets a weight in keyword_weights (the points
+it adds to a fit score): TIER_WEIGHTS by tier, Tier 1 winning when a term
+is listed in both.
+
+List items contribute their bold text (or the text before " - "), split on
+",", "/" and "&". Template placeholders ("[City, Country]") are skipped, and
+any field the file leaves empty keeps its DEFAULT_PREFERENCES value.
+
+The compiled profile is cached as JSON (insights/.career-profile.json) and
+recompiled only when career-preferences.md's mtime or size changes, so tools
+load it without re-parsing markdown.
+
+Usage:
+    from career_profile import load_profile
+    profile = load_profile()
+    profile.preferences()['locations_high_priority']
+    [query.to_dict() for query in profile.searches]
+
+    python scripts/career_profile.py          # show the compiled profile
+"""
+
+import argparse
+import json
+import re
+from copy import copy
+from dataclasses import asdict, dataclass, field, fields
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from report_writer import write_report
+
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+CAREER_PREFERENCES_PATH = BASE_PATH / "career-preferences.md"
+PROFILE_CACHE_PATH = BASE_PATH / "insights" / ".career-profile.json"
+PROFILE_VERSION = 2
+
+# Used for every field career-preferences.md does not fill in
+DEFAULT_PREFERENCES = {
+    'locations_high_priority': ['london', 'remote uk', 'uk', 'united kingdom'],
+    'locations_medium_priority': ['amsterdam', 'dublin', 'berlin', 'cologne', 'eu', 'europe', 'singapore', 'dubai', 'manila', 'seoul', 'bangkok'],
+    'locations_reject': ['saudi arabia', 'vietnam', 'united states', 'san francisco'],
+    'keywords_high_value': [
+        'data platform', 'cdp', 'customer data platform', 'martech', 'adtech',
+        'growth', 'experimentation', 'a/b testing', 'marketplace', 'two-sided platform',
+        'travel', 'hospitality', 'hotels', 'airline'
+    ],
+    'keywords_medium_value': [
+        'product management', 'product manager', 'product lead', 'director',
+        'ai product', 'ml product', 'platform', 'payments', 'fintech'
+    ],
+    'seniority_target': ['director', 'head of', 'vp', 'vice president', 'lead', 'principal'],
+    'role_reject_keywords': ['engineer', 'engineering manager', 'software engineer', 'b2b only'],
+    'industries_avoid': [],
+}
+
+# Fit-score points per matched keyword of each tier
+TIER_WEIGHTS = {'keywords_high_value': 1.5, 'keywords_medium_value': 0.5}
+
+
+def tier_weights(preferences: Dict) -> Dict[str, float]:
+    """Keyword -> weight of the highest tier listing it"""
+    weights: Dict[str, float] = {}
+    for tier, weight in TIER_WEIGHTS.items():
+        for keyword in preferences[tier]:
+            weights.setdefault(keyword, weight)
+    return weights
+
+
+DEFAULT_PREFERENCES['keyword_weights'] = tier_weights(DEFAULT_PREFERENCES)
+
+DEFAULT_SEARCH_LOCATION = 'London, United Kingdom'
+
+# LinkedIn experience filters implied by the target seniority levels
+EXPERIENCE_LEVELS = {
+    'director': ('director', 'head', 'principal', 'lead'),
+    'executive': ('vp', 'vice president', 'chief', 'cpo'),
+}
+
+HEADING_RE = re.compile(r'^(#{2,3})\s+(.+?)\s*$')
+ITEM_RE = re.compile(r'^\s*(?:[-*+]|\d+\.)\s+(.*)$')
+GROUP_RE = re.compile(r'^\*\*(.+?)\*\*')
+BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+PARENS_RE = re.compile(r'\(([^)]*)\)')
+BASED_RE = re.compile(r'\(([\w ]+)-based\)', re.IGNORECASE)
+NUMBERING_RE = re.compile(r'^\d+\.\s*')
+SPLIT_RE = re.compile(r'\s*(?:,|/|&|\bor\b)\s*')
+MARKER_RE = re.compile(r'^(?:[✅❌⚠️📚⭐🔥️]\s*)+')
+AVOID_ITEM_RE = re.compile(r'^\*\*Avoid:?\*\*:?\s*(.*)$', re.IGNORECASE)
+IGNORED_TERMS = {'', 'etc', 'etc.'}
+
+
+@dataclass
+class SearchQuery:
+    """One job-board search (job_discovery's search dict)"""
+    keywords: str
+    location: str
+    experience_level: Optional[List[str]] = None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _default(name: str):
+    return field(default_factory=lambda: copy(DEFAULT_PREFERENCES[name]))
+
+
+@dataclass
+class ScoringProfile:
+    """Compiled career preferences"""
+    locations_high_priority: List[str] = _default('locations_high_priority')
+    locations_medium_priority: List[str] = _default('locations_medium_priority')
+    locations_reject: List[str] = _default('locations_reject')
+    keywords_high_value: List[str] = _default('keywords_high_value')
+    keywords_medium_value: List[str] = _default('keywords_medium_value')
+    seniority_target: List[str] = _default('seniority_target')
+    role_reject_keywords: List[str] = _default('role_reject_keywords')
+    industries_avoid: List[str] = _default('industries_avoid')
+    keyword_weights: Dict[str, float] = _default('keyword_weights')
+    searches: List[SearchQuery] = field(default_factory=list)
+    source: Optional[str] = None
+
+    def preferences(self) -> Dict:
+        """Scoring vocabulary and keyword weights in bulk_analyze's PREFERENCES shape"""
+        return {name: copy(getattr(self, name)) for name in DEFAULT_PREFERENCES}
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ScoringProfile':
+        data = dict(data)
+        data['searches'] = [SearchQuery(**query) for query in data.get('searches', [])]
+        return cls(**data)
+
+
+def _item_terms(text: str, keep_parenthetical: bool = False) -> List[str]:
+    """Lowercase terms named by one list item"""
+    text = MARKER_RE.sub('', text.strip())
+    bold = BOLD_RE.match(text)
+    if bold:
+        main, rest = bold.group(1), text[bold.end():]
+    else:
+        main, rest = text.partition(' - ')[0], ''
+    if '[' in main:
+        return []
+
+    # "Remote (UK-based)" -> "remote uk"
+    main = BASED_RE.sub(lambda m: m.group(1), main)
+    parts = [PARENS_RE.sub('', main)]
+    if keep_parenthetical:
+        parts.extend(PARENS_RE.findall(main))
+        # "(Spain, Italy, etc.) - Exception: ..." lists more of the same
+        rest = rest.split('Exception')[0]
+        parts.extend(PARENS_RE.findall(rest))
+
+    terms = []
+    for part in parts:
+        for term in SPLIT_RE.split(part.lower()):
+            term = term.strip(' .:')
+            if term not in IGNORED_TERMS and not term.startswith('other ') and term not in terms:
+                terms.append(term)
+    return terms
+
+
+def _target(section: str, subsection: str, group: str, numbered: bool) -> Optional[str]:
+    """Profile field fed by list items under these headings"""
+    if 'geographic' in section:
+        if 'primary' in subsection:
+            return 'locations_high_priority'
+        if 'not open' in subsection:
+            return 'locations_reject'
+        if 'open to' in subsection:
+            return 'locations_medium_priority'
+    elif 'industry' in section:
+        if 'avoid' in subsection:
+            return 'industries_avoid'
+        if group.startswith('tier 1'):
+            return 'keywords_high_value'
+        if group.startswith('tier 2'):
+            return 'keywords_medium_value'
+    elif 'seniority' in section:
+        if 'target' in subsection:
+            return 'seniority_target'
+        if 'avoid' in subsection:
+            return 'role_reject_keywords'
+    elif 'role preferences' in section:
+        if 'ideal role' in subsection and numbered:
+            return 'searches'
+    return None
+
+
+def _experience_levels(seniority: List[str]) -> Optional[List[str]]:
+    levels = [level for level, titles in EXPERIENCE_LEVELS.items()
+              if any(title in term for term in seniority for title in titles)]
+    return levels or None
+
+
+def compile_profile(content: str, source: Optional[str] = None) -> ScoringProfile:
+    """Parse career-preferences.md content in one pass over its lines"""
+    found: Dict[str, List[str]] = {}
+    role_titles: List[str] = []
+    search_location = None
+    section = subsection = group = ''
+    numbered = False
+
+    for line in content.splitlines():
+        heading = HEADING_RE.match(line)
+        if heading:
+            if len(heading.group(1)) == 2:
+                section, subsection = heading.group(2).lower(), ''
+            else:
+                subsection = heading.group(2).lower()
+            group, numbered = '', False
+            continue
+
+        group_match = GROUP_RE.match(line)
+        if group_match:
+            numbered = bool(NUMBERING_RE.match(group_match.group(1)))
+            group = NUMBERING_RE.sub('', group_match.group(1)).lower()
+            continue
+
+        item = ITEM_RE.match(line)
+        if not item:
+            continue
+        text = item.group(1)
+        target = _target(section, subsection, group, numbered)
+
+        # "- ⚠️ **Avoid:** Engineering management, B2B-only roles" lists role types after the label
+        avoid = AVOID_ITEM_RE.match(MARKER_RE.sub('', text.strip()))
+        if avoid and 'role preferences' in section:
+            target, text = 'role_reject_keywords', avoid.group(1)
+        if target is None:
+            continue
+
+        if target == 'searches':
+            title = MARKER_RE.sub('', text).strip()
+            if '[' not in title:
+                role_titles.append(title.replace('**', ''))
+            continue
+
+        terms = _item_terms(text, keep_parenthetical=(target == 'locations_reject'))
+        known = found.setdefault(target, [])
+        known.extend(term for term in terms if term not in known)
+
+        if target == 'locations_high_priority' and search_location is None and terms:
+            bold = BOLD_RE.search(text)
+            search_location = PARENS_RE.sub('', bold.group(1) if bold else text).strip()
+
+    profile = ScoringProfile(source=source)
+    for name, terms in found.items():
+        if terms:
+            setattr(profile, name, terms)
+    profile.keyword_weights = tier_weights(profile.preferences())
+
+    location = search_location or DEFAULT_SEARCH_LOCATION
+    experience = _experience_levels(profile.seniority_target)
+    profile.searches = [SearchQuery(title, location, experience) for title in role_titles]
+    return profile
+
+
+def _signature(path: Path) -> Dict:
+    stat = path.stat()
+    return {'source': path.resolve().as_posix(), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def load_profile(preferences_path: Path = CAREER_PREFERENCES_PATH,
+                 cache_path: Path = PROFILE_CACHE_PATH) -> ScoringProfile:
+    """
+    Compiled profile for career-preferences.md
+
+    Served from the cache while the file's mtime and size are unchanged;
+    recompiled (and the cache rewritten) otherwise. Without a
+    career-preferences.md the defaults are returned.
+    """
+    preferences_path = Path(preferences_path)
+    try:
+        signature = _signature(preferences_path)
+    except OSError:
+        return ScoringProfile()
+
+    cache_path = Path(cache_path)
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+        if data.get('version') == PROFILE_VERSION and data.get('signature') == signature:
+            return ScoringProfile.from_dict(data['profile'])
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        print(f"Ignoring unreadable profile cache {cache_path}: {e}")
+
+    profile = compile_profile(preferences_path.read_text(encoding='utf-8'), signature['source'])
+    data = {'version': PROFILE_VERSION, 'signature': signature, 'profile': profile.to_dict()}
+    try:
+        write_report(cache_path, [json.dumps(data, indent=2, ensure_ascii=False), "\n"])
+    except OSError as e:
+        print(f"Could not write profile cache {cache_path}: {e}")
+    return profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile career-preferences.md into a scoring profile')
+    parser.add_argument('preferences', nargs='?', type=Path, default=CAREER_PREFERENCES_PATH,
+                        help='Preferences file (default: career-preferences.md)')
+    parser.add_argument('--json', action='store_true', help='Print the profile as JSON')
+    args = parser.parse_args()
+
+    if not args.preferences.exists():
+        print(f"⚠️ {args.preferences} not found - tools use the default profile")
+    profile = load_profile(args.preferences)
+
+    if args.json:
+        print(json.dumps(profile.to_dict(), indent=2, ensure_ascii=False))
+        return
+
+    for item in fields(ScoringProfile):
+        value = getattr(profile, item.name)
+        if item.name == 'searches':
+            print(f"searches ({len(value)}):")
+            for query in value:
+                print(f"  - {query.keywords} in {query.location} {query.experience_level or ''}")
+        elif item.name == 'keyword_weights':
+            print(f"{item.name}: {', '.join(f'{term}={weight:g}' for term, weight in value.items()) or '-'}")
+        elif item.name != 'source':
+            print(f"{item.name}: {', '.join(value) or '-'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Dashboard sections for STATUS.md and insights/metrics-dashboard.md
+
+Every section takes (applications, metrics) - the application dicts and the
+aggregate metrics built by sync-status.py - and yields markdown chunks.
+Sections are registered in SECTIONS and can be combined into other reports.
+
+Sections declare the application fields and metrics keys they read, so a
+report_writer.SectionCache only re-renders the ones a change affects; the
+headers (current time) and recent_activity (days ago) always re-render.
+
+Aggregates precomputed by metrics_engine.py (conversion rates, fit
+distribution, recent activity, top 10) are read from metrics when present;
+with a partial metrics dict the sections compute them from applications.
+
+Usage:
+    from dashboard_sections import SECTIONS, STATUS_REPORT
+    from report_writer import render_report, write_report
+
+    write_report(path, render_report(SECTIONS, STATUS_REPORT, applications, metrics))
+"""
+
+import heapq
+from collections import defaultdict
+from datetime import date, datetime
+
+from application_record import application_date
+from report_writer import SectionRegistry
+
+
+SECTIONS = SectionRegistry()
+
+# Section order of the generated dashboards
+STATUS_REPORT = ('status_header', 'quick_stats', 'applications_by_status', 'high_priority')
+METRICS_REPORT = ('metrics_header', 'summary_kpis', 'conversion_funnel', 'fit_distribution',
+                  'status_counts', 'recent_activity', 'top_10', 'archive_history')
+
+
+def format_fit(app):
+    return f"{app['fit_score']}/10" if app['fit_score'] else "N/A"
+
+
+def percentage(part, whole):
+    return round(part / whole * 100, 1) if whole > 0 else 0
+
+
+# === STATUS.md ===
+
+@SECTIONS.section('status_header')
+def status_header(applications, metrics):
+    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    yield "# Application Status Dashboard\n\n"
+    yield f"**Last Updated:** {now}\n"
+    yield f"**Total Applications:** {metrics['total']}\n"
+
+
+@SECTIONS.section('quick_stats', uses=(), metrics=(
+    'total', 'analysis_phase_count', 'applied_count', 'interview_count', 'rejected_count',
+    'withdrawn_count', 'high_priority_count', 'avg_fit_score'))
+def quick_stats(applications, metrics):
+    yield f"""## Quick Stats
+
+| Metric | Count |
+|--------|-------|
+| **Total Applications** | {metrics['total']} |
+| **Analysis Phase** | {metrics['analysis_phase_count']} |
+| **Applied** | {metrics['applied_count']} |
+| **In Interview Process** | {metrics['interview_count']} |
+| **Rejected** | {metrics['rejected_count']} |
+| **Withdrawn** | {metrics['withdrawn_count']} |
+| **High Priority (8+ fit)** | {metrics['high_priority_count']} |
+| **Average Fit Score** | {metrics['avg_fit_score']}/10 |
+"""
+
+
+@SECTIONS.section('applications_by_status', uses=(
+    'status', 'company', 'role', 'fit_score', 'analyzed_date', 'location',
+    'applied_date', 'withdrawn_date', 'rejected_date'))
+def applications_by_status(applications, metrics):
+    yield "## Applications by Status\n"
+
+    # Group by status
+    apps_by_status = defaultdict(list)
+    for app in applications:
+        apps_by_status[app['status']].append(app)
+
+    # Analysis Phase
+    if apps_by_status['analysis phase']:
+        yield f"\n### Analysis Phase ({len(apps_by_status['analysis phase'])})\n\n"
+        for app in sorted(apps_by_status['analysis phase'], key=lambda x: x.get('fit_score', 0), reverse=True):
+            yield f"- **{app['company']} - {app['role']}** (Fit: {format_fit(app)})\n"
+            yield f"  - Analyzed: {app['analyzed_date']}\n"
+            if app['location']:
+                yield f"  - Location: {app['location']}\n"
+
+    # Applied / Withdrawn / Rejected, with the date of that event
+    for status, title, date_key in (('applied', 'Applied', 'applied_date'),
+                                    ('withdrawn', 'Withdrawn', 'withdrawn_date'),
+                                    ('rejected', 'Rejected', 'rejected_date')):
+        if not apps_by_status.get(status):
+            continue
+        yield f"\n### {title} ({len(apps_by_status[status])})\n\n"
+        for app in apps_by_status[status]:
+            yield f"- **{app['company']} - {app['role']}** (Fit: {format_fit(app)})\n"
+            if app[date_key]:
+                yield f"  - {title}: {app[date_key]}\n"
+
+
+@SECTIONS.section('high_priority', uses=(
+    'fit_score', 'company', 'role', 'status', 'location', 'analyzed_date',
+    'cv_generated', 'cover_letter_generated'))
+def high_priority(applications, metrics):
+    yield "## High Priority Applications (8+ Fit)\n\n"
+
+    apps = [app for app in applications if app.get('fit_score') and app['fit_score'] >= 8]
+    apps.sort(key=lambda x: x.get('fit_score') or 0, reverse=True)
+
+    if not apps:
+        yield "*No high-priority applications currently.*\n\n"
+        return
+
+    for app in apps:
+        yield f"### {app['company']} - {app['role']} ({app['fit_score']}/10)\n\n"
+        yield f"- **Status:** {app['status'].title()}\n"
+        yield f"- **Location:** {app.get('location', 'N/A')}\n"
+        yield f"- **Analyzed:** {app.get('analyzed_date', 'N/A')}\n"
+        yield f"- **CV Generated:** {'Yes' if app['cv_generated'] else 'No'}\n"
+        yield f"- **Cover Letter:** {'Yes' if app['cover_letter_generated'] else 'No'}\n"
+        yield "\n"
+
+
+# === metrics-dashboard.md ===
+
+@SECTIONS.section('metrics_header')
+def metrics_header(applications, metrics):
+    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+    yield "# Job Application Metrics Dashboard\n\n"
+    yield f"**Generated:** {now}\n"
+    yield f"**Data Source:** {metrics['total']} application folders in `applications/*/status.md`\n"
+
+
+@SECTIONS.section('summary_kpis', uses=('fit_score',), metrics=(
+    'total', 'avg_fit_score', 'scored_count', 'high_priority_count', 'analysis_phase_count',
+    'applied_count', 'interview_count', 'rejected_count', 'withdrawn_count'))
+def summary_kpis(applications, metrics):
+    scored = metrics.get('scored_count')
+    if scored is None:
+        scored = sum(1 for a in applications if a['fit_score'])
+    yield f"""## Summary KPIs
+
+| KPI | Value | Notes |
+|-----|-------|-------|
+| **Total Applications Tracked** | {metrics['total']} | All applications in system |
+| **Average Fit Score** | {metrics['avg_fit_score']}/10 | Based on {scored} scored applications |
+| **High Priority (8+ fit)** | {metrics['high_priority_count']} | Applications worth pursuing |
+| **Analysis Phase** | {metrics['analysis_phase_count']} | Analyzed but not yet applied |
+| **Applied** | {metrics['applied_count']} | Submitted applications |
+| **In Interview Process** | {metrics['interview_count']} | Active interview pipelines |
+| **Rejected** | {metrics['rejected_count']} | Explicit rejections |
+| **Withdrawn** | {metrics['withdrawn_count']} | Self-withdrawn after analysis |
+"""
+
+
+@SECTIONS.section('conversion_funnel', uses=(), metrics=(
+    'total', 'high_priority_count', 'cv_generated_count', 'applied_count', 'interview_count', 'conversion'))
+def conversion_funnel(applications, metrics):
+    conversion = metrics.get('conversion') or {
+        'analysis_to_high_priority': percentage(metrics['high_priority_count'], metrics['total']),
+        'high_priority_to_applied': percentage(metrics['applied_count'], metrics['high_priority_count']),
+        'applied_to_interview': percentage(metrics['interview_count'], metrics['applied_count']),
+    }
+    yield f"""## Conversion Funnel
+
+```
+Applications Analyzed ({metrics['total']})
+    ↓
+High Priority 8+ fit ({metrics['high_priority_count']})
+    ↓
+CVs Generated ({metrics['cv_generated_count']})
+    ↓
+Applications Submitted ({metrics['applied_count']})
+    ↓
+Interviews ({metrics['interview_count']})
+```
+
+**Conversion Rates:**
+- Analysis → High Priority: {conversion['analysis_to_high_priority']}%
+- High Priority → Applied: {conversion['high_priority_to_applied']}%
+- Applied → Interview: {conversion['applied_to_interview']}%
+"""
+
+
+@SECTIONS.section('fit_distribution', uses=('fit_score',), metrics=('fit_distribution',))
+def fit_distribution(applications, metrics):
+    yield "## Applications by Fit Score\n\n"
+
+    distribution = metrics.get('fit_distribution')
+    if distribution is None:
+        distribution = defaultdict(int)
+        for app in applications:
+            if app['fit_score']:
+                distribution[int(app['fit_score'])] += 1
+
+    yield "| Score Range | Count | Bar |\n"
+    yield "|-------------|-------|-----|\n"
+    for score in sorted(distribution.keys(), reverse=True):
+        bar = "█" * distribution[score]
+        yield f"| {score}-{score}.9 | {distribution[score]} | {bar} |\n"
+
+
+@SECTIONS.section('status_counts', uses=(), metrics=('by_status',))
+def status_counts(applications, metrics):
+    yield "## Applications by Status\n\n"
+    yield "| Status | Count |\n"
+    yield "|--------|-------|\n"
+    for status, count in sorted(metrics['by_status'].items(), key=lambda x: x[1], reverse=True):
+        yield f"| {status.title()} | {count} |\n"
+
+
+@SECTIONS.section('recent_activity')
+def recent_activity(applications, metrics):
+    yield "## Recent Activity (Last 7 Days)\n\n"
+
+    recent = metrics.get('recent_activity')
+    if recent is None:
+        # Find recent applications (analyzed in last 7 days)
+        recent = []
+        today = date.today()
+        for app in applications:
+            analyzed = application_date(app, 'analyzed_date')
+            if analyzed is not None and (today - analyzed).days <= 7:
+                recent.append((app, (today - analyzed).days))
+        recent.sort(key=lambda x: x[1])
+
+    if not recent:
+        yield "*No activity in last 7 days.*\n"
+        return
+
+    for app, days_ago in recent:
+        yield f"- **{app['company']} - {app['role']}** (Fit: {format_fit(app)}) - {days_ago} days ago\n"
+
+
+@SECTIONS.section('top_10', uses=('fit_score', 'company', 'role', 'status', 'location'),
+                  metrics=('top_10',))
+def top_10(applications, metrics):
+    yield "## Top 10 Applications by Fit Score\n\n"
+
+    top_apps = metrics.get('top_10')
+    if top_apps is None:
+        top_apps = heapq.nlargest(10, (a for a in applications if a['fit_score']), key=lambda x: x['fit_score'])
+
+    yield "| Rank | Company | Role | Fit | Status | Location |\n"
+    yield "|------|---------|------|-----|--------|----------|\n"
+    for i, app in enumerate(top_apps, 1):
+        yield f"| {i} | {app['company']} | {app['role']} | {app['fit_score']}/10 | {app['status'].title()} | {app.get('location', 'N/A')} |\n"
+
+
+@SECTIONS.section('archive_history', uses=(), metrics=('archive_quarters',))
+def archive_history(applications, metrics):
+    """Per-quarter archive summary, read from the quarter manifests (archive_manifest.py)"""
+    yield "## Archive by Quarter\n\n"
+
+    quarters = metrics.get('archive_quarters') or []
+    if not quarters:
+        yield "*No archived quarters yet.*\n"
+        return
+
+    yield "| Quarter | Archived | Rejected | Withdrawn | Avg Fit | Avg Days to Response |\n"
+    yield "|---------|----------|----------|-----------|---------|----------------------|\n"
+    for manifest in quarters:
+        summary = manifest['summary']
+        avg_fit = round(summary['fit_total'] / summary['fit_count'], 1) if summary['fit_count'] else "N/A"
+        avg_days = (round(summary['response_days_total'] / summary['response_count'], 1)
+                    if summary['response_count'] else "N/A")
+        yield (f"| {manifest['quarter']} | {summary['count']} | {summary['by_status'].get('rejected', 0)} | "
+               f"{summary['by_status'].get('withdrawn', 0)} | {avg_fit} | {avg_days} |\n")
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Shared deduplication index for incoming jobs
+
+Built once per batch from the application folders
+(YYYY-MM-<Company>-<Role>, at any depth under applications/, so the
+status-folder layout is covered too). Each folder is stored in a hash map
+from a normalized company key to the title token sets of that company's
+applications. Checking a job is then one dictionary lookup plus a few set
+comparisons, instead of a scan over every application folder per job.
+
+Normalization:
+- company_key("Booking.com Ltd") == company_key("BookingcomLtd") == "bookingcom"
+  (lowercase alphanumerics, trailing legal suffixes dropped, also when
+  CamelCase-joined as in folder names)
+- title_tokens("Director, Product - Data") == title_tokens("DirectorProductData")
+  (words, with CamelCase folder names split)
+
+A job duplicates an application of the same company when the first
+TITLE_PREFIX_WORDS words of its title all appear in that application's title,
+or when both titles have the same words apart from TITLE_STOP_WORDS (the
+same role reordered or written as a folder name). A longer title that merely
+contains the application's title ("Senior Product Manager" against
+"ProductManager") is a different role.
+
+Jobs accepted during a batch can be add()-ed, so repeats within the batch
+are caught too. The index can be persisted to JSON; a saved index is reused
+while the modification times of the folders holding applications are
+unchanged (adding, removing or renaming a folder changes them).
+
+Usage:
+    from dedup_index import DedupIndex
+    index = DedupIndex.load(Path("applications"), Path("insights/.dedup-index.json"))
+    existing = index.find("Booking.com", "Director of Product")  # folder path or None
+    index.add("Kraken", "Senior Product Manager", "staging/batch/2025-11-Kraken-SeniorProductManager")
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from report_writer import write_report
+
+
+INDEX_VERSION = 2
+
+# Application folders: YYYY-MM-<Company>-<Role...>
+FOLDER_RE = re.compile(r'^\d{4}-\d{2}-([^-]+)-(.+)$')
+CAMEL_RE = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+')
+WORD_RE = re.compile(r'[A-Za-z0-9]+')
+
+LEGAL_SUFFIXES = ('ltd', 'limited', 'inc', 'llc', 'plc', 'gmbh', 'corp', 'bv', 'ag', 'sa')
+
+# Leading title words that must match (process_saved_jobs' original rule)
+TITLE_PREFIX_WORDS = 3
+
+# Title words folder names usually leave out ("Director of Product" -> DirectorProduct)
+TITLE_STOP_WORDS = frozenset({'of', 'and', 'the', 'for', 'in'})
+
+
+def company_key(company: str) -> str:
+    """Lowercase alphanumeric company key without trailing legal suffixes"""
+    # Split CamelCase so a folder's "BookingcomLtd" ends in a separate "ltd"
+    words = [part.lower() for word in WORD_RE.findall(company) for part in CAMEL_RE.findall(word)]
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return ''.join(words)
+
+
+def title_words(title: str) -> List[str]:
+    """Lowercase title words; CamelCase runs are split"""
+    return [part.lower() for word in WORD_RE.findall(title) for part in CAMEL_RE.findall(word)]
+
+
+def title_tokens(title: str) -> FrozenSet[str]:
+    return frozenset(title_words(title))
+
+
+def _mtime_ns(folder) -> int:
+    try:
+        return os.stat(folder).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def parse_folder_name(name: str) -> Optional[Tuple[str, str]]:
+    """(company, role) from an application folder name, None for other folders"""
+    match = FOLDER_RE.match(name)
+    return (match.group(1), match.group(2)) if match else None
+
+
+def application_folders(applications_dir: Path, scanned: Optional[Dict[str, int]] = None) -> Iterator[os.DirEntry]:
+    """
+    Application folders at any depth under applications_dir
+
+    Templates (_*) and hidden folders are skipped; other non-application
+    folders (active/, applied/, archive/...) are walked. If given, `scanned`
+    receives the mtime_ns of every directory walked.
+    """
+    pending = [Path(applications_dir)]
+    while pending:
+        directory = pending.pop()
+        if scanned is not None:
+            scanned[directory.as_posix()] = _mtime_ns(directory)
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.is_dir() or entry.name.startswith(('_', '.')):
+                continue
+            if parse_folder_name(entry.name):
+                yield entry
+            else:
+                pending.append(Path(entry.path))
+
+
+class DedupIndex:
+    """Company key -> title token sets of existing applications"""
+
+    def __init__(self):
+        self._by_company: Dict[str, List[Tuple[FrozenSet[str], str]]] = {}
+        # Folder -> mtime_ns (-1 if missing) of every scanned directory that holds applications
+        self.signature: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_company.values())
+
+    @classmethod
+    def build(cls, applications_dir: Path) -> 'DedupIndex':
+        """Index every application folder under applications_dir (one directory walk)"""
+        index = cls()
+        for entry in application_folders(applications_dir, index.signature):
+            company, role = parse_folder_name(entry.name)
+            index.add(company, role, entry.path)
+        return index
+
+    @classmethod
+    def load(cls, applications_dir: Path, index_path: Optional[Path] = None) -> 'DedupIndex':
+        """Saved index if still current, otherwise a fresh build (saved when index_path is given)"""
+        if index_path and Path(index_path).exists():
+            try:
+                data = json.loads(Path(index_path).read_text(encoding='utf-8'))
+                if data.get('version') == INDEX_VERSION and cls._is_current(data['signature']):
+                    index = cls()
+                    index.signature = data['signature']
+                    for key, entries in data['companies'].items():
+                        index._by_company[key] = [(frozenset(tokens), folder) for tokens, folder in entries]
+                    return index
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Ignoring unreadable dedup index {index_path}: {e}")
+
+        index = cls.build(applications_dir)
+        if index_path:
+            index.save(index_path)
+        return index
+
+    @staticmethod
+    def _is_current(signature: Dict[str, int]) -> bool:
+        return all(_mtime_ns(folder) == mtime for folder, mtime in signature.items())
+
+    def add(self, company: str, title: str, folder) -> None:
+        """Record an application (or a job accepted earlier in this batch)"""
+        self._by_company.setdefault(company_key(company), []).append((title_tokens(title), str(folder)))
+
+    def remove(self, company: str, folder) -> None:
+        """Forget an application added for `folder` (e.g. a batch job whose copy failed)"""
+        key = company_key(company)
+        entries = [entry for entry in self._by_company.get(key, []) if entry[1] != str(folder)]
+        if entries:
+            self._by_company[key] = entries
+        else:
+            self._by_company.pop(key, None)
+
+    def find(self, company: str, title: str) -> Optional[str]:
+        """Folder of an existing application for the same company and role, if any"""
+        entries = self._by_company.get(company_key(company))
+        if not entries:
+            return None
+        words = title_words(title)
+        if not words:
+            return None
+        prefix = set(words[:TITLE_PREFIX_WORDS])
+        content = set(words) - TITLE_STOP_WORDS
+        for existing, folder in entries:
+            if existing and (prefix <= existing or existing - TITLE_STOP_WORDS == content):
+                return folder
+        return None
+
+    def save(self, index_path: Path):
+        """Persist the index (JSON)"""
+        data = {
+            'version': INDEX_VERSION,
+            'signature': self.signature,
+            'companies': {key: [[sorted(tokens), folder] for tokens, folder in entries]
+                          for key, entries in self._by_company.items()},
+        }
+        write_report(index_path, [json.dumps(data), "\n"])
@@ -9,6 +9,12 @@ Analyzes correlation between predicted fit scores and actual outcomes:
 - Time to response by fit tier
 - Provides recommendations for recalibration if needed
 
+Archived applications are read from the per-quarter manifests
+(archive_manifest.py) instead of parsing every archived status.md. Live
+applications are read as ApplicationRecords (application_record.py), so
+statuses are interned and terminal timeline events (Rejected, Withdrawn)
+count as the outcome, as on the dashboards.
+
 Run: python scripts/evaluate_fit_accuracy.py
 Output: insights/fit-score-evaluation-YYYY-MM-DD.md
 """
@@ -20,6 +26,16 @@ from collections import defaultdict
 from typing import Dict, List, Tuple
 import json
 
+from application_record import ApplicationRecord, Status, intern_status
+from status_parser import parse_status_file
+
+
+# Status prefixes per outcome; statuses may carry a note ("rejected (no response)")
+SUCCESS_STATUSES = (Status.OFFER, Status.ACCEPTED, Status.INTERVIEW_INVITED, 'interview completed')
+FAILURE_STATUSES = (Status.REJECTED,)
+from report_writer import write_report
+from archive_manifest import load_archive, response_dates
+
 
 class FitScoreEvaluator:
     def __init__(self, applications_path: Path = Path("applications")):
@@ -49,35 +65,13 @@ class FitScoreEvaluator:
         if not status_file.exists():
             return None
 
-        content = status_file.read_text(encoding='utf-8')
-
-        # Extract current status
-        status_match = re.search(r'\*\*Current Status:\*\*\s*(\w+)', content)
-        current_status = status_match.group(1) if status_match else None
-
-        # Extract applied date
-        applied_match = re.search(r'Applied On:\*\*\s*(\d{4}-\d{2}-\d{2})', content)
-        applied_date = applied_match.group(1) if applied_match else None
+        record = parse_status_file(status_file)
 
-        # Extract response date (interview-invited or rejected)
-        response_match = re.search(
-            r'###\s*(Interview-Invited|Rejected)\s*-\s*(\d{4}-\d{2}-\d{2})',
-            content
-        )
-        response_date = response_match.group(2) if response_match else None
-
-        # Calculate time to response
-        time_to_response = None
-        if applied_date and response_date:
-            try:
-                applied_dt = datetime.strptime(applied_date, '%Y-%m-%d')
-                response_dt = datetime.strptime(response_date, '%Y-%m-%d')
-                time_to_response = (response_dt - applied_dt).days
-            except ValueError:
-                pass
+        application = ApplicationRecord.from_status_record(record)
+        applied_date, response_date, time_to_response = response_dates(record)
 
         return {
-            'current_status': current_status,
+            'current_status': application.status,
             'applied_date': applied_date,
             'response_date': response_date,
             'time_to_response': time_to_response
@@ -94,16 +88,20 @@ class FitScoreEvaluator:
 
     def categorize_outcome(self, status: str) -> str:
         """Categorize outcome as success or failure"""
-        if status in ['offer', 'accepted', 'interview-invited', 'interview-completed']:
+        status = (status or '').replace('-', ' ')
+        if status.startswith(SUCCESS_STATUSES):
             return 'success'
-        elif status in ['rejected']:
+        elif status.startswith(FAILURE_STATUSES):
             return 'failure'
         else:
             return 'pending'
 
     def analyze_applications(self):
         """Analyze all applications and categorize by fit/outcome"""
-        for app_folder in self.applications_path.glob("2025-*"):
+        # Flat (legacy) and active/<status>/ folders are parsed
+        live_folders = list(self.applications_path.glob("2025-*"))
+        live_folders += self.applications_path.glob("active/*/*")
+        for app_folder in live_folders:
             if not app_folder.is_dir():
                 continue
 
@@ -116,41 +114,51 @@ class FitScoreEvaluator:
             if fit_score is None or status_data is None:
                 continue
 
-            current_status = status_data['current_status']
-            time_to_response = status_data['time_to_response']
-
-            # Skip if still in drafting phase
-            if current_status == 'drafting':
-                continue
+            self.add_application(app_folder.name, fit_score, status_data['current_status'],
+                                 status_data['time_to_response'])
+
+        # Archived quarters come precomputed from their manifests
+        for manifest in load_archive(self.applications_path / "archive"):
+            for row in manifest['applications']:
+                if row['fit_score'] is not None:
+                    self.add_application(row['folder'], row['fit_score'], intern_status(row['status']),
+                                         row['time_to_response'])
+
+    def add_application(self, folder_name: str, fit_score: float, current_status: str,
+                        time_to_response: int = None):
+        """Categorize one application by fit tier and outcome"""
+        # Skip if still in drafting phase
+        if current_status == 'drafting':
+            return
+
+        fit_tier = self.categorize_fit_tier(fit_score)
+        outcome = self.categorize_outcome(current_status)
+
+        app_info = {
+            'company': folder_name,
+            'fit_score': fit_score,
+            'status': current_status,
+            'time_to_response': time_to_response
+        }
 
-            fit_tier = self.categorize_fit_tier(fit_score)
-            outcome = self.categorize_outcome(current_status)
-
-            app_info = {
-                'company': app_folder.name,
-                'fit_score': fit_score,
-                'status': current_status,
-                'time_to_response': time_to_response
-            }
-
-            # Categorize
-            if fit_tier == 'high':
-                if outcome == 'success':
-                    self.results['high_fit_accepted'].append(app_info)
-                elif outcome == 'failure':
-                    self.results['high_fit_rejected'].append(app_info)
-            elif fit_tier == 'medium':
-                if outcome == 'success':
-                    self.results['medium_fit_accepted'].append(app_info)
-                elif outcome == 'failure':
-                    self.results['medium_fit_rejected'].append(app_info)
-            else:  # low
-                if current_status != 'withdrawn':
-                    self.results['low_fit_attempted'].append(app_info)
-
-            # Track time to response by fit tier
-            if time_to_response is not None:
-                self.time_to_response[fit_tier].append(time_to_response)
+        # Categorize
+        if fit_tier == 'high':
+            if outcome == 'success':
+                self.results['high_fit_accepted'].append(app_info)
+            elif outcome == 'failure':
+                self.results['high_fit_rejected'].append(app_info)
+        elif fit_tier == 'medium':
+            if outcome == 'success':
+                self.results['medium_fit_accepted'].append(app_info)
+            elif outcome == 'failure':
+                self.results['medium_fit_rejected'].append(app_info)
+        else:  # low
+            if current_status != 'withdrawn':
+                self.results['low_fit_attempted'].append(app_info)
+
+        # Track time to response by fit tier
+        if time_to_response is not None:
+            self.time_to_response[fit_tier].append(time_to_response)
 
     def calculate_metrics(self) -> Dict:
         """Calculate success rates and other metrics"""
@@ -373,8 +381,10 @@ class FitScoreEvaluator:
         filename = f"fit-score-evaluation-{datetime.now().strftime('%Y-%m-%d')}.md"
         output_path = insights_path / filename
 
-        output_path.write_text(report, encoding='utf-8')
-        print(f"✅ Report saved to: {output_path}")
+        if write_report(output_path, [report]):
+            print(f"✅ Report saved to: {output_path}")
+        else:
+            print(f"✅ Report unchanged: {output_path}")
 
         return output_path
 
@@ -10,92 +10,238 @@ Comprehensive health check for the job application tracking system:
 - Archive integrity checks
 - Pipeline folder structure validation
 
+The application tree is scanned once per run: folders are listed with
+os.scandir and each folder's files are loaded concurrently into an in-memory
+snapshot that all checks share.
+
 Run: python scripts/health_check.py
 Output: insights/health-check-YYYY-MM-DD.md
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatch
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+from datetime import date, datetime, timedelta
+from typing import List, Dict, FrozenSet, Optional, Tuple
 import re
 from collections import defaultdict
 
+from status_parser import StatusRecord, parse_date, parse_status_file
+from report_writer import write_report
+
+
+# Application folders checked by the health check
+APPLICATION_PATTERN = "2025-*"
+
+# Concurrent folder loads (bounded: OneDrive-backed trees dislike huge fan-out)
+DEFAULT_SCAN_WORKERS = 8
+
+
+@dataclass
+class StatusScanSnapshot:
+    """Everything the checks need from one application folder"""
+    path: Path
+    entries: FrozenSet[str]
+    status: Optional[StatusRecord]
+    job_description: Optional[str]
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    def has(self, filename: str) -> bool:
+        return filename in self.entries
+
+    def matching(self, pattern: str) -> List[str]:
+        return sorted(name for name in self.entries if fnmatch(name, pattern))
+
+
+def load_snapshot(app_folder: Path) -> StatusScanSnapshot:
+    """Read one application folder (listing, status.md, job-description.md)"""
+    with os.scandir(app_folder) as it:
+        entries = frozenset(entry.name for entry in it)
+
+    status = None
+    if 'status.md' in entries:
+        try:
+            status = parse_status_file(app_folder / 'status.md')
+        except (OSError, UnicodeDecodeError):
+            status = None
+
+    job_description = None
+    if 'job-description.md' in entries:
+        try:
+            job_description = (app_folder / 'job-description.md').read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            job_description = None
+
+    return StatusScanSnapshot(app_folder, entries, status, job_description)
+
+
+def list_dir(path: Path) -> List[str]:
+    """Entry names in a directory (empty if it does not exist)"""
+    try:
+        with os.scandir(path) as it:
+            return sorted(entry.name for entry in it)
+    except OSError:
+        return []
+
+
+class ApplicationMatchIndex:
+    """
+    Inverted indexes for matching staged job files to application folders.
+
+    - Reference index: job file names mentioned in job-description.md
+      (keyed by the name's trailing characters) -> folders
+    - Token index: folder-name token -> folders
+
+    Lookups only score the candidate folders an index returns, in scan order,
+    so results are identical to scanning every folder.
+    """
+
+    REFERENCE_SUFFIXES = ('.mhtml',)
+    SUFFIX_KEY_LENGTH = 24
+
+    def __init__(self, snapshots: List[StatusScanSnapshot], extract_tokens):
+        self.snapshots = snapshots
+        self.references: Dict[str, List[int]] = defaultdict(list)
+        self.tokens: Dict[str, List[int]] = defaultdict(list)
+        self.folder_tokens: List[set] = []
+
+        for position, app in enumerate(snapshots):
+            if app.job_description:
+                for key in self._reference_keys(app.job_description):
+                    self.references[key].append(position)
+
+            folder_tokens = extract_tokens(app.name.lower())
+            self.folder_tokens.append(folder_tokens)
+            for token in folder_tokens:
+                self.tokens[token].append(position)
+
+    def _reference_keys(self, content: str) -> set:
+        """Trailing substrings (up to SUFFIX_KEY_LENGTH) of every '<name>.mhtml' mention"""
+        keys = set()
+        for suffix in self.REFERENCE_SUFFIXES:
+            end = content.find(suffix)
+            while end >= 0:
+                end += len(suffix)
+                line_start = content.rfind('\n', 0, end) + 1
+                for length in range(len(suffix), min(self.SUFFIX_KEY_LENGTH, end - line_start) + 1):
+                    keys.add(content[end - length:end])
+                end = content.find(suffix, end)
+        return keys
+
+    def find_by_reference(self, job_filename: str) -> Optional[Path]:
+        """First folder whose job-description.md contains job_filename"""
+        if job_filename.endswith(self.REFERENCE_SUFFIXES) and '\n' not in job_filename:
+            key = job_filename[-self.SUFFIX_KEY_LENGTH:]
+            candidates = sorted(set(self.references.get(key, ())))
+        else:
+            candidates = range(len(self.snapshots))
+
+        for position in candidates:
+            content = self.snapshots[position].job_description
+            if content and job_filename in content:
+                return self.snapshots[position].path
+        return None
+
+    def find_by_tokens(self, job_tokens: set) -> Tuple[Optional[Path], float]:
+        """Folder with the highest token overlap score (first one wins ties)"""
+        candidates = sorted({position for token in job_tokens for position in self.tokens.get(token, ())})
+
+        best_match = None
+        best_score = 0
+        for position in candidates:
+            folder_tokens = self.folder_tokens[position]
+
+            # Score based on number of matching tokens and their significance
+            common_tokens = job_tokens & folder_tokens
+            score = len(common_tokens) / max(len(job_tokens), len(folder_tokens))
+
+            if score > best_score:
+                best_score = score
+                best_match = self.snapshots[position].path
+
+        return best_match, best_score
+
 
 class HealthChecker:
-    def __init__(self, root_path: Path = Path(".")):
+    def __init__(self, root_path: Path = Path("."), max_workers: int = DEFAULT_SCAN_WORKERS):
         self.root = root_path
         self.applications = root_path / "applications"
         self.staging = root_path / "staging"
+        self.max_workers = max_workers
 
         self.issues = defaultdict(list)
         self.warnings = defaultdict(list)
         self.info = defaultdict(list)
 
+        # In-memory snapshot of the tree, built once by scan()
+        self._snapshots: Optional[List[StatusScanSnapshot]] = None
+        self._staging_listings: Dict[str, List[str]] = {}
+        self._match_index: Optional['ApplicationMatchIndex'] = None
+
+    def scan(self) -> List[StatusScanSnapshot]:
+        """Walk applications/ once and load every folder concurrently (cached)"""
+        if self._snapshots is None:
+            try:
+                with os.scandir(self.applications) as it:
+                    folders = sorted(Path(entry.path) for entry in it
+                                     if fnmatch(entry.name, APPLICATION_PATTERN) and entry.is_dir())
+            except OSError:
+                folders = []
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                snapshots = list(pool.map(self._load_snapshot_safe, folders))
+            self._snapshots = [snapshot for snapshot in snapshots if snapshot is not None]
+        return self._snapshots
+
+    def _load_snapshot_safe(self, app_folder: Path) -> Optional[StatusScanSnapshot]:
+        try:
+            return load_snapshot(app_folder)
+        except OSError:
+            # Folder vanished or became unreadable mid-scan
+            return None
+
+    def staging_listing(self, relative: str) -> List[str]:
+        """Cached directory listing of a staging/ subfolder"""
+        if relative not in self._staging_listings:
+            self._staging_listings[relative] = list_dir(self.staging / relative)
+        return self._staging_listings[relative]
+
     def check_orphaned_files(self):
         """Find job files without corresponding application folders"""
         print("  Checking for orphaned job files...")
 
         # Check staging/3-applying/
         applying_folder = self.staging / "3-applying"
-        if applying_folder.exists():
-            for job_file in applying_folder.glob("*.mhtml"):
-                matching_folder = self._find_matching_application(job_file)
+        for name in self.staging_listing("3-applying"):
+            if not fnmatch(name, "*.mhtml"):
+                continue
+            job_file = applying_folder / name
+            matching_folder = self._find_matching_application(job_file)
 
-                if not matching_folder:
-                    self.issues['orphaned_files'].append(
-                        f"{job_file.name} in staging/3-applying/ has no corresponding application folder"
-                    )
+            if not matching_folder:
+                self.issues['orphaned_files'].append(
+                    f"{job_file.name} in staging/3-applying/ has no corresponding application folder"
+                )
 
     def _find_matching_application(self, job_file: Path) -> Path:
         """Find application folder matching a job file using multiple strategies"""
-        job_filename = job_file.name
+        index = self.match_index()
 
         # Strategy 1: Check if job filename is referenced in job-description.md files
-        for app_folder in self.applications.glob("2025-*"):
-            if not app_folder.is_dir():
-                continue
-
-            job_desc_file = app_folder / "job-description.md"
-            if job_desc_file.exists():
-                try:
-                    content = job_desc_file.read_text(encoding='utf-8')
-
-                    # Check if filename appears in content (likely in source_file or as reference)
-                    if job_filename in content:
-                        return app_folder
-
-                    # Check for source_file in YAML front matter
-                    if content.startswith('---'):
-                        yaml_end = content.find('---', 3)
-                        if yaml_end > 0:
-                            front_matter = content[3:yaml_end]
-                            if f'source_file: {job_filename}' in front_matter or f'source_file: "{job_filename}"' in front_matter:
-                                return app_folder
-                except Exception:
-                    pass
+        # (likely in source_file front matter or as reference)
+        match = index.find_by_reference(job_file.name)
+        if match:
+            return match
 
         # Strategy 2: Token-based fuzzy matching on folder names
         # Extract meaningful tokens from job filename
         job_tokens = self._extract_tokens(job_file.stem.lower())
-
-        best_match = None
-        best_score = 0
-
-        for app_folder in self.applications.glob("2025-*"):
-            if not app_folder.is_dir():
-                continue
-
-            folder_tokens = self._extract_tokens(app_folder.name.lower())
-
-            # Calculate overlap score
-            common_tokens = job_tokens & folder_tokens
-            if len(common_tokens) > 0:
-                # Score based on number of matching tokens and their significance
-                score = len(common_tokens) / max(len(job_tokens), len(folder_tokens))
-
-                if score > best_score:
-                    best_score = score
-                    best_match = app_folder
+        best_match, best_score = index.find_by_tokens(job_tokens)
 
         # Only return match if confidence is high enough (>30% token overlap)
         if best_score > 0.3:
@@ -103,6 +249,12 @@ class HealthChecker:
 
         return None
 
+    def match_index(self) -> 'ApplicationMatchIndex':
+        """Inverted indexes used for orphan detection (built once per run)"""
+        if self._match_index is None:
+            self._match_index = ApplicationMatchIndex(self.scan(), self._extract_tokens)
+        return self._match_index
+
     def _extract_tokens(self, text: str) -> set:
         """Extract meaningful tokens from text for matching"""
         # Split CamelCase words BEFORE lowercasing (VPProduct → VP Product)
@@ -140,40 +292,35 @@ class HealthChecker:
             'accepted': self.staging / 'archive/accepted',
         }
 
-        for app_folder in self.applications.glob("2025-*"):
-            if not app_folder.is_dir():
-                continue
-
-            status_file = app_folder / "status.md"
-            if not status_file.exists():
+        for app in self.scan():
+            record = app.status
+            if record is None:
                 continue
 
-            content = status_file.read_text(encoding='utf-8')
-
             # Extract current status
-            status_match = re.search(r'\*\*Current Status:\*\*\s*(\w+)', content)
-            if not status_match:
+            if not record.current_status:
                 self.warnings['status_consistency'].append(
-                    f"{app_folder.name}: No current status found in status.md"
+                    f"{app.name}: No current status found in status.md"
                 )
                 continue
 
-            current_status = status_match.group(1)
+            # First word: 'rejected (no response)', 'withdrawn - took other offer'
+            current_status = record.status.split()[0]
 
             # Check if terminal status
             if current_status in terminal_states:
                 expected_archive = terminal_states[current_status]
 
                 # Extract company name to find job file
-                company_name = app_folder.name.split('-')[-1]
+                company_name = app.name.split('-')[-1]
 
-                # Check if job file is in expected archive location
-                job_files_in_archive = list(expected_archive.glob(f"*{company_name}*"))
-                job_files_in_applying = list((self.staging / '3-applying').glob(f"*{company_name}*"))
+                # Check if job file is still in staging/3-applying/ instead of the archive
+                job_files_in_applying = [name for name in self.staging_listing('3-applying')
+                                         if fnmatch(name, f"*{company_name}*")]
 
                 if job_files_in_applying:
                     self.issues['status_consistency'].append(
-                        f"{app_folder.name}: Status is '{current_status}' but job file still in staging/3-applying/ "
+                        f"{app.name}: Status is '{current_status}' but job file still in staging/3-applying/ "
                         f"(should be in {expected_archive.name}/)"
                     )
 
@@ -181,26 +328,18 @@ class HealthChecker:
         """Find applications with status='applied' but no CV"""
         print("  Checking for missing CVs...")
 
-        for app_folder in self.applications.glob("2025-*"):
-            if not app_folder.is_dir():
+        for app in self.scan():
+            record = app.status
+            if record is None:
                 continue
 
-            status_file = app_folder / "status.md"
-            if not status_file.exists():
-                continue
-
-            content = status_file.read_text(encoding='utf-8')
-
             # Check if status is 'applied' or later stages
-            if "**Current Status:** applied" in content or \
-               "**Current Status:** interview-invited" in content:
+            if record.status.startswith(('applied', 'interview-invited')):
 
                 # Check if CV exists
-                cv_files = list(app_folder.glob("*_CV_*.pdf"))
-
-                if not cv_files:
+                if not app.matching("*_CV_*.pdf"):
                     self.issues['missing_cvs'].append(
-                        f"{app_folder.name}: Status is 'applied' but no CV PDF found"
+                        f"{app.name}: Status is 'applied' but no CV PDF found"
                     )
 
     def check_stale_applications(self):
@@ -209,35 +348,25 @@ class HealthChecker:
 
         cutoff_date = datetime.now() - timedelta(days=7)
 
-        for app_folder in self.applications.glob("2025-*"):
-            if not app_folder.is_dir():
+        for app in self.scan():
+            record = app.status
+            if record is None:
                 continue
 
-            status_file = app_folder / "status.md"
-            if not status_file.exists():
-                continue
-
-            content = status_file.read_text(encoding='utf-8')
-
             # Check if status is 'drafting'
-            if "**Current Status:** drafting" not in content:
+            if not record.status.startswith('drafting'):
                 continue
 
             # Extract last updated date
-            date_match = re.search(r'\*\*Last Updated:\*\*\s*(\d{4}-\d{2}-\d{2})', content)
-            if not date_match:
+            last_updated = parse_date(record.last_updated)
+            if not last_updated:
                 continue
 
-            try:
-                last_updated = datetime.strptime(date_match.group(1), '%Y-%m-%d')
-                days_stale = (datetime.now() - last_updated).days
-
-                if days_stale > 7:
-                    self.warnings['stale_applications'].append(
-                        f"{app_folder.name}: Stuck in 'drafting' for {days_stale} days (>7 days)"
-                    )
-            except ValueError:
-                pass
+            days_stale = (date.today() - last_updated).days
+            if days_stale > 7:
+                self.warnings['stale_applications'].append(
+                    f"{app.name}: Stuck in 'drafting' for {days_stale} days (>7 days)"
+                )
 
     def check_archive_integrity(self):
         """Verify archive folder structure and contents"""
@@ -299,15 +428,12 @@ class HealthChecker:
 
         companies = defaultdict(list)
 
-        for app_folder in self.applications.glob("2025-*"):
-            if not app_folder.is_dir():
-                continue
-
+        for app in self.scan():
             # Extract company name (rough heuristic: 3rd component after date)
-            parts = app_folder.name.split('-')
+            parts = app.name.split('-')
             if len(parts) >= 3:
                 company = parts[2]
-                companies[company].append(app_folder.name)
+                companies[company].append(app.name)
 
         # Find companies with multiple applications
         for company, folders in companies.items():
@@ -322,63 +448,50 @@ class HealthChecker:
 
         required_files = ['job-description.md', 'analysis.md', 'status.md']
 
-        for app_folder in self.applications.glob("2025-*"):
-            if not app_folder.is_dir():
-                continue
-
-            missing = []
-            for filename in required_files:
-                if not (app_folder / filename).exists():
-                    missing.append(filename)
+        for app in self.scan():
+            missing = [filename for filename in required_files if not app.has(filename)]
 
             if missing:
                 self.warnings['missing_files'].append(
-                    f"{app_folder.name}: Missing {', '.join(missing)}"
+                    f"{app.name}: Missing {', '.join(missing)}"
                 )
 
     def check_active_applications_waiting_time(self):
         """Check how long active applications have been waiting"""
         print("  Checking active application waiting times...")
 
-        for app_folder in self.applications.glob("2025-*"):
-            if not app_folder.is_dir():
+        for app in self.scan():
+            record = app.status
+            if record is None:
                 continue
 
-            status_file = app_folder / "status.md"
-            if not status_file.exists():
-                continue
-
-            content = status_file.read_text(encoding='utf-8')
-
             # Only check 'applied' status
-            if "**Current Status:** applied" not in content:
+            if not record.status.startswith('applied'):
                 continue
 
             # Extract applied date
-            applied_match = re.search(r'Applied On:\*\*\s*(\d{4}-\d{2}-\d{2})', content)
-            if not applied_match:
+            applied_date = parse_date(record.applied_on)
+            if not applied_date:
                 continue
 
-            try:
-                applied_date = datetime.strptime(applied_match.group(1), '%Y-%m-%d')
-                days_waiting = (datetime.now() - applied_date).days
-
-                if days_waiting > 14:
-                    self.warnings['long_wait'].append(
-                        f"{app_folder.name}: Waiting {days_waiting} days (>14 days, consider follow-up)"
-                    )
-                elif days_waiting > 21:
-                    self.issues['long_wait'].append(
-                        f"{app_folder.name}: Waiting {days_waiting} days (>21 days, likely silent rejection)"
-                    )
-            except ValueError:
-                pass
+            days_waiting = (date.today() - applied_date).days
+            if days_waiting > 14:
+                self.warnings['long_wait'].append(
+                    f"{app.name}: Waiting {days_waiting} days (>14 days, consider follow-up)"
+                )
+            elif days_waiting > 21:
+                self.issues['long_wait'].append(
+                    f"{app.name}: Waiting {days_waiting} days (>21 days, likely silent rejection)"
+                )
 
     def run_all_checks(self):
         """Run all health checks"""
         print("🏥 Running System Health Checks...")
         print()
 
+        print(f"  Scanning applications ({self.max_workers} workers)...")
+        self.scan()
+
         self.check_orphaned_files()
         self.check_status_file_location_consistency()
         self.check_missing_cvs()
@@ -531,17 +644,16 @@ python scripts/health_check.py
 """
 
         # Calculate stats
-        total_apps = len(list(self.applications.glob("2025-*")))
+        total_apps = len(self.scan())
         active_count = 0
         terminal_count = 0
 
-        for app_folder in self.applications.glob("2025-*"):
-            status_file = app_folder / "status.md"
-            if status_file.exists():
-                content = status_file.read_text(encoding='utf-8')
-                if "**Current Status:** applied" in content:
+        for app in self.scan():
+            record = app.status
+            if record is not None:
+                if record.status.startswith('applied'):
                     active_count += 1
-                elif any(s in content for s in ["rejected", "withdrawn", "accepted"]):
+                elif record.status.startswith(('rejected', 'withdrawn', 'accepted')):
                     terminal_count += 1
 
         report += f"""
@@ -566,8 +678,10 @@ python scripts/health_check.py
         filename = f"health-check-{datetime.now().strftime('%Y-%m-%d')}.md"
         output_path = insights_path / filename
 
-        output_path.write_text(report, encoding='utf-8')
-        print(f"📄 Report saved to: {output_path}")
+        if write_report(output_path, [report]):
+            print(f"📄 Report saved to: {output_path}")
+        else:
+            print(f"📄 Report unchanged: {output_path}")
 
         return output_path
 
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Dashboard metrics in one pass over the application columns
+
+sync-status.py used to count KPIs with a branch per field of every
+application dict, and the dashboard sections then walked the list again for
+the fit distribution, the recent-activity window and the top 10 (a full
+sort). The engine reads the ApplicationSnapshot columns (application_snapshot.py)
+once and produces everything the dashboards show:
+- the calculate_metrics KPIs (counts by status and fit bucket, average fit,
+  pipeline stage counts)
+- funnel conversion rates
+- the fit distribution (whole points)
+- rows analyzed in the last RECENT_DAYS days, most recent first
+- the TOP_K rows by fit score, picked with a bounded heap (heapq.nlargest)
+  instead of sorting every application
+
+The dashboard sections use these precomputed values when they are in
+metrics, so their cost no longer grows with a re-walk of the history.
+
+Usage:
+    from metrics_engine import compute_metrics
+    snapshot = ApplicationSnapshot.from_applications(applications)
+    metrics = compute_metrics(snapshot, applications)
+    metrics['top_10']             # application dicts, best fit first
+    metrics['recent_activity']    # [(application, days_ago), ...]
+"""
+
+import heapq
+from datetime import date
+from typing import Dict, List, Optional
+
+from application_snapshot import EPOCH_ORDINAL, MISSING_DAY, ApplicationSnapshot
+
+
+TOP_K = 10
+RECENT_DAYS = 7
+HIGH_PRIORITY_FIT = 8
+
+
+def percentage(part, whole):
+    return round(part / whole * 100, 1) if whole > 0 else 0
+
+
+def compute_metrics(snapshot: ApplicationSnapshot, applications: Optional[List[Dict]] = None,
+                    today: Optional[date] = None) -> Dict:
+    """
+    Every dashboard aggregate from one pass over the snapshot columns
+
+    Rows in 'top_10' and 'recent_activity' are the matching dicts of
+    applications (in snapshot order) if given, row indices otherwise.
+    """
+    today_day = (today or date.today()).toordinal() - EPOCH_ORDINAL
+    status_counts: Dict[int, int] = {}
+    fit_buckets: Dict[int, int] = {}
+    fit_total = 0.0
+    high_priority = cv_count = cover_letter_count = 0
+    applied = interviews = rejected = withdrawn = 0
+    recent = []
+
+    # Pipeline stages count recorded events (the flag columns), dated or not
+    columns = zip(snapshot['status'], snapshot['fit_score'], snapshot['cv_generated'],
+                  snapshot['cover_letter_generated'], snapshot['applied'], snapshot['interview_count'],
+                  snapshot['rejected'], snapshot['withdrawn'], snapshot['analyzed_day'])
+    for row, (status, fit, cv, cover_letter, was_applied, interview_count,
+              was_rejected, was_withdrawn, analyzed_day) in enumerate(columns):
+        status_counts[status] = status_counts.get(status, 0) + 1
+        if fit == fit:  # not NaN
+            bucket = int(fit)
+            fit_buckets[bucket] = fit_buckets.get(bucket, 0) + 1
+            fit_total += fit
+            high_priority += fit >= HIGH_PRIORITY_FIT
+        cv_count += cv
+        cover_letter_count += cover_letter
+        applied += was_applied
+        interviews += interview_count > 0
+        rejected += was_rejected
+        withdrawn += was_withdrawn
+        if analyzed_day != MISSING_DAY and today_day - analyzed_day <= RECENT_DAYS:
+            recent.append((today_day - analyzed_day, row))
+
+    fit = snapshot['fit_score']
+    scored = sum(fit_buckets.values())
+    # nlargest is stable: ties keep snapshot order, like sorted(..., reverse=True)[:TOP_K]
+    top_rows = heapq.nlargest(TOP_K, (row for row in range(len(snapshot)) if fit[row] == fit[row]),
+                              key=fit.__getitem__)
+    recent.sort(key=lambda item: item[0])
+
+    categories = snapshot.status_categories
+    row_value = (lambda row: applications[row]) if applications is not None else (lambda row: row)
+    total = len(snapshot)
+
+    return {
+        'total': total,
+        'by_status': {categories[code]: count for code, count in status_counts.items()},
+        'by_fit_score': {f"{bucket}-{bucket + 0.9}": count for bucket, count in fit_buckets.items()},
+        'avg_fit_score': round(fit_total / scored, 2) if scored else 0,
+        'scored_count': scored,
+        'high_priority_count': high_priority,
+        'cv_generated_count': cv_count,
+        'cover_letter_count': cover_letter_count,
+        'applied_count': applied,
+        'interview_count': interviews,
+        'rejected_count': rejected,
+        'withdrawn_count': withdrawn,
+        'analysis_phase_count': sum(count for code, count in status_counts.items()
+                                    if 'analysis' in categories[code]),
+        'conversion': {
+            'analysis_to_high_priority': percentage(high_priority, total),
+            'high_priority_to_applied': percentage(applied, high_priority),
+            'applied_to_interview': percentage(interviews, applied),
+        },
+        'fit_distribution': dict(sorted(fit_buckets.items(), reverse=True)),
+        'recent_activity': [(row_value(row), days_ago) for days_ago, row in recent],
+        'top_10': [row_value(row) for row in top_rows],
+    }
@@ -4,19 +4,38 @@ Migration script to reorganize applications folder into status-based hierarchy.
 Moves application folders from flat structure to active/archive hierarchy based on status.
 
 Special handling: Folders without status.md are placed in active/analyzing/
+
+The migration is planned before anything moves: every status.md is parsed
+once (in a thread pool) into a list of moves. Executing the plan creates
+each target directory once and renames the folders concurrently (same
+filesystem; cross-filesystem moves are copied one at a time). The plan is
+written to a rollback journal first, so --rollback can move folders back.
 """
 
 import os
-import re
+import json
 import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from typing import Dict, List
+
+from status_parser import parse_status_file
+from report_writer import write_report
 
 # Define base path
 BASE_PATH = Path(r"C:\Users\ArturSwadzba\OneDrive\4. CV")
 APPLICATIONS_PATH = BASE_PATH / "applications"
+MIGRATION_JOURNAL = BASE_PATH / "insights" / ".migration-journal.json"
+
+# Folders in applications/ that are not migrated
+SKIP_FOLDERS = ['active', 'archive', '_example-application']
+
+# Concurrent renames (OneDrive renames are slow but independent)
+DEFAULT_WORKERS = 8
 
 # Status to folder mapping
 STATUS_MAP = {
@@ -49,16 +68,10 @@ def get_quarter_folder(date_str):
 def parse_status_from_file(status_file):
     """Parse status and relevant dates from status.md file."""
     try:
-        with open(status_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        record = parse_status_file(status_file)
 
-        # Extract current status
-        status_match = re.search(r'\*\*Current Status:\*\* (.+?)$', content, re.MULTILINE)
-        status = status_match.group(1).strip().lower() if status_match else 'analyzing'
-
-        # Extract last updated date
-        updated_match = re.search(r'\*\*Last Updated:\*\* (.+?)$', content, re.MULTILINE)
-        last_updated = updated_match.group(1).strip() if updated_match else datetime.now().strftime("%Y-%m-%d")
+        status = record.status if record.current_status else 'analyzing'
+        last_updated = record.last_updated or datetime.now().strftime("%Y-%m-%d")
 
         return {
             'status': status,
@@ -82,7 +95,10 @@ def determine_target_location(app_folder):
         return "applications/active/analyzing", "analyzing (no status.md)"
 
     # Parse status
-    data = parse_status_from_file(status_file)
+    return target_for_status(parse_status_from_file(status_file))
+
+def target_for_status(data):
+    """Target location and reason for parsed status data."""
     status = data['status']
 
     # Map status to folder
@@ -120,31 +136,135 @@ def create_folder_structure(dry_run=False):
             folder_path.mkdir(parents=True, exist_ok=True)
             print(f"[OK] Created: {folder}")
 
-def migrate_application(app_folder, dry_run=False):
-    """Migrate a single application folder to new structure."""
-    target_base, reason = determine_target_location(app_folder)
-    target_path = BASE_PATH / target_base / app_folder.name
+@dataclass
+class Move:
+    """One planned folder move."""
+    source: Path
+    target: Path
+    reason: str
 
-    if dry_run:
+    def result(self, action):
         return {
-            'source': str(app_folder),
-            'target': str(target_path),
-            'reason': reason,
-            'action': 'WOULD MOVE'
+            'source': str(self.source),
+            'target': str(self.target),
+            'reason': self.reason,
+            'action': action
         }
-    else:
-        # Create target directory if needed
-        target_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Move folder
-        shutil.move(str(app_folder), str(target_path))
+def plan_move(app_folder, applications_path=APPLICATIONS_PATH):
+    """Plan the move of one application folder (reads its status.md once)."""
+    target_base, reason = determine_target_location(app_folder)
+    return Move(app_folder, applications_path.parent / target_base / app_folder.name, reason)
+
+def find_application_folders(applications_path=APPLICATIONS_PATH):
+    """Application folders still in the old flat structure."""
+    return sorted(Path(entry.path) for entry in os.scandir(applications_path)
+                  if entry.is_dir() and entry.name not in SKIP_FOLDERS)
+
+def plan_migration(applications_path=APPLICATIONS_PATH, workers=DEFAULT_WORKERS):
+    """Full move plan, in folder-name order, from one parse pass over every status.md."""
+    folders = find_application_folders(applications_path)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda folder: plan_move(folder, applications_path), folders))
+
+def group_by_target(plan) -> Dict[Path, List[Move]]:
+    """Planned moves grouped by target directory."""
+    groups = defaultdict(list)
+    for move in plan:
+        groups[move.target.parent].append(move)
+    return dict(groups)
+
+def write_journal(journal_path, moves):
+    """Record planned moves before executing them, for --rollback."""
+    journal = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'moves': [move.result('PLANNED') for move in moves]
+    }
+    write_report(journal_path, [json.dumps(journal, indent=2, ensure_ascii=False), "\n"])
 
-        return {
-            'source': str(app_folder),
-            'target': str(target_path),
-            'reason': reason,
-            'action': 'MOVED'
-        }
+def read_journal(journal_path):
+    """Moves recorded by the last executed migration."""
+    journal = json.loads(Path(journal_path).read_text(encoding='utf-8'))
+    return [Move(Path(move['source']), Path(move['target']), move['reason']) for move in journal['moves']]
+
+def _rename(move):
+    """Rename one folder; never overwrites or nests into an existing target."""
+    if move.target.exists():
+        return move.result('SKIPPED (target exists)')
+    try:
+        os.rename(move.source, move.target)
+    except OSError as e:
+        return move.result(f'FAILED ({e})')
+    return move.result('MOVED')
+
+def _copy_move(move):
+    """Move across filesystems (copy + delete)."""
+    if move.target.exists():
+        return move.result('SKIPPED (target exists)')
+    try:
+        shutil.move(str(move.source), str(move.target))
+    except OSError as e:
+        return move.result(f'FAILED ({e})')
+    return move.result('MOVED')
+
+def _same_filesystem(source, target_dir):
+    try:
+        return os.stat(source.parent).st_dev == os.stat(target_dir).st_dev
+    except OSError:
+        return False
+
+def execute_moves(moves, workers=DEFAULT_WORKERS):
+    """
+    Execute planned moves: each target directory is created once, renames
+    within a filesystem run concurrently, cross-filesystem moves one at a time.
+
+    Returns one result per move, in plan order.
+    """
+    renames, copies = [], []
+    for target_dir, group in group_by_target(moves).items():
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for move in group:
+            (renames if _same_filesystem(move.source, target_dir) else copies).append(move)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for move, result in zip(renames, pool.map(_rename, renames)):
+            results[id(move)] = result
+    for move in copies:
+        results[id(move)] = _copy_move(move)
+
+    return [results[id(move)] for move in moves]
+
+def execute_plan(plan, journal_path=MIGRATION_JOURNAL, workers=DEFAULT_WORKERS):
+    """Journal the plan, then execute it."""
+    write_journal(journal_path, plan)
+    return execute_moves(plan, workers)
+
+def rollback(journal_path=MIGRATION_JOURNAL, workers=DEFAULT_WORKERS):
+    """
+    Move folders of the journaled migration back to where they were.
+
+    Only moves that happened (target present, source gone) are reversed,
+    so a rollback after an interrupted migration is safe. The journal is
+    removed once every folder is back.
+    """
+    moves = [move for move in read_journal(journal_path)
+             if move.target.exists() and not move.source.exists()]
+    reverse = [Move(move.target, move.source, move.reason) for move in moves]
+    results = execute_moves(reverse, workers)
+
+    if all(result['action'] == 'MOVED' for result in results):
+        Path(journal_path).unlink()
+    return results
+
+def migrate_application(app_folder, dry_run=False):
+    """Migrate a single application folder to new structure."""
+    move = plan_move(app_folder)
+
+    if dry_run:
+        return move.result('WOULD MOVE')
+    else:
+        return execute_moves([move], workers=1)[0]
 
 def validate_migration():
     """Validate migration was successful."""
@@ -179,12 +299,27 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without executing')
     parser.add_argument('--execute', action='store_true', help='Execute migration')
     parser.add_argument('--validate', action='store_true', help='Validate migration results')
+    parser.add_argument('--rollback', action='store_true', help='Undo the last executed migration')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'Concurrent renames (default: {DEFAULT_WORKERS})')
     args = parser.parse_args()
 
     if args.validate:
         success = validate_migration()
         return 0 if success else 1
 
+    if args.rollback:
+        if not MIGRATION_JOURNAL.exists():
+            print(f"[!] No migration journal found: {MIGRATION_JOURNAL}")
+            return 1
+        results = rollback(MIGRATION_JOURNAL, args.workers)
+        for result in results:
+            print(f"{result['action']}: {Path(result['source']).name} -> {result['target']}")
+        failed = [result for result in results if result['action'] != 'MOVED']
+        print(f"\n[OK] Rolled back {len(results) - len(failed)} folders" +
+              (f", {len(failed)} failed (journal kept)" if failed else ""))
+        return 1 if failed else 0
+
     dry_run = not args.execute
 
     if dry_run:
@@ -200,27 +335,30 @@ def main():
     print("\n--- Creating folder structure ---")
     create_folder_structure(dry_run)
 
-    # Find all application folders (excluding special folders)
+    # Plan every move (excluding special folders) before moving anything
     print("\n--- Scanning application folders ---")
-    app_folders = []
-    for item in APPLICATIONS_PATH.iterdir():
-        if item.is_dir() and item.name not in ['active', 'archive', '_example-application']:
-            app_folders.append(item)
+    plan = plan_migration(APPLICATIONS_PATH, args.workers)
 
-    print(f"Found {len(app_folders)} folders to migrate")
+    print(f"Found {len(plan)} folders to migrate "
+          f"into {len(group_by_target(plan))} target folders")
 
     # Track migration results
     results = {
-        'total': len(app_folders),
+        'total': len(plan),
         'by_target': defaultdict(int),
         'no_status_md': 0,
         'migrations': []
     }
 
-    # Migrate each folder
+    # Migrate all folders
     print("\n--- Migrating folders ---")
-    for app_folder in sorted(app_folders):
-        result = migrate_application(app_folder, dry_run)
+    if dry_run:
+        outcomes = [move.result('WOULD MOVE') for move in plan]
+    else:
+        outcomes = execute_plan(plan, MIGRATION_JOURNAL, args.workers)
+
+    for move, result in zip(plan, outcomes):
+        app_folder = move.source
         results['migrations'].append(result)
 
         # Extract target category (use reason which has clean category)
@@ -257,8 +395,12 @@ def main():
         print("\n[!] This was a DRY RUN. No changes were made.")
         print("To execute migration, run: python scripts/migrate-to-status-folders.py --execute")
     else:
+        failed = [result for result in results['migrations'] if result['action'] != 'MOVED']
+        if failed:
+            print(f"\n[!] {len(failed)} folders were not moved (see above)")
         print("\n[OK] Migration complete!")
         print("To validate results, run: python scripts/migrate-to-status-folders.py --validate")
+        print("To undo it, run: python scripts/migrate-to-status-folders.py --rollback")
 
     return 0
 
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate job detection (MinHash + locality-sensitive hashing)
+
+dedup_index.py only sees company and title, so the same role reposted under
+a slightly different title, or saved again from another job board, slips
+through. This index compares the description text itself:
+
+1. A description is reduced to its set of SHINGLE_WORDS-word shingles
+   (the title and **Field:** metadata lines are dropped: they differ between
+   boards).
+2. A MinHash signature of NUM_PERM values estimates the Jaccard similarity
+   of two shingle sets: the fraction of positions where the signatures agree.
+   It is computed with one-permutation hashing: each shingle hash lands in
+   one of NUM_PERM bins, which keep their minimum, so a description is
+   hashed once rather than NUM_PERM times. Empty bins (short texts) borrow
+   the next filled bin's value (rotation densification).
+3. Signatures are split into BANDS bands of ROWS values. Each band is a key
+   in its own hash table, so only jobs that agree on a whole band become
+   candidates. A lookup therefore checks a few candidates instead of every
+   stored job. Candidates need an estimated similarity of at least
+   SIMILARITY_THRESHOLD.
+
+With 16 bands of 8 rows, pairs at 0.8 similarity share a band ~95% of the
+time and pairs at 0.5 only ~6%.
+
+The index is persisted to JSON (default insights/.near-duplicates.json) and
+kept up to date with refresh(): new or edited job-description.md files are
+signed, and entries whose file has gone are dropped.
+
+Usage:
+    from near_duplicates import NearDuplicateIndex, application_descriptions
+    index = NearDuplicateIndex.load(Path("insights/.near-duplicates.json"))
+    index.refresh(application_descriptions(Path("applications")))
+    match = index.find(text)          # (folder, similarity) or None
+    index.add("staging/batch/2025-11-Kraken-SeniorPM", text)
+    index.save(Path("insights/.near-duplicates.json"))
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from dedup_index import application_folders
+from report_writer import write_report
+
+
+INDEX_VERSION = 1
+NEAR_DUPLICATES_PATH = Path('insights/.near-duplicates.json')
+
+SHINGLE_WORDS = 5
+NUM_PERM = 128
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.8
+
+# Offset added per bin skipped when densifying, so borrowed values stay distinct
+DENSIFY_OFFSET = 1 << 58
+
+METADATA_RE = re.compile(r'^(#.*|\*\*[^*\n]+:\*\*.*)$', re.MULTILINE)
+WORD_RE = re.compile(r'\w+')
+
+Signature = Tuple[int, ...]
+
+
+def shingles(text: str) -> Set[int]:
+    """64-bit hashes of the description's word shingles (metadata lines removed)"""
+    words = WORD_RE.findall(METADATA_RE.sub(' ', text).lower())
+    if len(words) < SHINGLE_WORDS:
+        grams = [' '.join(words)] if words else []
+    else:
+        grams = [' '.join(words[i:i + SHINGLE_WORDS]) for i in range(len(words) - SHINGLE_WORDS + 1)]
+    return {int.from_bytes(hashlib.blake2b(gram.encode('utf-8'), digest_size=8).digest(), 'little')
+            for gram in grams}
+
+
+def minhash(text: str) -> Optional[Signature]:
+    """MinHash signature of a description, None if it has no words"""
+    hashes = shingles(text)
+    if not hashes:
+        return None
+    bins: List[Optional[int]] = [None] * NUM_PERM
+    for h in hashes:
+        slot, value = h % NUM_PERM, h // NUM_PERM
+        current = bins[slot]
+        if current is None or value < current:
+            bins[slot] = value
+
+    signature = []
+    for slot, value in enumerate(bins):
+        distance = 0
+        while value is None:
+            distance += 1
+            value = bins[(slot + distance) % NUM_PERM]
+        signature.append(value + distance * DENSIFY_OFFSET)
+    return tuple(signature)
+
+
+def similarity(first: Signature, second: Signature) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(x == y for x, y in zip(first, second)) / NUM_PERM
+
+
+def application_descriptions(applications_dir: Path) -> List[Path]:
+    """job-description.md of every application folder that has one"""
+    descriptions = (Path(entry.path) / 'job-description.md' for entry in application_folders(applications_dir))
+    return [path for path in descriptions if path.is_file()]
+
+
+class NearDuplicateIndex:
+    """Folder -> MinHash signature, with one LSH bucket table per band"""
+
+    def __init__(self):
+        self.signatures: Dict[str, Signature] = {}
+        # Folder -> mtime_ns of its job-description.md (entries added by refresh)
+        self.mtimes: Dict[str, int] = {}
+        self._buckets: List[Dict[Signature, Set[str]]] = [{} for _ in range(BANDS)]
+        self.dirty = False
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    @staticmethod
+    def _bands(signature: Signature):
+        return enumerate(signature[i:i + ROWS] for i in range(0, NUM_PERM, ROWS))
+
+    def insert(self, folder, signature: Signature):
+        """Index a precomputed signature under its folder"""
+        folder = str(folder)
+        self.remove(folder)
+        self.signatures[folder] = signature
+        for band, key in self._bands(signature):
+            self._buckets[band].setdefault(key, set()).add(folder)
+        self.dirty = True
+
+    def add(self, folder, text: str) -> Optional[Signature]:
+        """Index a job description under its folder (descriptions without words are skipped)"""
+        signature = minhash(text)
+        if signature is not None:
+            self.insert(folder, signature)
+        return signature
+
+    def remove(self, folder):
+        folder = str(folder)
+        signature = self.signatures.pop(folder, None)
+        self.mtimes.pop(folder, None)
+        if signature is None:
+            return
+        for band, key in self._bands(signature):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(folder)
+                if not bucket:
+                    del self._buckets[band][key]
+        self.dirty = True
+
+    def find(self, text: str) -> Optional[Tuple[str, float]]:
+        """(folder, estimated similarity) of the most similar indexed job above the threshold"""
+        signature = minhash(text)
+        return self.match(signature) if signature is not None else None
+
+    def match(self, signature: Signature) -> Optional[Tuple[str, float]]:
+        """find() for a precomputed signature: only jobs sharing a band are compared"""
+        candidates = set()
+        for band, key in self._bands(signature):
+            candidates |= self._buckets[band].get(key, set())
+        best = None
+        for folder in sorted(candidates):
+            score = similarity(signature, self.signatures[folder])
+            if score >= SIMILARITY_THRESHOLD and (best is None or score > best[1]):
+                best = (folder, score)
+        return best
+
+    def refresh(self, description_paths: Iterable[Path]) -> int:
+        """
+        Sign new or edited description files and drop entries whose file is gone
+
+        Entries without a recorded mtime (jobs add()-ed from a batch) are kept
+        while their folder exists. Returns the number of files (re)signed.
+        """
+        signed = 0
+        seen = set()
+        for path in description_paths:
+            folder = str(Path(path).parent)
+            seen.add(folder)
+            try:
+                mtime = os.stat(path).st_mtime_ns
+                if self.mtimes.get(folder) == mtime:
+                    continue
+                text = Path(path).read_text(encoding='utf-8', errors='ignore')
+            except OSError:
+                continue
+            self.remove(folder)
+            if self.add(folder, text) is not None:
+                self.mtimes[folder] = mtime
+            signed += 1
+
+        for folder in [folder for folder in self.signatures if folder not in seen]:
+            if folder in self.mtimes or not Path(folder).exists():
+                self.remove(folder)
+        return signed
+
+    @classmethod
+    def load(cls, index_path: Path) -> 'NearDuplicateIndex':
+        """Saved index, or an empty one if missing, unreadable or from another version"""
+        index = cls()
+        index_path = Path(index_path)
+        if not index_path.exists():
+            return index
+        try:
+            data = json.loads(index_path.read_text(encoding='utf-8'))
+            if data.get('version') == INDEX_VERSION and data.get('num_perm') == NUM_PERM:
+                for folder, entry in data['entries'].items():
+                    index.insert(folder, tuple(entry['signature']))
+                    if entry.get('mtime_ns') is not None:
+                        index.mtimes[folder] = entry['mtime_ns']
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Ignoring unreadable near-duplicate index {index_path}: {e}")
+            index = cls()
+        index.dirty = False
+        return index
+
+    def save(self, index_path: Path):
+        """Persist the signatures (JSON); buckets are rebuilt on load"""
+        data = {
+            'version': INDEX_VERSION,
+            'num_perm': NUM_PERM,
+            'entries': {folder: {'signature': list(signature), 'mtime_ns': self.mtimes.get(folder)}
+                        for folder, signature in sorted(self.signatures.items())},
+        }
+        write_report(index_path, [json.dumps(data), "\n"])
+        self.dirty = False
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """
 Organize staging files into tier folders based on fit scores
+
+Fit scores come from the score cache written by bulk_analyze.py
+(staging/.fit-scores.json); only files added or changed since the last bulk
+run are extracted and scored again.
 """
 
 import shutil
@@ -66,7 +70,7 @@ def main():
     print("📁 Organizing staging folder by fit score...")
     print()
 
-    # Re-analyze to get fit scores
+    # Scores from the last bulk run (only new or changed files are analyzed)
     results = analyze_all_jobs('staging')
 
     print()
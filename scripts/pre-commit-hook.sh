@@ -76,7 +76,26 @@ else
 fi
 
 # ============================================
-# 3. Validate Critical Files
+# 3. Validate CV / Cover Letter PDFs (one batch run)
+# ============================================
+echo "📄 Validating CV and cover letter PDFs..."
+echo ""
+
+python scripts/validation_batch.py --json insights/pdf-validation.json
+validation_exit=$?
+
+if [ $validation_exit -eq 0 ]; then
+    echo "✅ All PDFs passed validation"
+    echo ""
+else
+    echo "⚠️  Some PDFs failed validation (see insights/pdf-validation.json)"
+    echo "   Regenerate them before submitting"
+    echo ""
+    # Allow commit but warn: older applications may predate current formatting rules
+fi
+
+# ============================================
+# 4. Validate Critical Files
 # ============================================
 echo "📁 Validating critical files..."
 
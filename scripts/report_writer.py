@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Section-based streaming report renderer
+
+Reports are an ordered list of named sections. Each section is a generator
+that yields chunks of markdown; chunks are streamed straight to the output
+file through a buffered writer, so rendering is linear in the number of
+applications and never holds the whole document in memory.
+
+Writes are atomic and skipped when nothing changed: the report is rendered
+to a temp file next to the target while its content is hashed (ignoring the
+"Generated:" / "Last Updated:" timestamp lines and JSON "generated" keys), and the temp file only
+replaces the target if the hash differs from the existing file. Unchanged
+reports leave the target untouched, so OneDrive/git and file watchers see
+no activity.
+
+Sections may declare their inputs: the application fields (uses) and
+metrics keys (metrics) they read. A SectionCache keeps the rendered chunks
+of declared sections and, given the application fields changed since the
+last render, only re-renders sections whose inputs changed. Undeclared
+sections (e.g. those printing the current time) are always re-rendered.
+
+Usage:
+    from report_writer import SectionCache, SectionRegistry, render_report, write_report
+
+    SECTIONS = SectionRegistry()
+
+    @SECTIONS.section('top_10', uses=('fit_score', 'company'), metrics=('top_10',))
+    def top_10(applications, metrics):
+        yield "## Top 10\\n\\n"
+        ...
+
+    write_report(path, render_report(SECTIONS, ['top_10'], applications, metrics))
+    write_report(path, [report_text])  # plain strings work too
+
+    cache = SectionCache(SECTIONS)
+    write_report(path, cache.render(['top_10'], applications, metrics, changed_fields={'status'}))
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+# Horizontal rule placed between consecutive sections
+SECTION_SEPARATOR = "\n---\n\n"
+
+# Write buffer for report files (bytes)
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+# Lines that change on every run without the report itself changing
+# (markdown timestamps, and the top-level "generated" key of indent=2 JSON reports)
+VOLATILE_LINE_PREFIXES = ('**Generated:**', '**Last Updated:**', '  "generated": ')
+
+# mkstemp creates 0600 files; reports get a fixed rw-r--r-- mode (reading the
+# umask would mean changing it, a process-wide race with other threads)
+REPORT_FILE_MODE = 0o644
+
+
+class SectionRegistry:
+    """Named, pluggable report sections"""
+
+    def __init__(self):
+        self._sections: Dict[str, Callable[..., Iterable[str]]] = {}
+        self._inputs: Dict[str, Tuple[FrozenSet[str], Tuple[str, ...]]] = {}
+
+    def section(self, name: str, uses: Optional[Iterable[str]] = None, metrics: Optional[Iterable[str]] = None):
+        """
+        Decorator registering a section generator under `name`
+
+        uses / metrics declare the application fields and metrics keys the
+        section reads; sections declaring neither are never cached.
+        """
+        def decorator(func):
+            if name in self._sections:
+                raise ValueError(f"Report section already registered: {name}")
+            self._sections[name] = func
+            if uses is not None or metrics is not None:
+                self._inputs[name] = (frozenset(uses or ()), tuple(metrics or ()))
+            return func
+        return decorator
+
+    def inputs(self, name: str) -> Optional[Tuple[FrozenSet[str], Tuple[str, ...]]]:
+        """(application fields, metrics keys) a section reads, None if undeclared"""
+        return self._inputs.get(name)
+
+    def get(self, name: str) -> Callable[..., Iterable[str]]:
+        try:
+            return self._sections[name]
+        except KeyError:
+            raise ValueError(f"Unknown report section: {name}") from None
+
+    def names(self) -> List[str]:
+        return list(self._sections)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sections
+
+
+def render_report(registry: SectionRegistry, section_names: Iterable[str], *args,
+                  separator: str = SECTION_SEPARATOR, **kwargs) -> Iterator[str]:
+    """Yield the chunks of each section in order, separated by `separator`"""
+    for i, name in enumerate(section_names):
+        section = registry.get(name)
+        if i:
+            yield separator
+        yield from section(*args, **kwargs)
+
+
+def _comparable(value):
+    """Plain copy of a metrics value for comparison (records via to_dict)"""
+    if hasattr(value, 'to_dict'):
+        value = value.to_dict()
+    if isinstance(value, dict):
+        return {key: _comparable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_comparable(item) for item in value]
+    return value
+
+
+class SectionCache:
+    """Rendered sections kept between renders of the same reports"""
+
+    def __init__(self, registry: SectionRegistry, separator: str = SECTION_SEPARATOR):
+        self.registry = registry
+        self.separator = separator
+        self._rendered: Dict[str, Tuple[List, List[str]]] = {}
+        self.rendered = 0
+        self.reused = 0
+
+    def render(self, section_names: Iterable[str], applications, metrics,
+               changed_fields: Optional[Set[str]] = None) -> Iterator[str]:
+        """
+        render_report() reusing cached sections whose inputs are unchanged
+
+        changed_fields: application fields that differ from the previous
+        render; None (applications added or removed, first render) re-renders
+        every section.
+        """
+        for i, name in enumerate(section_names):
+            if i:
+                yield self.separator
+            section = self.registry.get(name)
+            inputs = self.registry.inputs(name)
+            if inputs is None:
+                self.rendered += 1
+                yield from section(applications, metrics)
+                continue
+
+            uses, keys = inputs
+            values = [_comparable(metrics.get(key)) for key in keys]
+            cached = self._rendered.get(name)
+            if (cached is not None and changed_fields is not None
+                    and not uses & changed_fields and cached[0] == values):
+                self.reused += 1
+                yield from cached[1]
+                continue
+
+            chunks = list(section(applications, metrics))
+            self._rendered[name] = (values, chunks)
+            self.rendered += 1
+            yield from chunks
+
+
+class _HashingWriter:
+    """Write-through wrapper hashing complete lines, skipping volatile ones"""
+
+    def __init__(self, f):
+        self.f = f
+        self.digest = hashlib.sha256()
+        self.partial = ''
+
+    def _update(self, line: str):
+        if not line.startswith(VOLATILE_LINE_PREFIXES):
+            self.digest.update(line.encode('utf-8'))
+
+    def write(self, chunk: str):
+        self.f.write(chunk)
+        lines = (self.partial + chunk).split('\n')
+        self.partial = lines.pop()
+        for line in lines:
+            self._update(line + '\n')
+
+    def hexdigest(self) -> str:
+        if self.partial:
+            self._update(self.partial)
+            self.partial = ''
+        return self.digest.hexdigest()
+
+
+def report_hash(path: Path) -> Optional[str]:
+    """Content hash of an existing report, ignoring volatile lines (None if unreadable)"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.startswith(VOLATILE_LINE_PREFIXES):
+                    digest.update(line.encode('utf-8'))
+    except (OSError, UnicodeDecodeError):
+        return None
+    return digest.hexdigest()
+
+
+def write_report(path: Path, chunks: Iterable[str], buffer_size: int = DEFAULT_BUFFER_SIZE) -> bool:
+    """
+    Stream rendered chunks to `path` atomically.
+
+    Returns True if the file was written, False if its content (ignoring
+    timestamp lines) was already up to date and the file was left alone.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with open(fd, 'w', encoding='utf-8', buffering=buffer_size) as f:
+            writer = _HashingWriter(f)
+            for chunk in chunks:
+                writer.write(chunk)
+
+        if path.exists() and report_hash(path) == writer.hexdigest():
+            os.unlink(tmp_name)
+            return False
+
+        os.chmod(tmp_name, REPORT_FILE_MODE)
+        os.replace(tmp_name, path)
+        return True
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
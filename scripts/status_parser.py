@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Shared status.md parser
+
+Tokenizes an application status.md file in a single linear pass and returns a
+typed StatusRecord. All sync, health and evaluation scripts use this module so
+every status file is read and parsed exactly once per run.
+
+Recognized tokens:
+- Title line:      # Application Status - <Company> - <Role>
+- Field lines:     **<Field>:** <value>   (first occurrence of a field wins)
+- Timeline events: ### <Label> - <when>
+
+Usage:
+    from status_parser import parse_status_file
+    record = parse_status_file(Path("applications/active/applied/.../status.md"))
+"""
+
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+TITLE_RE = re.compile(r'^# Application Status - (.+?) - (.+?)\s*$')
+FIELD_RE = re.compile(r'\*\*([^*\n]+?):\*\*[ \t]*(.*)$')
+EVENT_RE = re.compile(r'^###\s*(.+?)\s+-\s+(.+?)\s*$')
+DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+SCORE_RE = re.compile(r'^([\d.]+)/10')
+INT_RE = re.compile(r'^(\d+)')
+
+# status.md field label -> StatusRecord attribute
+FIELD_MAP = {
+    'Current Status': 'current_status',
+    'Last Updated': 'last_updated',
+    'Analyzed On': 'analyzed_on',
+    'Applied On': 'applied_on',
+    'Fit Score': 'fit_score',
+    'Days in Process': 'days_in_process',
+    'Location': 'location',
+    'CV Version': 'cv_version',
+    'Cover Letter': 'cover_letter',
+}
+
+NOT_GENERATED = ('not generated', 'no')
+
+
+def extract_date(text: Optional[str]) -> Optional[str]:
+    """Return the first YYYY-MM-DD date found in text, if any"""
+    if not text:
+        return None
+    match = DATE_RE.search(text)
+    return match.group(0) if match else None
+
+
+def parse_date(text: Optional[str]) -> Optional[date]:
+    """The first YYYY-MM-DD in text as a date, None if there is none or it is invalid"""
+    found = extract_date(text)
+    if not found:
+        return None
+    try:
+        return date.fromisoformat(found)
+    except ValueError:
+        return None
+
+
+@dataclass
+class TimelineEvent:
+    """A single '### <Label> - <when>' entry from the status timeline"""
+    label: str
+    when: str
+
+    @property
+    def date(self) -> Optional[str]:
+        """Event date as YYYY-MM-DD (time of day dropped)"""
+        return extract_date(self.when)
+
+
+@dataclass
+class StatusRecord:
+    """Parsed contents of one status.md file"""
+    path: Path
+    company: Optional[str] = None
+    role: Optional[str] = None
+    current_status: Optional[str] = None
+    last_updated: Optional[str] = None
+    analyzed_on: Optional[str] = None
+    applied_on: Optional[str] = None
+    fit_score: Optional[float] = None
+    days_in_process: Optional[int] = None
+    location: Optional[str] = None
+    cv_version: Optional[str] = None
+    cover_letter: Optional[str] = None
+    timeline: List[TimelineEvent] = field(default_factory=list)
+
+    @property
+    def folder_name(self) -> str:
+        return self.path.parent.name
+
+    @property
+    def status(self) -> str:
+        """Normalized (lowercase) current status, 'unknown' if missing"""
+        return self.current_status.lower() if self.current_status else 'unknown'
+
+    @property
+    def cv_generated(self) -> bool:
+        return _is_generated(self.cv_version)
+
+    @property
+    def cover_letter_generated(self) -> bool:
+        return _is_generated(self.cover_letter)
+
+    def first_event(self, *labels: str) -> Optional[TimelineEvent]:
+        """First timeline event whose label matches one of labels (case-insensitive)"""
+        wanted = {label.lower() for label in labels}
+        for event in self.timeline:
+            if event.label.lower() in wanted:
+                return event
+        return None
+
+    def events_starting_with(self, prefix: str) -> List[TimelineEvent]:
+        """All timeline events whose label starts with prefix"""
+        return [event for event in self.timeline if event.label.startswith(prefix)]
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable form (used by the application index cache)"""
+        data = asdict(self)
+        data['path'] = str(self.path)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StatusRecord':
+        data = dict(data)
+        data['path'] = Path(data['path'])
+        data['timeline'] = [TimelineEvent(**event) for event in data.get('timeline', [])]
+        return cls(**data)
+
+
+def _is_generated(value: Optional[str]) -> bool:
+    if not value:
+        return False
+    return not value.lower().startswith(NOT_GENERATED)
+
+
+def parse_status_text(content: str, path: Path = Path("status.md")) -> StatusRecord:
+    """Tokenize status.md content in one pass over its lines"""
+    record = StatusRecord(path=path)
+    seen = set()
+
+    for line in content.splitlines():
+        if not line:
+            continue
+
+        first = line[0]
+
+        if first == '#':
+            if line.startswith('###'):
+                event_match = EVENT_RE.match(line)
+                if event_match:
+                    record.timeline.append(
+                        TimelineEvent(event_match.group(1).strip(), event_match.group(2))
+                    )
+            elif record.company is None and line.startswith('# Application Status'):
+                title_match = TITLE_RE.match(line)
+                if title_match:
+                    record.company = title_match.group(1).strip()
+                    record.role = title_match.group(2).strip()
+            continue
+
+        if '**' not in line:
+            continue
+
+        field_match = FIELD_RE.search(line)
+        if not field_match:
+            continue
+
+        attr = FIELD_MAP.get(field_match.group(1).strip())
+        if attr is None or attr in seen:
+            continue
+        seen.add(attr)
+
+        value = field_match.group(2).strip()
+        if attr == 'fit_score':
+            score_match = SCORE_RE.match(value)
+            if score_match:
+                try:
+                    record.fit_score = float(score_match.group(1))
+                except ValueError:
+                    pass
+        elif attr == 'days_in_process':
+            days_match = INT_RE.match(value)
+            if days_match:
+                record.days_in_process = int(days_match.group(1))
+        else:
+            setattr(record, attr, value)
+
+    return record
+
+
+def parse_status_file(status_path: Path) -> StatusRecord:
+    """Read and parse a status.md file (raises OSError if unreadable)"""
+    content = Path(status_path).read_text(encoding='utf-8')
+    return parse_status_text(content, Path(status_path))
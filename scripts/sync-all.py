@@ -4,12 +4,12 @@ System Sync Script - Parse all application status files
 Generates consolidated view of all applications
 """
 
-import os
-import re
 from datetime import datetime
 from pathlib import Path
 from collections import defaultdict
 
+from status_parser import parse_status_file as parse_status_file_record
+
 # Base directory
 BASE_DIR = Path(r"C:\Users\ArturSwadzba\OneDrive\4. CV")
 APPLICATIONS_DIR = BASE_DIR / "applications"
@@ -17,56 +17,32 @@ APPLICATIONS_DIR = BASE_DIR / "applications"
 def parse_status_file(status_path):
     """Parse a single status.md file and extract key information"""
     try:
-        with open(status_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        data = {
-            'folder': status_path.parent.name,
-            'path': str(status_path.parent)
-        }
-
-        # Extract company and role from first line
-        first_line_match = re.search(r'# Application Status - (.+?) - (.+?)$', content, re.MULTILINE)
-        if first_line_match:
-            data['company'] = first_line_match.group(1)
-            data['role'] = first_line_match.group(2)
-
-        # Extract current status
-        status_match = re.search(r'\*\*Current Status:\*\* (.+?)$', content, re.MULTILINE)
-        if status_match:
-            data['status'] = status_match.group(1).strip()
-
-        # Extract last updated
-        updated_match = re.search(r'\*\*Last Updated:\*\* (.+?)$', content, re.MULTILINE)
-        if updated_match:
-            data['last_updated'] = updated_match.group(1).strip()
-
-        # Extract applied date
-        applied_match = re.search(r'\*\*Applied On:\*\* (.+?)$', content, re.MULTILINE)
-        if applied_match:
-            data['applied_on'] = applied_match.group(1).strip()
-
-        # Extract fit score
-        fit_match = re.search(r'\*\*Fit Score:\*\* ([\d.]+)/10', content)
-        if fit_match:
-            data['fit_score'] = float(fit_match.group(1))
-
-        # Extract days in process
-        days_match = re.search(r'\*\*Days in Process:\*\* (\d+)', content)
-        if days_match:
-            data['days_in_process'] = int(days_match.group(1))
-
-        # Extract location
-        location_match = re.search(r'\*\*Location:\*\* (.+?)$', content, re.MULTILINE)
-        if location_match:
-            data['location'] = location_match.group(1).strip()
-
-        return data
-
+        record = parse_status_file_record(status_path)
     except Exception as e:
         print(f"Error parsing {status_path}: {e}")
         return None
 
+    data = {
+        'folder': status_path.parent.name,
+        'path': str(status_path.parent)
+    }
+
+    optional_fields = {
+        'company': record.company,
+        'role': record.role,
+        'status': record.current_status,
+        'last_updated': record.last_updated,
+        'applied_on': record.applied_on,
+        'fit_score': record.fit_score,
+        'days_in_process': record.days_in_process,
+        'location': record.location,
+    }
+    for key, value in optional_fields.items():
+        if value is not None:
+            data[key] = value
+
+    return data
+
 def calculate_days_since(date_str):
     """Calculate days since a date string"""
     try:
@@ -1,408 +1,240 @@
 #!/usr/bin/env python3
 """
 Sync script to aggregate all application status files and regenerate derived views.
-Parses all applications/*/status.md files and generates STATUS.md and metrics-dashboard.md
+Parses all applications/*/status.md files and generates STATUS.md and metrics-dashboard.md,
+plus a columnar snapshot of the parsed applications (insights/applications-snapshot.npz)
 """
 
-import os
-import re
+import argparse
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
+
+from status_parser import parse_status_file as parse_status_file_record
+from application_index import ApplicationIndex
+from archive_manifest import load_archive
+from application_record import FIELDS as APPLICATION_FIELDS, ApplicationRecord
+from application_snapshot import ApplicationSnapshot
+from metrics_engine import compute_metrics
+from dashboard_sections import SECTIONS, STATUS_REPORT, METRICS_REPORT
+from report_writer import SectionCache, render_report, write_report
 
 # Define base path
 BASE_PATH = Path(r"C:\Users\ArturSwadzba\OneDrive\4. CV")
 APPLICATIONS_PATH = BASE_PATH / "applications"
+INDEX_PATH = BASE_PATH / "insights" / ".application-index.jsonl"
+SNAPSHOT_PATH = BASE_PATH / "insights" / "applications-snapshot.npz"
 
 def parse_status_file(file_path):
     """Parse a status.md file and extract key metadata."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Extract metadata
-        data = {
-            'file_path': str(file_path),
-            'folder_name': file_path.parent.name,
-            'status': 'unknown',
-            'fit_score': None,
-            'last_updated': None,
-            'analyzed_date': None,
-            'company': None,
-            'role': None,
-            'location': None,
-            'days_waiting': 0,
-            'cv_generated': False,
-            'cover_letter_generated': False,
-            'applied_date': None,
-            'interview_dates': [],
-            'rejected_date': None,
-            'withdrawn_date': None,
-            'outcome': None
-        }
-
-        # Extract title (first line)
-        title_match = re.search(r'# Application Status - (.+?) - (.+?)$', content, re.MULTILINE)
-        if title_match:
-            data['company'] = title_match.group(1).strip()
-            data['role'] = title_match.group(2).strip()
-
-        # Extract current status
-        status_match = re.search(r'\*\*Current Status:\*\* (.+?)$', content, re.MULTILINE)
-        if status_match:
-            data['status'] = status_match.group(1).strip().lower()
-
-        # Extract last updated
-        updated_match = re.search(r'\*\*Last Updated:\*\* (.+?)$', content, re.MULTILINE)
-        if updated_match:
-            data['last_updated'] = updated_match.group(1).strip()
-
-        # Extract fit score
-        fit_match = re.search(r'\*\*Fit Score:\*\* ([\d\.]+)/10', content)
-        if fit_match:
-            data['fit_score'] = float(fit_match.group(1))
-
-        # Extract analyzed date
-        analyzed_match = re.search(r'\*\*Analyzed On:\*\* (.+?)$', content, re.MULTILINE)
-        if analyzed_match:
-            data['analyzed_date'] = analyzed_match.group(1).strip()
-
-        # Extract location
-        location_match = re.search(r'\*\*Location:\*\* (.+?)$', content, re.MULTILINE)
-        if location_match:
-            data['location'] = location_match.group(1).strip()
-
-        # Check CV/Cover Letter generation
-        data['cv_generated'] = bool(re.search(r'\*\*CV Version:\*\*.+?(?!Not generated)', content))
-        data['cover_letter_generated'] = bool(re.search(r'\*\*Cover Letter:\*\*.+?(?!Not generated|No)', content))
-
-        # Extract timeline events
-        if '### Applied -' in content:
-            applied_match = re.search(r'### Applied - (.+?)$', content, re.MULTILINE)
-            if applied_match:
-                data['applied_date'] = applied_match.group(1).strip()
-
-        if '### Withdrawn -' in content:
-            withdrawn_match = re.search(r'### Withdrawn - (.+?)$', content, re.MULTILINE)
-            if withdrawn_match:
-                data['withdrawn_date'] = withdrawn_match.group(1).strip()
-                data['status'] = 'withdrawn'
-
-        if '### Rejected -' in content:
-            rejected_match = re.search(r'### Rejected - (.+?)$', content, re.MULTILINE)
-            if rejected_match:
-                data['rejected_date'] = rejected_match.group(1).strip()
-                data['status'] = 'rejected'
-
-        # Interview dates
-        interview_matches = re.findall(r'### Interview .+ - (.+?)$', content, re.MULTILINE)
-        data['interview_dates'] = [m.strip() for m in interview_matches]
-
-        return data
-
+        record = parse_status_file_record(file_path)
     except Exception as e:
         print(f"Error parsing {file_path}: {e}")
         return None
 
-def calculate_metrics(applications):
-    """Calculate aggregate metrics from all applications."""
-    metrics = {
-        'total': len(applications),
-        'by_status': defaultdict(int),
-        'by_fit_score': defaultdict(int),
-        'avg_fit_score': 0,
-        'high_priority_count': 0,
-        'cv_generated_count': 0,
-        'cover_letter_count': 0,
-        'applied_count': 0,
-        'interview_count': 0,
-        'rejected_count': 0,
-        'withdrawn_count': 0,
-        'analysis_phase_count': 0,
-    }
-
-    fit_scores = []
-
-    for app in applications:
-        # Count by status
-        status = app['status']
-        metrics['by_status'][status] += 1
-
-        # Fit score stats
-        if app['fit_score']:
-            fit_scores.append(app['fit_score'])
-            score_bucket = f"{int(app['fit_score'])}-{int(app['fit_score'])+0.9}"
-            metrics['by_fit_score'][score_bucket] += 1
-
-            if app['fit_score'] >= 8:
-                metrics['high_priority_count'] += 1
-
-        # CV/CL tracking
-        if app['cv_generated']:
-            metrics['cv_generated_count'] += 1
-        if app['cover_letter_generated']:
-            metrics['cover_letter_count'] += 1
-
-        # Pipeline stages
-        if app['applied_date']:
-            metrics['applied_count'] += 1
-        if app['interview_dates']:
-            metrics['interview_count'] += 1
-        if app['rejected_date']:
-            metrics['rejected_count'] += 1
-        if app['withdrawn_date']:
-            metrics['withdrawn_count'] += 1
-        if 'analysis' in status:
-            metrics['analysis_phase_count'] += 1
-
-    # Calculate averages
-    if fit_scores:
-        metrics['avg_fit_score'] = round(sum(fit_scores) / len(fit_scores), 2)
+    return application_from_record(record)
 
-    return metrics
+def application_from_record(record):
+    """Convert a parsed status record into the ApplicationRecord used by the dashboards."""
+    return ApplicationRecord.from_status_record(record)
+
+def calculate_metrics(applications, snapshot=None):
+    """Calculate aggregate metrics from all applications (one pass over the snapshot columns)."""
+    if snapshot is None:
+        snapshot = ApplicationSnapshot.from_applications(applications)
+    return compute_metrics(snapshot, applications)
 
 def generate_status_md(applications, metrics):
     """Generate the STATUS.md file content."""
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-    content = f"""# Application Status Dashboard
-
-**Last Updated:** {now}
-**Total Applications:** {metrics['total']}
-
----
-
-## Quick Stats
-
-| Metric | Count |
-|--------|-------|
-| **Total Applications** | {metrics['total']} |
-| **Analysis Phase** | {metrics['analysis_phase_count']} |
-| **Applied** | {metrics['applied_count']} |
-| **In Interview Process** | {metrics['interview_count']} |
-| **Rejected** | {metrics['rejected_count']} |
-| **Withdrawn** | {metrics['withdrawn_count']} |
-| **High Priority (8+ fit)** | {metrics['high_priority_count']} |
-| **Average Fit Score** | {metrics['avg_fit_score']}/10 |
-
----
-
-## Applications by Status
-
-"""
-
-    # Group by status
-    apps_by_status = defaultdict(list)
-    for app in applications:
-        apps_by_status[app['status']].append(app)
-
-    # Analysis Phase
-    if apps_by_status['analysis phase']:
-        content += f"### Analysis Phase ({len(apps_by_status['analysis phase'])})\n\n"
-        for app in sorted(apps_by_status['analysis phase'], key=lambda x: x.get('fit_score', 0), reverse=True):
-            fit = f"{app['fit_score']}/10" if app['fit_score'] else "N/A"
-            content += f"- **{app['company']} - {app['role']}** (Fit: {fit})\n"
-            content += f"  - Analyzed: {app['analyzed_date']}\n"
-            if app['location']:
-                content += f"  - Location: {app['location']}\n"
-        content += "\n"
-
-    # Applied
-    if apps_by_status.get('applied'):
-        content += f"### Applied ({len(apps_by_status['applied'])})\n\n"
-        for app in apps_by_status['applied']:
-            fit = f"{app['fit_score']}/10" if app['fit_score'] else "N/A"
-            content += f"- **{app['company']} - {app['role']}** (Fit: {fit})\n"
-            if app['applied_date']:
-                content += f"  - Applied: {app['applied_date']}\n"
-        content += "\n"
-
-    # Withdrawn
-    if apps_by_status.get('withdrawn'):
-        content += f"### Withdrawn ({len(apps_by_status['withdrawn'])})\n\n"
-        for app in apps_by_status['withdrawn']:
-            fit = f"{app['fit_score']}/10" if app['fit_score'] else "N/A"
-            content += f"- **{app['company']} - {app['role']}** (Fit: {fit})\n"
-            if app['withdrawn_date']:
-                content += f"  - Withdrawn: {app['withdrawn_date']}\n"
-        content += "\n"
-
-    # Rejected
-    if apps_by_status.get('rejected'):
-        content += f"### Rejected ({len(apps_by_status['rejected'])})\n\n"
-        for app in apps_by_status['rejected']:
-            fit = f"{app['fit_score']}/10" if app['fit_score'] else "N/A"
-            content += f"- **{app['company']} - {app['role']}** (Fit: {fit})\n"
-            if app['rejected_date']:
-                content += f"  - Rejected: {app['rejected_date']}\n"
-        content += "\n"
-
-    content += "---\n\n## High Priority Applications (8+ Fit)\n\n"
-
-    high_priority = [app for app in applications if app.get('fit_score') and app['fit_score'] >= 8]
-    high_priority.sort(key=lambda x: x.get('fit_score') or 0, reverse=True)
-
-    if high_priority:
-        for app in high_priority:
-            content += f"### {app['company']} - {app['role']} ({app['fit_score']}/10)\n\n"
-            content += f"- **Status:** {app['status'].title()}\n"
-            content += f"- **Location:** {app.get('location', 'N/A')}\n"
-            content += f"- **Analyzed:** {app.get('analyzed_date', 'N/A')}\n"
-            content += f"- **CV Generated:** {'Yes' if app['cv_generated'] else 'No'}\n"
-            content += f"- **Cover Letter:** {'Yes' if app['cover_letter_generated'] else 'No'}\n"
-            content += "\n"
-    else:
-        content += "*No high-priority applications currently.*\n\n"
-
-    return content
+    return "".join(render_report(SECTIONS, STATUS_REPORT, applications, metrics))
 
 def generate_metrics_dashboard(applications, metrics):
     """Generate the metrics-dashboard.md file content."""
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-    content = f"""# Job Application Metrics Dashboard
-
-**Generated:** {now}
-**Data Source:** {metrics['total']} application folders in `applications/*/status.md`
-
----
-
-## Summary KPIs
+    return "".join(render_report(SECTIONS, METRICS_REPORT, applications, metrics))
 
-| KPI | Value | Notes |
-|-----|-------|-------|
-| **Total Applications Tracked** | {metrics['total']} | All applications in system |
-| **Average Fit Score** | {metrics['avg_fit_score']}/10 | Based on {len([a for a in applications if a['fit_score']])} scored applications |
-| **High Priority (8+ fit)** | {metrics['high_priority_count']} | Applications worth pursuing |
-| **Analysis Phase** | {metrics['analysis_phase_count']} | Analyzed but not yet applied |
-| **Applied** | {metrics['applied_count']} | Submitted applications |
-| **In Interview Process** | {metrics['interview_count']} | Active interview pipelines |
-| **Rejected** | {metrics['rejected_count']} | Explicit rejections |
-| **Withdrawn** | {metrics['withdrawn_count']} | Self-withdrawn after analysis |
+def find_status_files():
+    """All status.md files in the hierarchical active/ and archive/ structure."""
+    status_files = set(APPLICATIONS_PATH.glob("active/*/*/status.md"))
+    status_files.update(APPLICATIONS_PATH.glob("archive/*/*/*/status.md"))
+    return sorted(status_files)
 
----
-
-## Conversion Funnel
-
-```
-Applications Analyzed ({metrics['total']})
-    ↓
-High Priority 8+ fit ({metrics['high_priority_count']})
-    ↓
-CVs Generated ({metrics['cv_generated_count']})
-    ↓
-Applications Submitted ({metrics['applied_count']})
-    ↓
-Interviews ({metrics['interview_count']})
-```
-
-**Conversion Rates:**
-- Analysis → High Priority: {round(metrics['high_priority_count']/metrics['total']*100, 1) if metrics['total'] > 0 else 0}%
-- High Priority → Applied: {round(metrics['applied_count']/metrics['high_priority_count']*100, 1) if metrics['high_priority_count'] > 0 else 0}%
-- Applied → Interview: {round(metrics['interview_count']/metrics['applied_count']*100, 1) if metrics['applied_count'] > 0 else 0}%
-
----
+def is_application_status_file(path):
+    """True for active/<status>/<folder>/status.md and archive/<quarter>/<outcome>/<folder>/status.md."""
+    try:
+        parts = path.relative_to(APPLICATIONS_PATH).parts
+    except ValueError:
+        return False
+    if not parts or parts[-1] != "status.md":
+        return False
+    return (parts[0] == "active" and len(parts) == 4) or (parts[0] == "archive" and len(parts) == 5)
+
+def write_dashboards(records, cache=None, changed_fields=None):
+    """
+    Regenerate STATUS.md and metrics-dashboard.md from parsed status records.
+
+    With a SectionCache, only sections reading one of changed_fields (or a
+    metric whose value changed) are re-rendered; changed_fields=None
+    re-renders every section.
+    """
+    applications = [application_from_record(record) for record in records]
+
+    # Calculate metrics (archive history from the per-quarter manifests)
+    snapshot = ApplicationSnapshot.from_applications(applications)
+    metrics = calculate_metrics(applications, snapshot)
+    metrics['archive_quarters'] = load_archive(APPLICATIONS_PATH / "archive")
+    print(f"Calculated metrics: {metrics['total']} total, {metrics['high_priority_count']} high priority")
 
-## Applications by Fit Score
+    # Generate STATUS.md and metrics-dashboard.md (sections are streamed to a
+    # temp file; the target is only replaced if its content changed)
+    for path, report in ((BASE_PATH / "STATUS.md", STATUS_REPORT),
+                         (BASE_PATH / "insights" / "metrics-dashboard.md", METRICS_REPORT)):
+        if cache is not None:
+            chunks = cache.render(report, applications, metrics, changed_fields)
+        else:
+            chunks = render_report(SECTIONS, report, applications, metrics)
+        if write_report(path, chunks):
+            print(f"[OK] Generated {path}")
+        else:
+            print(f"[OK] Unchanged {path}")
+
+    # Columnar export for ad-hoc analytics (see application_snapshot.py)
+    if snapshot.save(SNAPSHOT_PATH):
+        print(f"[OK] Exported {SNAPSHOT_PATH}")
+    else:
+        print(f"[OK] Unchanged {SNAPSHOT_PATH}")
 
-"""
+    return metrics
 
-    # Fit score distribution
-    fit_distribution = defaultdict(int)
-    for app in applications:
-        if app['fit_score']:
-            bucket = int(app['fit_score'])
-            fit_distribution[bucket] += 1
-
-    content += "| Score Range | Count | Bar |\n"
-    content += "|-------------|-------|-----|\n"
-    for score in sorted(fit_distribution.keys(), reverse=True):
-        bar = "█" * fit_distribution[score]
-        content += f"| {score}-{score}.9 | {fit_distribution[score]} | {bar} |\n"
-
-    content += f"\n---\n\n## Applications by Status\n\n"
-
-    status_counts = sorted(metrics['by_status'].items(), key=lambda x: x[1], reverse=True)
-    content += "| Status | Count |\n"
-    content += "|--------|-------|\n"
-    for status, count in status_counts:
-        content += f"| {status.title()} | {count} |\n"
-
-    content += f"\n---\n\n## Recent Activity (Last 7 Days)\n\n"
-
-    # Find recent applications (analyzed in last 7 days)
-    recent = []
-    today = datetime.now()
-    for app in applications:
-        if app['analyzed_date']:
+def apply_changes(index, records, changed_paths):
+    """
+    Update the record map (status.md path -> record) for a batch of changed paths.
+
+    Only the affected application folders are re-scanned; a changed directory
+    (folder created, moved between status folders, deleted) re-scans that subtree.
+    Returns the number of records added, updated or removed.
+    """
+    folders = set()
+    for path in changed_paths:
+        if path.suffix == ".md":
+            folders.add(path.parent)
+        else:
+            folders.add(path)
+
+    # A folder inside another changed folder is covered by the outer scan
+    roots = [folder for folder in folders
+             if not any(other != folder and other in folder.parents for other in folders)]
+
+    changes = 0
+    for root in roots:
+        # Drop records at or below the changed folder, then re-add what still exists
+        removed = {status_file for status_file in records
+                   if status_file.parent == root or root in status_file.parents}
+        if root.is_dir():
+            candidates = [root / "status.md"] if (root / "status.md").is_file() else root.rglob("status.md")
+            current = {status_file for status_file in candidates if is_application_status_file(status_file)}
+        else:
+            current = set()
+
+        for status_file in removed - current:
+            del records[status_file]
+            index.discard(status_file)
+            changes += 1
+
+        for status_file in sorted(current):
             try:
-                analyzed = datetime.strptime(app['analyzed_date'], "%Y-%m-%d")
-                days_ago = (today - analyzed).days
-                if days_ago <= 7:
-                    recent.append((app, days_ago))
-            except:
-                pass
-
-    if recent:
-        recent.sort(key=lambda x: x[1])
-        for app, days_ago in recent:
-            fit = f"{app['fit_score']}/10" if app['fit_score'] else "N/A"
-            content += f"- **{app['company']} - {app['role']}** (Fit: {fit}) - {days_ago} days ago\n"
-    else:
-        content += "*No activity in last 7 days.*\n"
+                record = index.refresh_one(status_file)
+            except Exception as e:
+                print(f"Error parsing {status_file}: {e}")
+                continue
+            if records.get(status_file) != record:
+                records[status_file] = record
+                changes += 1
+
+    return changes
+
+def changed_fields(before, after):
+    """
+    Application fields that differ between two record maps (status.md path -> record).
+
+    None when applications were added, removed or moved: every section is affected.
+    """
+    if before.keys() != after.keys():
+        return None
+    fields = set()
+    for status_file, record in after.items():
+        previous = before[status_file]
+        if previous is record or previous == record:
+            continue
+        old, new = application_from_record(previous), application_from_record(record)
+        fields.update(field for field in APPLICATION_FIELDS if old[field] != new[field])
+    return fields
 
-    content += f"\n---\n\n## Top 10 Applications by Fit Score\n\n"
+def watch(index, records, force_polling=False, interval=2.0, debounce=1.0, cache=None):
+    """Keep the dashboards current, reparsing only folders that changed and
+    re-rendering only the dashboard sections those changes affect."""
+    from tree_watcher import create_watcher, watch_batches
 
-    top_apps = sorted([a for a in applications if a['fit_score']],
-                     key=lambda x: x['fit_score'], reverse=True)[:10]
+    cache = cache or SectionCache(SECTIONS)
 
-    content += "| Rank | Company | Role | Fit | Status | Location |\n"
-    content += "|------|---------|------|-----|--------|----------|\n"
-    for i, app in enumerate(top_apps, 1):
-        content += f"| {i} | {app['company']} | {app['role']} | {app['fit_score']}/10 | {app['status'].title()} | {app.get('location', 'N/A')} |\n"
+    watcher = create_watcher(APPLICATIONS_PATH, force_polling=force_polling, interval=interval)
+    print(f"\nWatching {APPLICATIONS_PATH} ({watcher.name}). Press Ctrl+C to stop.")
 
-    return content
+    try:
+        for changed_paths in watch_batches(watcher, debounce=debounce):
+            before = dict(records)
+            if APPLICATIONS_PATH in changed_paths:
+                # Watcher lost track (e.g. event queue overflow): rescan everything
+                records.clear()
+                records.update((record.path, record) for record in index.refresh(find_status_files()))
+                changes = len(records)
+            else:
+                changes = apply_changes(index, records, changed_paths)
+
+            if not changes:
+                continue
+
+            index.save()
+            timestamp = datetime.now().strftime('%H:%M:%S')
+            print(f"\n[{timestamp}] {changes} application(s) changed, updating dashboards")
+            fields = changed_fields(before, records)
+            rendered, reused = cache.rendered, cache.reused
+            write_dashboards([records[status_file] for status_file in sorted(records)], cache, fields)
+            print(f"[OK] {cache.rendered - rendered} section(s) rendered, {cache.reused - reused} reused")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+    finally:
+        watcher.close()
 
 def main():
     """Main sync function."""
+    parser = argparse.ArgumentParser(description='Regenerate STATUS.md and metrics-dashboard.md from status files')
+    parser.add_argument('--rebuild', action='store_true', help='Ignore the application index and reparse every status.md')
+    parser.add_argument('--watch', action='store_true', help='Keep running and update the dashboards when applications change')
+    parser.add_argument('--poll', action='store_true', help='With --watch: poll the tree instead of using inotify')
+    parser.add_argument('--interval', type=float, default=2.0, help='Polling interval in seconds (default: 2)')
+    parser.add_argument('--debounce', type=float, default=1.0, help='Seconds of quiet before a burst of edits is applied (default: 1)')
+    args = parser.parse_args()
+
     print("Starting sync process...")
     print(f"Scanning {APPLICATIONS_PATH}")
 
     # Find all status.md files in new hierarchical structure
-    status_files = []
-    status_files.extend(APPLICATIONS_PATH.glob("active/*/*/status.md"))
-    status_files.extend(APPLICATIONS_PATH.glob("archive/*/*/*/status.md"))
-
-    # Convert to list and remove duplicates
-    status_files = list(set(status_files))
+    status_files = find_status_files()
     print(f"Found {len(status_files)} application folders")
 
-    # Parse all status files
-    applications = []
-    for status_file in status_files:
-        data = parse_status_file(status_file)
-        if data:
-            applications.append(data)
-
-    print(f"Successfully parsed {len(applications)} applications")
-
-    # Calculate metrics
-    metrics = calculate_metrics(applications)
-    print(f"Calculated metrics: {metrics['total']} total, {metrics['high_priority_count']} high priority")
+    # Parse changed status files (unchanged folders come from the index)
+    if args.rebuild:
+        index = ApplicationIndex(INDEX_PATH, APPLICATIONS_PATH)
+    else:
+        index = ApplicationIndex.load(INDEX_PATH, APPLICATIONS_PATH)
+    records = index.refresh(status_files)
+    index.save()
 
-    # Generate STATUS.md
-    status_content = generate_status_md(applications, metrics)
-    status_path = BASE_PATH / "STATUS.md"
-    with open(status_path, 'w', encoding='utf-8') as f:
-        f.write(status_content)
-    print(f"[OK] Generated {status_path}")
+    print(f"Successfully parsed {len(records)} applications "
+          f"({index.reparsed} reparsed, {index.reused} from index)")
 
-    # Generate metrics-dashboard.md
-    metrics_content = generate_metrics_dashboard(applications, metrics)
-    metrics_path = BASE_PATH / "insights" / "metrics-dashboard.md"
-    with open(metrics_path, 'w', encoding='utf-8') as f:
-        f.write(metrics_content)
-    print(f"[OK] Generated {metrics_path}")
+    cache = SectionCache(SECTIONS)
+    metrics = write_dashboards(records, cache)
 
     print("\n=== Sync Complete ===")
     print(f"Total applications: {metrics['total']}")
@@ -414,5 +246,9 @@ def main():
     print(f"Rejected: {metrics['rejected_count']}")
     print(f"Average fit score: {metrics['avg_fit_score']}/10")
 
+    if args.watch:
+        watch(index, {record.path: record for record in records},
+              force_polling=args.poll, interval=args.interval, debounce=args.debounce, cache=cache)
+
 if __name__ == "__main__":
     main()
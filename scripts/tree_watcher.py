@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+File tree watcher for long-running sync modes
+
+Reports which paths changed under a directory tree, in debounced batches:
+- InotifyWatcher: Linux inotify via ctypes (no external dependencies)
+- PollingWatcher: portable fallback that diffs (mtime, size) snapshots
+
+Usage:
+    from tree_watcher import create_watcher, watch_batches
+    watcher = create_watcher(applications_path)
+    for changed_paths in watch_batches(watcher, debounce=1.0):
+        ...
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+
+# Files whose changes matter to the dashboards
+WATCHED_FILES = ('status.md', 'analysis.md', 'job-description.md')
+
+# inotify constants (from <sys/inotify.h>)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0x00000800
+IN_CLOEXEC = 0x00080000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class PollingWatcher:
+    """Detect changes by periodically diffing a stat snapshot of the tree"""
+
+    name = 'polling'
+
+    def __init__(self, root: Path, interval: float = 2.0):
+        self.root = root
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename not in WATCHED_FILES:
+                    continue
+                path = Path(dirpath) / filename
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout: Optional[float]) -> Set[Path]:
+        """Wait up to timeout seconds (None = until something changes) for changes"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.interval
+            if deadline is not None:
+                wait = min(wait, max(0.0, deadline - time.monotonic()))
+            time.sleep(wait)
+
+            current = self._scan()
+            changed = {
+                path for path in current.keys() | self.snapshot.keys()
+                if current.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = current
+
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Recursive inotify watcher (Linux only)"""
+
+    name = 'inotify'
+
+    def __init__(self, root: Path):
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.root = root
+        self.watches: Dict[int, Path] = {}
+        self._add_tree(root)
+
+    def _add_watch(self, directory: Path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            # Directory vanished before we could watch it: nothing to do
+            if errno not in (2, 20):
+                raise OSError(errno, f"inotify_add_watch failed for {directory}")
+            return
+        self.watches[wd] = directory
+
+    def _add_tree(self, directory: Path) -> Set[Path]:
+        """Watch directory and all subdirectories; return watched files found inside"""
+        found = set()
+        for dirpath, _, filenames in os.walk(directory):
+            self._add_watch(Path(dirpath))
+            found.update(Path(dirpath) / name for name in filenames if name in WATCHED_FILES)
+        return found
+
+    def _read_events(self) -> Set[Path]:
+        changed = set()
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # Kernel queue overflowed: report the whole tree as changed
+                changed.add(self.root)
+                continue
+
+            directory = self.watches.get(wd)
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            if directory is None:
+                continue
+
+            if not name:
+                # Event on the watched directory itself (deleted / moved away)
+                changed.add(directory)
+                continue
+
+            path = directory / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                changed.add(path)
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    changed.update(self._add_tree(path))
+            elif path.name in WATCHED_FILES:
+                changed.add(path)
+
+        return changed
+
+    def poll(self, timeout: Optional[float]) -> Set[Path]:
+        """Wait up to timeout seconds (None = until something changes) for changes"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self.fd], [], [], wait)
+            changed = self._read_events() if readable else set()
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def create_watcher(root: Path, force_polling: bool = False, interval: float = 2.0):
+    """inotify on Linux when available, polling everywhere else"""
+    if not force_polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            print(f"inotify unavailable ({e}), falling back to polling")
+    return PollingWatcher(root, interval=interval)
+
+
+def watch_batches(watcher, debounce: float = 1.0) -> Iterator[Set[Path]]:
+    """
+    Yield sets of changed paths, one per burst of edits.
+
+    A batch is emitted once no further change arrived for `debounce` seconds,
+    so a command that rewrites several files triggers a single update.
+    """
+    while True:
+        pending = watcher.poll(None)
+        while True:
+            more = watcher.poll(debounce)
+            if not more:
+                break
+            pending |= more
+        yield pending
@@ -5,9 +5,10 @@ Usage: python scripts/validate-cv.py path/to/CV.pdf path/to/CV.md
 """
 
 import sys
-import subprocess
 import os
 
+from pdf_metadata import get_pdf_info
+
 def validate_cv(pdf_path, md_path=None):
     results = {
         'passed': [],
@@ -22,19 +23,18 @@ def validate_cv(pdf_path, md_path=None):
 
     results['passed'].append(f"✅ File exists: {os.path.basename(pdf_path)}")
 
+    # PDF metadata is read once (in-process, pdfinfo only as a fallback)
+    pdf_info = get_pdf_info(pdf_path)
+
     # Check 2: Page count
-    try:
-        output = subprocess.check_output(['pdfinfo', pdf_path], text=True, stderr=subprocess.DEVNULL)
-        for line in output.split('\n'):
-            if 'Pages:' in line:
-                pages = int(line.split(':')[1].strip())
-                if pages <= 2:
-                    results['passed'].append(f"✅ Page count: {pages} page(s) (target: ≤2)")
-                else:
-                    results['failed'].append(f"❌ Page count: {pages} pages (MUST be ≤2)")
-                break
-    except Exception as e:
-        results['warnings'].append(f"⚠️  Could not check page count: {e}")
+    if pdf_info is None:
+        results['warnings'].append("⚠️  Could not check page count: PDF metadata unavailable")
+    elif pdf_info.pages is not None:
+        pages = pdf_info.pages
+        if pages <= 2:
+            results['passed'].append(f"✅ Page count: {pages} page(s) (target: ≤2)")
+        else:
+            results['failed'].append(f"❌ Page count: {pages} pages (MUST be ≤2)")
 
     # Check 3: File size
     try:
@@ -52,17 +52,14 @@ def validate_cv(pdf_path, md_path=None):
         results['failed'].append(f"❌ Could not check file size: {e}")
 
     # Check 4: Paper size
-    try:
-        output = subprocess.check_output(['pdfinfo', pdf_path], text=True, stderr=subprocess.DEVNULL)
-        for line in output.split('\n'):
-            if 'Page size:' in line:
-                if '595' in line and '841' in line:  # A4 dimensions
-                    results['passed'].append(f"✅ Paper size: A4 (595 x 842 pts)")
-                else:
-                    results['failed'].append(f"❌ Paper size: {line.split(':')[1].strip()} (expected: A4)")
-                break
-    except Exception as e:
-        results['warnings'].append(f"⚠️  Could not check paper size: {e}")
+    if pdf_info is None:
+        results['warnings'].append("⚠️  Could not check paper size: PDF metadata unavailable")
+    elif pdf_info.width is not None and pdf_info.height is not None:
+        if pdf_info.paper_name == 'A4':
+            results['passed'].append(f"✅ Paper size: A4 (595 x 842 pts)")
+        else:
+            results['failed'].append(
+                f"❌ Paper size: {pdf_info.width:g} x {pdf_info.height:g} pts (expected: A4)")
 
     # Check 5: Word count (if markdown provided)
     if md_path and os.path.exists(md_path):
@@ -3,15 +3,25 @@
 """
 CV Format Validation Script
 Validates CV PDF formatting against master CV standards
-Usage: python validate-cv.py <path-to-cv.pdf> [<path-to-markdown.md>]
+Usage: python validate-cv.py <path-to-cv.pdf> [<path-to-markdown.md>] [--force]
+       python validate-cv.py --batch [<folder>] [--jobs N] [--json PATH] [--junit PATH]
+
+Results are cached by PDF content hash (insights/.validation-cache.json);
+unchanged PDFs are not re-checked unless --force is given.
 """
 
+import argparse
 import sys
 import os
-import subprocess
 import re
 from pathlib import Path
 
+# Shared modules live in scripts/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from pdf_metadata import pdfinfo_text
+from validation_cache import VALIDATION_CACHE_PATH, ValidationCache, capture_output
+import validation_batch
+
 # Set UTF-8 encoding for Windows console
 if sys.platform == 'win32':
     import codecs
@@ -26,6 +36,10 @@ TARGET_MIN_SIZE_KB = 60
 TARGET_MAX_SIZE_KB = 80
 EXPECTED_WIDTH = 595
 EXPECTED_HEIGHT = 842
+MASTER_CV_PATH = "master/ArturSwadzba_MasterCV.pdf"
+
+# Bump when checks or thresholds change (invalidates cached results)
+VALIDATOR_VERSION = 1
 
 # ANSI color codes
 class Colors:
@@ -57,15 +71,8 @@ def print_skip(msg):
     print(f"{Colors.YELLOW}⚠️  SKIP:{Colors.NC} {msg}")
 
 def get_pdf_info(pdf_path):
-    """Get PDF metadata using pdfinfo"""
-    try:
-        result = subprocess.run(['pdfinfo', pdf_path],
-                              capture_output=True, text=True, timeout=10)
-        if result.returncode == 0:
-            return result.stdout
-        return None
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return None
+    """Get PDF metadata as pdfinfo-style text (read in-process, pdfinfo as fallback)"""
+    return pdfinfo_text(pdf_path)
 
 def check_file_existence(pdf_path):
     """Check 1: File existence"""
@@ -251,7 +258,7 @@ def check_master_comparison(pdf_info):
     """Check 7: Comparison with master CV"""
     print(f"{Colors.BLUE}[7/7]{Colors.NC} Comparing with master CV...")
 
-    master_cv_path = "master/ArturSwadzba_MasterCV.pdf"
+    master_cv_path = MASTER_CV_PATH
 
     if not os.path.exists(master_cv_path):
         print_skip(f"Master CV not found at: {master_cv_path}")
@@ -291,26 +298,8 @@ def check_master_comparison(pdf_info):
     print()
     return 0, 0, 0
 
-def main():
-    print_header()
-
-    if len(sys.argv) < 2:
-        print(f"{Colors.RED}❌ ERROR: No PDF file specified{Colors.NC}")
-        print(f"Usage: {sys.argv[0]} <path-to-cv.pdf> [<path-to-markdown.md>]")
-        sys.exit(1)
-
-    pdf_path = sys.argv[1]
-    md_path = sys.argv[2] if len(sys.argv) > 2 else None
-
-    if not os.path.exists(pdf_path):
-        print(f"{Colors.RED}❌ ERROR: PDF file not found: {pdf_path}{Colors.NC}")
-        sys.exit(1)
-
-    print(f"{Colors.BLUE}Validating:{Colors.NC} {pdf_path}")
-    print()
-    print(f"{Colors.BLUE}Running validation checks...{Colors.NC}")
-    print()
-
+def run_checks(pdf_path, md_path):
+    """Run all checks; returns (pass, fail, warn) counts or None if the PDF is missing"""
     # Get PDF info once
     pdf_info = get_pdf_info(pdf_path)
 
@@ -322,7 +311,7 @@ def main():
     # Check 1: File existence
     success, p, f, w = check_file_existence(pdf_path)
     if not success:
-        sys.exit(1)
+        return None
     pass_count += p; fail_count += f; warn_count += w
 
     # Check 2: File size
@@ -349,6 +338,70 @@ def main():
     p, f, w = check_master_comparison(pdf_info)
     pass_count += p; fail_count += f; warn_count += w
 
+    return pass_count, fail_count, warn_count
+
+def cache_key(pdf_path, md_path):
+    """Validation cache key: validator version plus the content of every input"""
+    return ValidationCache.key_for('validate-cv', VALIDATOR_VERSION, pdf_path, md_path, MASTER_CV_PATH)
+
+def run_cached_checks(pdf_path, md_path, force=False, cache_path=VALIDATION_CACHE_PATH):
+    """Run checks, replaying the cached report if the PDF and its inputs are unchanged"""
+    cache = ValidationCache.load(cache_path)
+    key = cache_key(pdf_path, md_path)
+
+    cached = None if force else cache.get(pdf_path, key)
+    if cached is not None:
+        sys.stdout.write(cached.output)
+        print_info(f"PDF unchanged since {cached.validated} - cached result (use --force to re-check)")
+        print()
+        return cached.counts
+
+    counts, output = capture_output(run_checks, pdf_path, md_path)
+    if counts is not None:
+        cache.put(pdf_path, key, counts, output)
+        cache.save()
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate CV PDF formatting')
+    parser.add_argument('pdf_path', nargs='?', help='Path to the CV PDF')
+    parser.add_argument('md_path', nargs='?', help='Path to the CV markdown source')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-check even if the PDF is unchanged since the last validation')
+    parser.add_argument('--batch', nargs='?', type=Path, const=validation_batch.DEFAULT_ROOT, metavar='ROOT',
+                        help='Validate all CVs under ROOT (default: applications/) in parallel')
+    validation_batch.add_batch_arguments(parser)
+    args = parser.parse_args()
+
+    if args.batch:
+        sys.exit(validation_batch.run_batch(args.batch, ['cv'], jobs=args.jobs, force=args.force,
+                                            json_path=args.json, junit_path=args.junit,
+                                            verbose=args.verbose))
+
+    print_header()
+
+    if not args.pdf_path:
+        print(f"{Colors.RED}❌ ERROR: No PDF file specified{Colors.NC}")
+        print(f"Usage: {sys.argv[0]} <path-to-cv.pdf> [<path-to-markdown.md>] [--force]")
+        sys.exit(1)
+
+    pdf_path = args.pdf_path
+    md_path = args.md_path
+
+    if not os.path.exists(pdf_path):
+        print(f"{Colors.RED}❌ ERROR: PDF file not found: {pdf_path}{Colors.NC}")
+        sys.exit(1)
+
+    print(f"{Colors.BLUE}Validating:{Colors.NC} {pdf_path}")
+    print()
+    print(f"{Colors.BLUE}Running validation checks...{Colors.NC}")
+    print()
+
+    counts = run_cached_checks(pdf_path, md_path, force=args.force)
+    if counts is None:
+        sys.exit(1)
+    pass_count, fail_count, warn_count = counts
+
     # Print summary
     print(f"{Colors.BLUE}========================================{Colors.NC}")
     print(f"{Colors.BLUE}   VALIDATION SUMMARY{Colors.NC}")
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Batch PDF validation across the applications tree
+
+Discovers every *_CV_*.pdf and *_CoverLetter_*.pdf (with its markdown source
+of the same name), validates them in a process pool using the checks from
+scripts/validation/, and prints one coloured summary. Results can also be
+written as JSON and JUnit XML for CI and audits.
+
+Unchanged PDFs are served from the validation cache (see validation_cache.py)
+without being dispatched to a worker.
+
+Usage:
+    python scripts/validation_batch.py [root] [--jobs N] [--json report.json] [--junit report.xml] [--force]
+    python scripts/validation/validate-cv.py --batch [root]            # CVs only
+    python scripts/validation/validate-cover-letter.py --batch [root]  # cover letters only
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence
+
+from report_writer import write_report
+from validation_cache import VALIDATION_CACHE_PATH, ValidationCache
+
+
+BASE_PATH = Path(__file__).resolve().parent.parent
+VALIDATION_PATH = Path(__file__).resolve().parent / "validation"
+DEFAULT_ROOT = BASE_PATH / "applications"
+
+# kind -> (module name, validator script, PDF pattern)
+VALIDATORS = {
+    'cv': ('validate_cv', 'validate-cv.py', '*_CV_*.pdf'),
+    'cover-letter': ('validate_cover_letter', 'validate-cover-letter.py', '*_CoverLetter_*.pdf'),
+}
+
+ANSI_ESCAPE_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+
+class Colors:
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[1;33m'
+    BLUE = '\033[0;34m'
+    NC = '\033[0m'  # No Color
+
+
+@dataclass
+class Artifact:
+    """A PDF to validate and its markdown source"""
+    kind: str
+    pdf_path: str
+    md_path: Optional[str]
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating one artifact"""
+    kind: str
+    pdf_path: str
+    md_path: Optional[str]
+    passed: int
+    failed: int
+    warnings: int
+    cached: bool
+    output: str
+
+    @property
+    def status(self) -> str:
+        if self.failed:
+            return 'failed'
+        return 'warning' if self.warnings else 'passed'
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data['status'] = self.status
+        data['output'] = strip_ansi(self.output)
+        return data
+
+
+def strip_ansi(text: str) -> str:
+    return ANSI_ESCAPE_RE.sub('', text)
+
+
+def load_validator(kind: str):
+    """Import a validator script from scripts/validation/ (once per process)"""
+    module_name, script, _ = VALIDATORS[kind]
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, VALIDATION_PATH / script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+    return sys.modules[module_name]
+
+
+def discover(root: Path, kinds: Iterable[str] = tuple(VALIDATORS)) -> List[Artifact]:
+    """Find all CV / cover letter PDFs under root, paired with <stem>.md if present"""
+    artifacts = []
+    for kind in kinds:
+        pattern = VALIDATORS[kind][2]
+        for pdf_path in sorted(Path(root).rglob(pattern)):
+            md_path = pdf_path.with_suffix('.md')
+            artifacts.append(Artifact(kind, str(pdf_path), str(md_path) if md_path.exists() else None))
+    return artifacts
+
+
+def validate_artifact(artifact: Artifact) -> ValidationResult:
+    """Run one validator with its console output captured (runs in a worker)"""
+    validator = load_validator(artifact.kind)
+    output = io.StringIO()
+    with redirect_stdout(output):
+        counts = validator.run_checks(artifact.pdf_path, artifact.md_path)
+    passed, failed, warnings = counts if counts is not None else (0, 1, 0)
+    return ValidationResult(artifact.kind, artifact.pdf_path, artifact.md_path,
+                            passed, failed, warnings, False, output.getvalue())
+
+
+def validate_all(artifacts: Sequence[Artifact], jobs: int = None, force: bool = False,
+                 cache_path: Path = VALIDATION_CACHE_PATH) -> List[ValidationResult]:
+    """Validate artifacts in a process pool; unchanged PDFs come from the cache"""
+    cache = ValidationCache.load(cache_path)
+    results: List[Optional[ValidationResult]] = [None] * len(artifacts)
+    pending = []
+
+    for position, artifact in enumerate(artifacts):
+        key = load_validator(artifact.kind).cache_key(artifact.pdf_path, artifact.md_path)
+        cached = None if force else cache.get(artifact.pdf_path, key)
+        if cached is not None:
+            results[position] = ValidationResult(artifact.kind, artifact.pdf_path, artifact.md_path,
+                                                 *cached.counts, True, cached.output)
+        else:
+            pending.append((position, artifact, key))
+
+    jobs = jobs or os.cpu_count() or 1
+    todo = [artifact for _, artifact, _ in pending]
+    if jobs == 1 or len(todo) <= 1:
+        fresh = [validate_artifact(artifact) for artifact in todo]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(todo))) as executor:
+            fresh = list(executor.map(validate_artifact, todo))
+
+    for (position, artifact, key), result in zip(pending, fresh):
+        results[position] = result
+        if Path(artifact.pdf_path).exists():
+            cache.put(artifact.pdf_path, key, (result.passed, result.failed, result.warnings),
+                      result.output)
+    cache.save()
+
+    return results
+
+
+def print_summary(results: Sequence[ValidationResult], root: Path, verbose: bool = False):
+    """Coloured per-file lines plus totals, in the validators' console style"""
+    print(f"{Colors.BLUE}========================================{Colors.NC}")
+    print(f"{Colors.BLUE}   BATCH PDF VALIDATION{Colors.NC}")
+    print(f"{Colors.BLUE}========================================{Colors.NC}")
+    print()
+
+    markers = {
+        'passed': f"{Colors.GREEN}✅ PASS:{Colors.NC}",
+        'warning': f"{Colors.YELLOW}⚠️  WARN:{Colors.NC}",
+        'failed': f"{Colors.RED}❌ FAIL:{Colors.NC}",
+    }
+    for result in results:
+        name = display_path(result.pdf_path, root)
+        cached = " (cached)" if result.cached else ""
+        print(f"{markers[result.status]} {name} "
+              f"[{result.passed} passed, {result.failed} failed, {result.warnings} warnings]{cached}")
+        if verbose:
+            print(result.output)
+
+    failed = sum(1 for r in results if r.status == 'failed')
+    warned = sum(1 for r in results if r.status == 'warning')
+    cached = sum(1 for r in results if r.cached)
+
+    print()
+    print(f"{Colors.BLUE}========================================{Colors.NC}")
+    print(f"{Colors.BLUE}   VALIDATION SUMMARY{Colors.NC}")
+    print(f"{Colors.BLUE}========================================{Colors.NC}")
+    print()
+    print(f"Documents: {len(results)} ({cached} unchanged, served from cache)")
+    print(f"{Colors.GREEN}Passed:  {len(results) - failed - warned}{Colors.NC}")
+    print(f"{Colors.RED}Failed:  {failed}{Colors.NC}")
+    print(f"{Colors.YELLOW}Warnings: {warned}{Colors.NC}")
+    print()
+
+    if failed:
+        print(f"{Colors.RED}❌ OVERALL: FAILED - {failed} document(s) have critical formatting issues{Colors.NC}")
+        print("Re-run the single-file validator on a failed PDF for the full report")
+    elif warned:
+        print(f"{Colors.YELLOW}⚠️  OVERALL: GOOD - all documents passed, {warned} with warnings{Colors.NC}")
+    else:
+        print(f"{Colors.GREEN}✅ OVERALL: EXCELLENT - all documents passed{Colors.NC}")
+
+
+def display_path(path: str, root: Path) -> str:
+    try:
+        return Path(path).resolve().relative_to(Path(root).resolve()).as_posix()
+    except ValueError:
+        return path
+
+
+def summary_counts(results: Sequence[ValidationResult]) -> dict:
+    statuses = [r.status for r in results]
+    return {
+        'documents': len(results),
+        'passed': statuses.count('passed'),
+        'warning': statuses.count('warning'),
+        'failed': statuses.count('failed'),
+        'cached': sum(1 for r in results if r.cached),
+    }
+
+
+def write_json_report(results: Sequence[ValidationResult], path: Path) -> bool:
+    """Aggregated machine-readable report"""
+    data = {
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'summary': summary_counts(results),
+        'results': [result.to_dict() for result in results],
+    }
+    return write_report(path, [json.dumps(data, indent=2, ensure_ascii=False), "\n"])
+
+
+def write_junit_report(results: Sequence[ValidationResult], path: Path, root: Path) -> bool:
+    """JUnit XML: one test suite per document kind, one test case per PDF"""
+    suites = ET.Element('testsuites', name='pdf-validation')
+    for kind in VALIDATORS:
+        kind_results = [r for r in results if r.kind == kind]
+        if not kind_results:
+            continue
+        suite = ET.SubElement(suites, 'testsuite', name=kind, tests=str(len(kind_results)),
+                              failures=str(sum(1 for r in kind_results if r.status == 'failed')),
+                              errors='0', skipped='0')
+        for result in kind_results:
+            case = ET.SubElement(suite, 'testcase', classname=kind,
+                                 name=display_path(result.pdf_path, root))
+            output = strip_ansi(result.output)
+            if result.status == 'failed':
+                failure = ET.SubElement(case, 'failure',
+                                        message=f"{result.failed} check(s) failed")
+                failure.text = output
+            else:
+                ET.SubElement(case, 'system-out').text = output
+
+    ET.indent(suites)
+    xml = ET.tostring(suites, encoding='unicode', xml_declaration=True)
+    return write_report(path, [xml, "\n"])
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser):
+    """Options shared by validation_batch.py and the validators' --batch mode"""
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Worker processes (default: CPU count)')
+    parser.add_argument('--json', type=Path, metavar='PATH', help='Write a JSON report')
+    parser.add_argument('--junit', type=Path, metavar='PATH', help='Write a JUnit XML report')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Print the full check report for every document')
+
+
+def run_batch(root: Path, kinds: Iterable[str], jobs: int = None, force: bool = False,
+              json_path: Path = None, junit_path: Path = None, verbose: bool = False,
+              cache_path: Path = VALIDATION_CACHE_PATH) -> int:
+    """Discover, validate and report; returns the exit code (1 if any document failed)"""
+    root = Path(root)
+    if not root.exists():
+        print(f"{Colors.RED}❌ ERROR: Folder not found: {root}{Colors.NC}")
+        return 1
+
+    results = validate_all(discover(root, kinds), jobs=jobs, force=force, cache_path=cache_path)
+    print_summary(results, root, verbose=verbose)
+
+    if json_path:
+        write_json_report(results, json_path)
+        print(f"\nJSON report saved to: {json_path}")
+    if junit_path:
+        write_junit_report(results, junit_path, root)
+        print(f"JUnit report saved to: {junit_path}")
+
+    return 1 if any(r.status == 'failed' for r in results) else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate all CV and cover letter PDFs')
+    parser.add_argument('root', nargs='?', type=Path, default=DEFAULT_ROOT,
+                        help='Folder to search (default: applications/)')
+    parser.add_argument('--kind', choices=sorted(VALIDATORS), action='append',
+                        help='Only validate this document kind (repeatable)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-check every PDF, ignoring cached results')
+    add_batch_arguments(parser)
+    args = parser.parse_args()
+
+    sys.exit(run_batch(args.root, args.kind or tuple(VALIDATORS), jobs=args.jobs, force=args.force,
+                       json_path=args.json, junit_path=args.junit, verbose=args.verbose))
+
+
+if __name__ == '__main__':
+    main()
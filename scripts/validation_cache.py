@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache for PDF validation results
+
+The validators in scripts/validation/ record the outcome of each run (pass,
+fail and warning counts plus the console report) keyed by:
+- the validator name and version
+- the SHA-256 of the PDF
+- the SHA-256 of every other input the checks read (markdown source, master CV)
+
+A repeat run on an unchanged PDF replays the stored report instead of
+re-checking it. Regenerating the PDF (or editing its markdown) changes the key
+and triggers a fresh validation. Bump a validator's VALIDATOR_VERSION whenever
+its checks change.
+
+Storage: JSON file (default insights/.validation-cache.json)
+    {"version": N, "entries": {"<pdf path>": {"key": ..., "counts": [p, f, w], ...}}}
+
+Usage:
+    from validation_cache import ValidationCache, capture_output
+    cache = ValidationCache.load(VALIDATION_CACHE_PATH)
+    key = cache.key_for('validate-cv', VALIDATOR_VERSION, pdf_path, md_path)
+    cached = cache.get(pdf_path, key)
+    if cached is None:
+        counts, output = capture_output(run_checks, pdf_path, md_path)
+        cache.put(pdf_path, key, counts, output)
+        cache.save()
+"""
+
+import hashlib
+import io
+import json
+import sys
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from report_writer import write_report
+
+
+CACHE_VERSION = 1
+VALIDATION_CACHE_PATH = Path(__file__).resolve().parent.parent / "insights" / ".validation-cache.json"
+MISSING_FILE_HASH = '-'
+
+Counts = Tuple[int, int, int]
+
+
+def content_hash(path) -> str:
+    """SHA-256 of file contents ('-' if the file does not exist)"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(65536), b''):
+                digest.update(chunk)
+    except (OSError, TypeError):
+        return MISSING_FILE_HASH
+    return digest.hexdigest()
+
+
+@dataclass
+class CachedResult:
+    """Stored outcome of one validation run"""
+    counts: Counts
+    output: str
+    validated: str
+
+
+class _Tee(io.TextIOBase):
+    """Writes to the real stdout while keeping a copy"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.buffer_copy = io.StringIO()
+
+    def write(self, text):
+        self.buffer_copy.write(text)
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+def capture_output(func: Callable, *args):
+    """Run func(*args), echoing its output live; returns (result, output)"""
+    tee = _Tee(sys.stdout)
+    with redirect_stdout(tee):
+        result = func(*args)
+    return result, tee.buffer_copy.getvalue()
+
+
+class ValidationCache:
+    """Validation results keyed by PDF content hash and validator version"""
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = Path(cache_path)
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, cache_path: Path) -> 'ValidationCache':
+        """Load a cache from disk (missing, corrupt or outdated files give an empty cache)"""
+        cache = cls(cache_path)
+        if not cache.cache_path.exists():
+            return cache
+
+        try:
+            data = json.loads(cache.cache_path.read_text(encoding='utf-8'))
+            if data.get('version') == CACHE_VERSION:
+                cache.entries = dict(data['entries'])
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Ignoring unreadable validation cache {cache.cache_path}: {e}")
+            cache.entries = {}
+
+        return cache
+
+    @staticmethod
+    def _entry_name(pdf_path) -> str:
+        return Path(pdf_path).resolve().as_posix()
+
+    @staticmethod
+    def key_for(validator: str, version: int, pdf_path, *inputs: Optional[str]) -> str:
+        """Cache key from validator version and the content of every input file"""
+        parts = [validator, str(version), content_hash(pdf_path)]
+        parts.extend(content_hash(path) if path else MISSING_FILE_HASH for path in inputs)
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, pdf_path, key: str) -> Optional[CachedResult]:
+        """Stored result for this PDF if it was validated with the same key"""
+        entry = self.entries.get(self._entry_name(pdf_path))
+        if not entry or entry.get('key') != key:
+            return None
+        try:
+            passed, failed, warned = entry['counts']
+            return CachedResult((int(passed), int(failed), int(warned)),
+                                entry['output'], entry['validated'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, pdf_path, key: str, counts: Counts, output: str):
+        """Record the result of a fresh validation"""
+        self.entries[self._entry_name(pdf_path)] = {
+            'key': key,
+            'counts': list(counts),
+            'output': output,
+            'validated': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        }
+        self.dirty = True
+
+    def prune(self) -> int:
+        """Drop entries whose PDF no longer exists; returns the number removed"""
+        stale = [name for name in self.entries if not Path(name).exists()]
+        for name in stale:
+            del self.entries[name]
+        if stale:
+            self.dirty = True
+        return len(stale)
+
+    def save(self):
+        """Write the cache atomically (no-op if nothing changed)"""
+        if not self.dirty:
+            return
+        self.prune()
+        data = {'version': CACHE_VERSION, 'entries': self.entries}
+        write_report(self.cache_path, [json.dumps(data, sort_keys=True), "\n"])
+        self.dirty = False
@@ -15,6 +15,14 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Shared script modules (status_parser, ...) are imported as siblings by the scripts
+scripts_path = project_root / "scripts"
+sys.path.insert(0, str(scripts_path))
+
+# Deprecated automation scripts (extract_mhtml, bulk_analyze, ...) import each other the same way
+automation_path = project_root / "deprecated" / "automation"
+sys.path.append(str(automation_path))
+
 
 def import_module_from_file(module_name, file_path):
     """
@@ -60,6 +68,24 @@ def get_validate_cl():
     return sys.modules['validate_cover_letter']
 
 
+def get_migrate():
+    """Lazily import migrate-to-status-folders module"""
+    if 'migrate_to_status_folders' not in sys.modules:
+        migrate_path = project_root / "scripts" / "migrate-to-status-folders.py"
+        module = import_module_from_file("migrate_to_status_folders", migrate_path)
+        sys.modules['migrate_to_status_folders'] = module
+    return sys.modules['migrate_to_status_folders']
+
+
+def get_sync_status():
+    """Lazily import sync-status module"""
+    if 'sync_status' not in sys.modules:
+        sync_status_path = project_root / "scripts" / "sync-status.py"
+        module = import_module_from_file("sync_status", sync_status_path)
+        sys.modules['sync_status'] = module
+    return sys.modules['sync_status']
+
+
 # Pytest fixtures
 import pytest
 
@@ -73,3 +99,15 @@ def validate_cv():
 def validate_cl():
     """Fixture providing validate_cover_letter module"""
     return get_validate_cl()
+
+
+@pytest.fixture
+def migrate():
+    """Fixture providing migrate-to-status-folders module"""
+    return get_migrate()
+
+
+@pytest.fixture
+def sync_status():
+    """Fixture providing sync-status module"""
+    return get_sync_status()
@@ -0,0 +1,140 @@
+"""
+Tests for the persistent application index (scripts/application_index.py)
+
+Verifies incremental sync behaviour:
+- Unchanged folders are served from the index without reparsing
+- Edited files (content change) trigger a reparse
+- Touched-but-identical files are not reparsed
+- Removed folders are dropped from the index
+"""
+
+import os
+import pytest
+
+from application_index import ApplicationIndex
+
+
+def make_application(applications, name, status='applied', fit='8.0'):
+    """Create an application folder with status.md and analysis.md"""
+    folder = applications / "active" / status / name
+    folder.mkdir(parents=True)
+    (folder / "status.md").write_text(f"""# Application Status - {name} - PM
+
+**Current Status:** {status}
+**Fit Score:** {fit}/10
+""", encoding='utf-8')
+    (folder / "analysis.md").write_text(f"## Fit Score: {fit}/10\n", encoding='utf-8')
+    return folder / "status.md"
+
+
+@pytest.fixture
+def tree(tmp_path):
+    applications = tmp_path / "applications"
+    index_path = tmp_path / "insights" / ".application-index.jsonl"
+    status_files = [
+        make_application(applications, "2025-01-Angi-PM"),
+        make_application(applications, "2025-01-Kraken-PM", fit='9.0'),
+    ]
+    return applications, index_path, status_files
+
+
+class TestIncrementalRefresh:
+    """Test that only changed folders are reparsed"""
+
+    def test_first_run_parses_everything(self, tree):
+        """Empty index parses every status file"""
+        applications, index_path, status_files = tree
+
+        index = ApplicationIndex.load(index_path, applications)
+        records = index.refresh(status_files)
+        index.save()
+
+        assert index.reparsed == 2
+        assert index.reused == 0
+        assert {r.company for r in records} == {"2025-01-Angi-PM", "2025-01-Kraken-PM"}
+        assert index_path.exists()
+
+    def test_second_run_uses_index(self, tree):
+        """Unchanged folders come from the saved index"""
+        applications, index_path, status_files = tree
+        first = ApplicationIndex.load(index_path, applications)
+        first.refresh(status_files)
+        first.save()
+
+        second = ApplicationIndex.load(index_path, applications)
+        records = second.refresh(status_files)
+
+        assert second.reparsed == 0
+        assert second.reused == 2
+        assert sorted(r.fit_score for r in records) == [8.0, 9.0]
+        assert records[0].path == status_files[0]
+
+    def test_edited_status_is_reparsed(self, tree):
+        """Content change in status.md triggers a reparse"""
+        applications, index_path, status_files = tree
+        first = ApplicationIndex.load(index_path, applications)
+        first.refresh(status_files)
+        first.save()
+
+        status_files[0].write_text("**Current Status:** rejected\n", encoding='utf-8')
+
+        second = ApplicationIndex.load(index_path, applications)
+        records = second.refresh(status_files)
+
+        assert second.reparsed == 1
+        assert records[0].status == "rejected"
+
+    def test_touched_file_is_not_reparsed(self, tree):
+        """New mtime with identical content keeps the cached record"""
+        applications, index_path, status_files = tree
+        first = ApplicationIndex.load(index_path, applications)
+        first.refresh(status_files)
+        first.save()
+
+        stat = status_files[0].stat()
+        os.utime(status_files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        second = ApplicationIndex.load(index_path, applications)
+        second.refresh(status_files)
+
+        assert second.reparsed == 0
+
+    def test_analysis_change_is_detected(self, tree):
+        """analysis.md is part of the folder fingerprint"""
+        applications, index_path, status_files = tree
+        first = ApplicationIndex.load(index_path, applications)
+        first.refresh(status_files)
+        first.save()
+
+        (status_files[1].parent / "analysis.md").write_text("## Fit Score: 6.5/10\n", encoding='utf-8')
+
+        second = ApplicationIndex.load(index_path, applications)
+        second.refresh(status_files)
+
+        assert second.reparsed == 1
+        assert second.get(status_files[1])['analysis_fit_score'] == 6.5
+
+    def test_removed_folder_is_dropped(self, tree):
+        """Folders missing from the scan are removed from the index"""
+        applications, index_path, status_files = tree
+        first = ApplicationIndex.load(index_path, applications)
+        first.refresh(status_files)
+        first.save()
+
+        second = ApplicationIndex.load(index_path, applications)
+        second.refresh(status_files[:1])
+        second.save()
+
+        assert second.get(status_files[1]) is None
+        assert len(ApplicationIndex.load(index_path, applications).entries) == 1
+
+    def test_corrupt_index_is_ignored(self, tree):
+        """Unreadable index falls back to a full parse"""
+        applications, index_path, status_files = tree
+        index_path.parent.mkdir(parents=True)
+        index_path.write_text("not json\n", encoding='utf-8')
+
+        index = ApplicationIndex.load(index_path, applications)
+        index.refresh(status_files)
+
+        assert index.reparsed == 2
@@ -0,0 +1,119 @@
+"""
+Tests for the compact application model (scripts/application_record.py)
+
+Verifies that:
+- Records are built from status.md with timeline events applied, as the dashboards expect
+- Dates are parsed once into datetime.date attributes
+- Statuses are interned (case-insensitively): Status members for known ones, one shared string otherwise
+- Records have no per-instance dict and support dict-style access
+- Dashboards and snapshots built from records match those built from dicts
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from application_record import ApplicationRecord, Status, intern_status
+from application_snapshot import ApplicationSnapshot
+from dashboard_sections import METRICS_REPORT, SECTIONS, STATUS_REPORT
+from metrics_engine import compute_metrics
+from report_writer import render_report
+from status_parser import parse_status_text
+
+
+SAMPLE_STATUS = """# Application Status - Kraken - Director of Product
+
+**Current Status:** Applied
+**Last Updated:** 2025-01-20 09:15
+**Fit Score:** 8.5/10
+**Analyzed On:** 2025-01-05
+**Location:** London, UK
+**CV Version:** ArturSwadzba_CV_Kraken.pdf
+**Cover Letter:** Not generated
+
+## Status Timeline
+
+### Rejected - 2025-01-20 09:15
+
+### Interview Round 1 - 2025-01-14
+
+### Applied - 2025-01-08 14:00
+"""
+
+
+@pytest.fixture
+def record():
+    path = Path("applications/archive/2025-Q1/rejected/2025-01-Kraken-Director/status.md")
+    return ApplicationRecord.from_status_record(parse_status_text(SAMPLE_STATUS, path))
+
+
+class TestRecord:
+    """Test building records from status.md"""
+
+    def test_from_status_record(self, record):
+        """Terminal timeline events override the current status"""
+        assert record.folder_name == "2025-01-Kraken-Director"
+        assert record.status is Status.REJECTED
+        assert (record.company, record.fit_score, record.cv_generated) == ("Kraken", 8.5, True)
+        assert record.applied_date == "2025-01-08 14:00"
+        assert record.interview_dates == ["2025-01-14"]
+
+    def test_dates_parsed_once(self, record):
+        assert record.analyzed_on == date(2025, 1, 5)
+        assert record.applied_on == date(2025, 1, 8)
+        assert record.rejected_on == record.updated_on == date(2025, 1, 20)
+        assert record.withdrawn_on is None
+        assert ApplicationRecord("p", "f", "applied", applied_date="2025-02-30").applied_on is None
+
+    def test_compact(self, record):
+        assert not hasattr(record, '__dict__')
+        assert sys.getsizeof(record) < sys.getsizeof(record.to_dict())
+
+    def test_dict_style_access(self, record):
+        assert record['company'] == "Kraken"
+        assert record.get('location', 'N/A') == "London, UK"
+        assert record.get('missing', 'N/A') == 'N/A'
+        assert ApplicationRecord.from_dict(record.to_dict()).to_dict() == record.to_dict()
+        with pytest.raises(KeyError):
+            record['missing']
+
+
+class TestStatus:
+    """Test status interning"""
+
+    def test_known_statuses_are_members(self):
+        assert intern_status('analysis phase') is Status.ANALYSIS_PHASE
+        assert intern_status('Applied') is intern_status('APPLIED') is Status.APPLIED
+        assert intern_status(None) is Status.UNKNOWN
+        assert intern_status("On Hold") == "on hold"
+
+    def test_members_behave_like_strings(self):
+        status = Status.ANALYSIS_PHASE
+        assert {'analysis phase': 1}[status] == 1
+        assert f"{status}" == str(status) == "analysis phase"
+        assert status.title() == "Analysis Phase" and 'analysis' in status
+
+    def test_unknown_statuses_shared(self):
+        first = intern_status("".join(["on ", "hold"]))
+        assert first == "on hold" and first is intern_status("on " + "hold".lower())
+
+
+class TestConsumers:
+    """Test that records and dicts give the same dashboards and snapshots"""
+
+    def test_same_output(self, record):
+        other = ApplicationRecord("b/status.md", "2025-02-Monzo-Head", "analysis phase", fit_score=7.0,
+                                  analyzed_date="2025-02-01", company="Monzo", role="Head of Product")
+        records = [record, other]
+        dicts = [app.to_dict() for app in records]
+
+        record_snapshot = ApplicationSnapshot.from_applications(records)
+        dict_snapshot = ApplicationSnapshot.from_applications(dicts)
+        assert record_snapshot.columns == dict_snapshot.columns
+
+        today = date(2025, 2, 4)
+        sections = [name for name in STATUS_REPORT + METRICS_REPORT if not name.endswith('header')]
+        assert "".join(render_report(SECTIONS, sections, records, compute_metrics(record_snapshot, records, today))) == \
+               "".join(render_report(SECTIONS, sections, dicts, compute_metrics(dict_snapshot, dicts, today)))
@@ -0,0 +1,145 @@
+"""
+Tests for the columnar application snapshot (scripts/application_snapshot.py)
+
+Verifies that:
+- Status is stored as categorical codes, fit scores as floats, dates as int64 days
+- Snapshots round-trip through the .npz file (missing values, unicode strings)
+- The .npy members follow the NumPy format (aligned headers, little-endian data)
+- Saves are reproducible, and an unchanged snapshot file is not rewritten
+- Metrics computed from the columns equal sync-status calculate_metrics
+- sync-status exports the snapshot alongside the dashboards
+"""
+
+import math
+import os
+import time
+import zipfile
+from datetime import date
+
+import pytest
+
+from application_snapshot import (MISSING_DAY, ApplicationSnapshot, decode_npy, snapshot_metrics,
+                                  to_day)
+
+
+def make_app(folder, status, fit_score=None, applied=None, rejected=None, withdrawn=None,
+             interviews=(), analyzed="2025-01-05", cv=False):
+    return {
+        'folder_name': folder, 'company': folder.split('-')[2], 'role': "Director of Product",
+        'status': status, 'fit_score': fit_score, 'last_updated': "2025-02-01 10:00",
+        'analyzed_date': analyzed, 'applied_date': applied, 'rejected_date': rejected,
+        'withdrawn_date': withdrawn, 'interview_dates': list(interviews),
+        'cv_generated': cv, 'cover_letter_generated': False,
+        'location': "London", 'file_path': f"{folder}/status.md", 'days_waiting': 0, 'outcome': None,
+    }
+
+
+@pytest.fixture
+def applications():
+    return [
+        make_app("2025-01-Kraken-Director", 'rejected', 8.5, applied="2025-01-08 14:00",
+                 rejected="2025-01-20 09:15", interviews=["2025-01-14"], cv=True),
+        make_app("2025-01-Monzo-Head", 'analysis phase', 7.0),
+        make_app("2025-02-Zürich-Versicherung", 'applied', None, applied="2025-02-03", cv=True),
+        make_app("2025-02-Wise-GroupPM", 'withdrawn', 9.0, applied="2025-02-01",
+                 withdrawn="2025-02-10", analyzed=None),
+    ]
+
+
+class TestColumns:
+    """Test column types and the .npz round trip"""
+
+    def test_columns(self, applications):
+        snapshot = ApplicationSnapshot.from_applications(applications)
+
+        assert snapshot.status_categories == ['analysis phase', 'applied', 'rejected', 'withdrawn']
+        assert list(snapshot['status']) == [2, 0, 1, 3]
+        assert snapshot['fit_score'].typecode == 'd' and math.isnan(snapshot['fit_score'][2])
+        assert snapshot['applied_day'][0] == to_day("2025-01-08") == (date(2025, 1, 8) - date(1970, 1, 1)).days
+        assert snapshot['analyzed_day'][3] == MISSING_DAY
+
+    def test_round_trip(self, applications, tmp_path):
+        path = tmp_path / "insights" / "applications-snapshot.npz"
+        ApplicationSnapshot.from_applications(applications).save(path)
+
+        snapshot = ApplicationSnapshot.load(path)
+
+        assert len(snapshot) == 4
+        assert snapshot['folder_name'][2] == "2025-02-Zürich-Versicherung"
+        assert list(snapshot['rejected_day']) == [to_day("2025-01-20"), MISSING_DAY, MISSING_DAY, MISSING_DAY]
+        assert list(snapshot['interview_count']) == [1, 0, 0, 0]
+        assert snapshot.count_by_status() == {'analysis phase': 1, 'applied': 1, 'rejected': 1, 'withdrawn': 1}
+        assert [p.name for p in path.parent.iterdir()] == ["applications-snapshot.npz"]
+
+    def test_npy_format(self, applications, tmp_path):
+        path = tmp_path / "snapshot.npz"
+        ApplicationSnapshot.from_applications(applications).save(path)
+
+        with zipfile.ZipFile(path) as npz:
+            data = npz.read("fit_score.npy")
+            strings = npz.read("company.npy")
+
+        header_length = int.from_bytes(data[8:10], 'little')
+        assert data.startswith(b'\x93NUMPY\x01\x00')
+        assert (10 + header_length) % 64 == 0
+        assert b"'descr': '<f8'" in data and b"'shape': (4,)" in data
+        assert b"'descr': '<U6'" in strings
+        assert decode_npy(strings) == ["Kraken", "Monzo", "Zürich", "Wise"]
+
+    def test_unchanged_snapshot_not_rewritten(self, applications, tmp_path, monkeypatch):
+        """Saves are byte-for-byte reproducible; identical content leaves the file alone"""
+        path = tmp_path / "snapshot.npz"
+        snapshot = ApplicationSnapshot.from_applications(applications)
+        assert snapshot.save(path)
+        content = path.read_bytes()
+        os.utime(path, ns=(0, 0))
+
+        monkeypatch.setattr(time, 'time', lambda: 2e9)
+        assert not snapshot.save(path)
+        snapshot.save(tmp_path / "later.npz")
+        monkeypatch.undo()
+
+        assert path.read_bytes() == content == (tmp_path / "later.npz").read_bytes()
+        assert path.stat().st_mtime_ns == 0
+        assert ApplicationSnapshot.from_applications(applications[:3]).save(path)
+
+    def test_empty_snapshot(self, tmp_path):
+        ApplicationSnapshot.from_applications([]).save(tmp_path / "empty.npz")
+
+        snapshot = ApplicationSnapshot.load(tmp_path / "empty.npz")
+
+        assert len(snapshot) == 0
+        assert snapshot_metrics(snapshot)['avg_fit_score'] == 0
+
+
+class TestAnalytics:
+    """Test aggregation over the columns"""
+
+    def test_metrics_match_sync_status(self, applications, sync_status):
+        snapshot = ApplicationSnapshot.from_applications(applications)
+
+        expected = sync_status.calculate_metrics(applications)
+
+        metrics = snapshot_metrics(snapshot)
+        assert metrics == {key: dict(expected[key]) if isinstance(expected[key], dict) else expected[key]
+                           for key in metrics}
+
+    def test_queries(self, applications):
+        snapshot = ApplicationSnapshot.from_applications(applications)
+
+        waiting = [applied and not (rejected or withdrawn) for applied, rejected, withdrawn in
+                   zip(snapshot.days_since('applied_day', 14, today=date(2025, 2, 20)),
+                       snapshot.has_date('rejected_day'), snapshot.has_date('withdrawn_day'))]
+
+        assert snapshot.select(waiting) == ["2025-02-Zürich-Versicherung"]
+        assert snapshot.select(snapshot.status_mask('rejected', 'withdrawn'), 'company') == ["Kraken", "Wise"]
+
+    def test_sync_status_exports_snapshot(self, applications, sync_status, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(sync_status, 'BASE_PATH', tmp_path)
+        monkeypatch.setattr(sync_status, 'APPLICATIONS_PATH', tmp_path / "applications")
+        monkeypatch.setattr(sync_status, 'SNAPSHOT_PATH', tmp_path / "insights" / "applications-snapshot.npz")
+        monkeypatch.setattr(sync_status, 'application_from_record', lambda app: app)
+
+        sync_status.write_dashboards(applications)
+
+        assert len(ApplicationSnapshot.load(tmp_path / "insights" / "applications-snapshot.npz")) == 4
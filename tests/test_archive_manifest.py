@@ -0,0 +1,154 @@
+"""
+Tests for per-quarter archive manifests (scripts/archive_manifest.py)
+
+Verifies that:
+- A manifest holds one row per archived application plus precomputed summaries
+- Saved manifests are reused until an application is archived into the quarter
+- Quarter summaries add up across the archive
+- FitScoreEvaluator and the metrics dashboard read archived quarters from manifests
+- FitScoreEvaluator reads live applications as records with interned statuses
+- Outcomes are recognized in statuses with notes and in space-separated spellings
+"""
+
+import pytest
+
+import archive_manifest
+from application_record import Status
+from archive_manifest import MANIFEST_NAME, combine, load_archive
+from dashboard_sections import SECTIONS
+from evaluate_fit_accuracy import FitScoreEvaluator
+from report_writer import render_report
+
+
+def archived(archive, quarter, outcome, name, fit, applied="2025-01-08", response="2025-01-20"):
+    """Archived application; only rejections count as a response"""
+    folder = archive / quarter / outcome / name
+    folder.mkdir(parents=True)
+    (folder / "status.md").write_text(f"""# Application Status - {name} - Director of Product
+
+**Current Status:** {outcome.title()}
+**Applied On:** {applied}
+
+## Status Timeline
+
+### {outcome.title()} - {response} 09:15
+
+### Applied - {applied} 14:00
+""", encoding='utf-8')
+    (folder / "analysis.md").write_text(f"Fit Score: {fit}/10\n", encoding='utf-8')
+    return folder
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = tmp_path / "applications" / "archive"
+    archived(archive, "2025-Q1", "rejected", "2025-01-Kraken-Director", 8.5)
+    archived(archive, "2025-Q1", "withdrawn", "2025-02-Monzo-HeadOfProduct", 6.0, response="2025-02-01")
+    archived(archive, "2025-Q2", "rejected", "2025-04-Wise-GroupPM", 7.5, applied="2025-04-01",
+             response="2025-04-11")
+    return archive
+
+
+class TestManifest:
+    """Test manifest contents and reuse"""
+
+    def test_rows_and_summary(self, archive):
+        [q1, q2] = load_archive(archive)
+
+        assert (q1['quarter'], q2['quarter']) == ("2025-Q1", "2025-Q2")
+        assert [row['folder'] for row in q1['applications']] == ["2025-01-Kraken-Director",
+                                                                 "2025-02-Monzo-HeadOfProduct"]
+        kraken = q1['applications'][0]
+        assert (kraken['status'], kraken['fit_score'], kraken['time_to_response']) == ("rejected", 8.5, 12)
+        assert q1['summary']['by_status'] == {'rejected': 1, 'withdrawn': 1}
+        assert q1['summary']['fit_histogram'] == {'6': 1, '8': 1}
+        assert (archive / "2025-Q1" / MANIFEST_NAME).exists()
+
+    def test_reused_until_quarter_changes(self, archive, monkeypatch):
+        load_archive(archive)
+
+        monkeypatch.setattr(archive_manifest, 'build_manifest', lambda quarter: pytest.fail("rebuilt"))
+        assert [m['summary']['count'] for m in load_archive(archive)] == [2, 1]
+        monkeypatch.undo()
+
+        archived(archive, "2025-Q2", "withdrawn", "2025-05-Revolut-ProductLead", 9.0)
+        assert [m['summary']['count'] for m in load_archive(archive)] == [2, 2]
+
+    def test_combine(self, archive):
+        total = combine(load_archive(archive))
+
+        assert total['count'] == 3
+        assert total['by_status'] == {'rejected': 2, 'withdrawn': 1}
+        assert total['fit_histogram'] == {'6': 1, '7': 1, '8': 1}
+        assert (total['fit_total'], total['fit_count']) == (22.0, 3)
+        assert (total['response_days_total'], total['response_count']) == (12 + 10, 2)
+
+
+class TestReaders:
+    """Test consumers of the manifests"""
+
+    def test_evaluator_reads_manifests(self, archive, monkeypatch):
+        load_archive(archive)
+        monkeypatch.setattr(archive_manifest, 'parse_status_file', lambda path: pytest.fail("parsed"))
+
+        evaluator = FitScoreEvaluator(archive.parent)
+        evaluator.analyze_applications()
+
+        assert [app['company'] for app in evaluator.results['high_fit_rejected']] == ["2025-01-Kraken-Director"]
+        assert [app['company'] for app in evaluator.results['medium_fit_rejected']] == ["2025-04-Wise-GroupPM"]
+        assert evaluator.results['low_fit_attempted'] == []
+        assert dict(evaluator.time_to_response) == {'high': [12], 'medium': [10]}
+
+    def test_evaluator_reads_live_records(self, archive):
+        """Live statuses are Status members; a Rejected timeline event is the outcome"""
+        folder = archive.parent / "active" / "interview" / "2025-06-Revolut-ProductLead"
+        folder.mkdir(parents=True)
+        (folder / "status.md").write_text("""**Current Status:** Interview Scheduled
+
+## Status Timeline
+
+### Rejected - 2025-06-20 10:00
+
+### Applied - 2025-06-02 14:00
+""", encoding='utf-8')
+        (folder / "analysis.md").write_text("Fit Score: 9.0/10\n", encoding='utf-8')
+
+        evaluator = FitScoreEvaluator(archive.parent)
+        evaluator.analyze_applications()
+
+        [revolut, kraken] = evaluator.results['high_fit_rejected']
+        assert revolut['company'] == "2025-06-Revolut-ProductLead" and revolut['status'] is Status.REJECTED
+        assert kraken['status'] is Status.REJECTED
+
+    def test_outcome_of_noted_and_spaced_statuses(self, archive):
+        """A rejection with a note fails; an interview invitation (spaces or hyphens) succeeds"""
+        evaluator = FitScoreEvaluator(archive.parent)
+
+        assert evaluator.categorize_outcome('rejected (no response)') == 'failure'
+        assert evaluator.categorize_outcome(Status.INTERVIEW_INVITED) == 'success'
+        assert evaluator.categorize_outcome('interview-invited') == 'success'
+        assert evaluator.categorize_outcome('interview scheduled') == 'pending'
+
+    def test_evaluator_reads_live_statuses(self, archive):
+        """Live 'Rejected (no response)' and 'Interview Invited' statuses are outcomes"""
+        for name, status in (("2025-06-Monzo-HeadOfProduct", "Rejected (no response)"),
+                             ("2025-06-Wise-DirectorProduct", "Interview Invited")):
+            folder = archive.parent / "active" / "applied" / name
+            folder.mkdir(parents=True)
+            (folder / "status.md").write_text(f"**Current Status:** {status}\n", encoding='utf-8')
+            (folder / "analysis.md").write_text("Fit Score: 9.0/10\n", encoding='utf-8')
+
+        evaluator = FitScoreEvaluator(archive.parent)
+        evaluator.analyze_applications()
+
+        assert [app['company'] for app in evaluator.results['high_fit_accepted']] == ["2025-06-Wise-DirectorProduct"]
+        assert "2025-06-Monzo-HeadOfProduct" in [app['company'] for app in evaluator.results['high_fit_rejected']]
+
+    def test_archive_history_section(self, archive):
+        metrics = {'archive_quarters': load_archive(archive)}
+
+        text = "".join(render_report(SECTIONS, ['archive_history'], [], metrics))
+
+        assert "| 2025-Q1 | 2 | 1 | 1 | 7.2 | 12.0 |" in text
+        assert "| 2025-Q2 | 1 | 1 | 0 | 7.5 | 10.0 |" in text
+        assert "No archived quarters" in "".join(render_report(SECTIONS, ['archive_history'], [], {}))
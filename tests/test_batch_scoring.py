@@ -0,0 +1,104 @@
+"""
+Tests for batch fit scoring (deprecated/automation/batch_scoring.py)
+
+Verifies that:
+- The document-term matrix holds each document's matched terms
+- Batch scores, reasons and concerns equal calculate_fit_score for every job
+- Custom preferences are scored without a precompiled matcher
+- Role rejects, industries to avoid and keyword weights come from the preferences
+"""
+
+import random
+
+from batch_scoring import DocTermMatrix, members, mask_of, score_batch
+from bulk_analyze import DOMAIN_BONUSES, PREFERENCES, calculate_fit_score, score_jobs
+from keyword_matcher import KeywordMatcher
+
+
+TITLES = ["Director of Product", "Senior Product Manager", "Product Lead, Growth",
+          "Head of Product - Data Platform", "Software Engineer", "VP Product", "Product Leader",
+          "Group PM", "Principal PM", "Engineering Manager", "Product Engineer", ""]
+
+FILLER = ("you will work with our team to build and deliver great experiences for customers "
+          "across many markets using modern tools").split()
+
+
+def random_jobs(count, seed=7):
+    rng = random.Random(seed)
+    vocabulary = [term for values in PREFERENCES.values() for term in values]
+    vocabulary += ['booking', 'advertising', 'hotel', 'remote', 'senior']
+    jobs = []
+    for _ in range(count):
+        words = [rng.choice(FILLER) for _ in range(60)] + rng.sample(vocabulary, rng.randint(0, 6))
+        rng.shuffle(words)
+        jobs.append({'job_title': rng.choice(TITLES), 'description': " ".join(words), 'company': "X"})
+    return jobs
+
+
+class TestDocTermMatrix:
+    """Test the sparse matrix and bitset helpers"""
+
+    def test_rows_and_columns(self):
+        """CSR rows hold term ids; columns are document bitsets"""
+        vocabulary = ['london', 'data platform', 'platform']
+        matrix = DocTermMatrix.build(["data platform in london", "no match", "platform"],
+                                     KeywordMatcher(vocabulary), vocabulary)
+
+        assert list(matrix.indptr) == [0, 3, 3, 4]
+        assert list(matrix.indices) == [0, 1, 2, 2]
+        assert matrix.columns() == {'london': 0b001, 'data platform': 0b001, 'platform': 0b101}
+
+    def test_bitset_helpers(self):
+        """mask_of and members are inverse"""
+        flags = [True, False, False, True, True] + [False] * 70 + [True]
+
+        mask = mask_of(flags)
+
+        assert members(mask) == [0, 3, 4, 75]
+        assert members(0) == [] and mask_of([]) == 0
+
+
+class TestScoreBatch:
+    """Test equivalence with the per-job heuristic"""
+
+    def test_matches_calculate_fit_score(self):
+        """Every branch (rejects, locations, caps, seniority, domains) agrees"""
+        jobs = random_jobs(600)
+
+        expected = [calculate_fit_score(job) for job in jobs]
+
+        assert score_jobs(jobs) == expected
+        assert {score for score, _, _ in expected} >= {1.0, 2.0, 10.0}
+
+    def test_empty_batch(self):
+        assert score_jobs([]) == []
+
+    def test_custom_preferences(self):
+        """A different profile compiles its own matcher"""
+        preferences = dict(PREFERENCES, locations_high_priority=['paris'], locations_reject=[])
+        jobs = [{'job_title': 'Director of Product', 'description': 'Based in Paris', 'company': 'X'},
+                {'job_title': 'Director of Product', 'description': 'Based in London', 'company': 'X'}]
+
+        (paris, reasons, _), (london, _, concerns) = score_batch(jobs, preferences, DOMAIN_BONUSES)
+
+        assert "✅ Location: Paris" in reasons
+        assert "⚠️ Location not in preferred list" in concerns
+        assert paris - london == 3.0
+
+    def test_profile_rules(self):
+        """Profile role rejects, avoided industries and weights, identical per job and in batch"""
+        preferences = dict(PREFERENCES, role_reject_keywords=['data analyst'], industries_avoid=['gaming'],
+                           keyword_weights=dict(PREFERENCES['keyword_weights'], travel=3.0))
+        jobs = [{'job_title': 'Senior Data Analyst', 'description': 'London', 'company': 'X'},
+                {'job_title': 'Software Engineer', 'description': 'London', 'company': 'X'},
+                {'job_title': 'Director of Product', 'description': 'London gaming studio', 'company': 'X'},
+                {'job_title': 'Product Manager', 'description': 'Travel company', 'company': 'X'}]
+
+        scores = score_batch(jobs, preferences, DOMAIN_BONUSES)
+
+        assert scores == [calculate_fit_score(job, preferences) for job in jobs]
+        (analyst, reasons, _), (engineer, _, _), (gaming, _, concerns), (travel, _, _) = scores
+        assert (analyst, reasons) == (2.0, ["❌ Data Analyst role, not Product Management"])
+        assert engineer > 2.0
+        assert "⚠️ Industry to avoid: gaming" in concerns
+        assert travel - score_batch(jobs[3:], PREFERENCES, DOMAIN_BONUSES)[0][0] == 1.5
@@ -0,0 +1,155 @@
+"""
+Tests for bulk job analysis (deprecated/automation/bulk_analyze.py)
+
+Verifies that:
+- The process pool gives the same results as in-process analysis
+- Results stay sorted by fit score (highest first)
+- A broken file is reported without aborting the batch
+- Unchanged files are served from the score cache without re-extraction,
+  including when organize_staging sorts them into tier folders
+- After a preferences change, unchanged files are re-scored from the cache
+- The career profile is loaded when analysis runs and reaches the worker processes
+"""
+
+import json
+import os
+import pytest
+
+import bulk_analyze
+from bulk_analyze import analyze_all_jobs, analyze_job_file
+from career_profile import ScoringProfile
+from organize_staging import organize_by_tier
+from score_cache import SCORE_CACHE_NAME, ScoreCache
+
+
+def write_job(staging, filename, body):
+    html = f"<html><body><div class='jobs-description__content'><p>{body}</p></div></body></html>"
+    (staging / filename).write_bytes(
+        b"MIME-Version: 1.0\r\nContent-Type: multipart/related; boundary=\"B\"\r\n\r\n"
+        b"--B\r\nContent-Type: text/html\r\nContent-Transfer-Encoding: 8bit\r\n\r\n"
+        + html.encode('utf-8') + b"\r\n--B--\r\n")
+
+
+@pytest.fixture
+def staging(tmp_path):
+    staging = tmp_path / "staging"
+    staging.mkdir()
+    write_job(staging, "Director of Product @ Booking.mhtml", "Travel marketplace in London, growth and experimentation")
+    write_job(staging, "Product Manager @ Acme.mhtml", "Payments platform in Berlin")
+    write_job(staging, "Software Engineer @ Initech.mhtml", "Backend role")
+    write_job(staging, "Senior Product Manager @ Monzo.mhtml", "Fintech in London")
+    (staging / "Corrupt @ Nowhere.mhtml").write_bytes(b"\x00\x01 not mhtml")
+    return staging
+
+
+class TestAnalyzeAllJobs:
+    """Test serial and pooled bulk analysis"""
+
+    def test_pool_matches_serial(self, staging, capsys):
+        """Worker processes produce identical, identically ordered results"""
+        serial = analyze_all_jobs(staging, workers=1)
+        pooled = analyze_all_jobs(staging, workers=3)
+
+        assert pooled == serial
+        assert [job['company'] for job in serial] == ["Booking", "Monzo", "Acme", "Initech"]
+
+    def test_sorted_by_fit_score(self, staging, capsys):
+        """Highest fit first; engineering roles score low"""
+        results = analyze_all_jobs(staging, workers=2)
+
+        scores = [job['fit_score'] for job in results]
+        assert scores == sorted(scores, reverse=True)
+        assert results[-1]['fit_score'] == 2.0
+
+    def test_errors_are_isolated(self, staging, capsys):
+        """A file without HTML is reported and skipped"""
+        results = analyze_all_jobs(staging, workers=2)
+
+        assert "Corrupt @ Nowhere.mhtml" not in [job['filename'] for job in results]
+        assert "Error extracting: No HTML content found" in capsys.readouterr().out
+
+    def test_profile_loaded_at_run(self, staging, capsys, monkeypatch):
+        """The profile compiled when analysis starts is used by every worker"""
+        profile = ScoringProfile(role_reject_keywords=['data analyst'])
+        monkeypatch.setattr(bulk_analyze, 'load_profile', lambda: profile)
+
+        results = analyze_all_jobs(staging, workers=2, use_cache=False)
+
+        initech = next(job for job in results if job['company'] == "Initech")
+        assert initech['fit_score'] > 2.0
+        assert results == analyze_all_jobs(staging, workers=1, use_cache=False,
+                                           preferences=profile.preferences())
+
+    def test_analyze_job_file_never_raises(self, tmp_path):
+        """Missing files come back as an error result"""
+        result = analyze_job_file(tmp_path / "Missing @ Gone.mhtml")
+
+        assert result['filename'] == "Missing @ Gone.mhtml"
+        assert 'error' in result
+
+
+class TestScoreCache:
+    """Test reuse of scored results between runs"""
+
+    def test_unchanged_files_reused(self, staging, capsys, monkeypatch):
+        """A repeat run extracts nothing and returns the same results"""
+        first = analyze_all_jobs(staging, workers=1)
+        monkeypatch.setattr(bulk_analyze, 'extract_job_info_from_mhtml',
+                            lambda filepath: pytest.fail(f"{filepath} was re-extracted"))
+
+        second = analyze_all_jobs(staging, workers=1)
+
+        assert second == first
+        assert "5 unchanged files reused" in capsys.readouterr().out
+
+    def test_changed_file_reanalyzed(self, staging, capsys):
+        """Editing a file invalidates its entry; touching it does not"""
+        analyze_all_jobs(staging, workers=1)
+        write_job(staging, "Product Manager @ Acme.mhtml", "Payments platform in London")
+        os.utime(staging / "Software Engineer @ Initech.mhtml", ns=(0, 0))
+
+        results = analyze_all_jobs(staging, workers=1)
+
+        out = capsys.readouterr().out
+        assert "4 unchanged files reused" in out
+        assert "Analyzing 1/1: Product Manager @ Acme.mhtml" in out
+        acme = next(job for job in results if job['company'] == "Acme")
+        assert "✅ Location: London" in acme['reasons']
+
+    def test_preference_change_invalidates(self, staging, capsys):
+        """Entries scored under different preferences are discarded"""
+        analyze_all_jobs(staging, workers=1)
+        cache_path = staging / SCORE_CACHE_NAME
+
+        assert ScoreCache.load(cache_path, bulk_analyze.scoring_key()).entries
+        assert not ScoreCache.load(cache_path, bulk_analyze.scoring_key(
+            dict(bulk_analyze.PREFERENCES, locations_high_priority=['paris']))).entries
+
+    def test_preference_change_rescores_without_extraction(self, staging, capsys, monkeypatch):
+        """Stored job info is re-scored in one batch when the scoring key changes"""
+        first = analyze_all_jobs(staging, workers=1)
+        cache_path = staging / SCORE_CACHE_NAME
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+        data['scoring_key'] = "scored-with-older-preferences"
+        cache_path.write_text(json.dumps(data), encoding='utf-8')
+        monkeypatch.setattr(bulk_analyze, 'extract_job_info_from_mhtml',
+                            lambda filepath: pytest.fail(f"{filepath} was re-extracted"))
+
+        second = analyze_all_jobs(staging, workers=1)
+
+        assert second == first
+        assert "Re-scoring 4 unchanged jobs" in capsys.readouterr().out
+        assert json.loads(cache_path.read_text(encoding='utf-8'))['scoring_key'] == bulk_analyze.scoring_key()
+        assert len(ScoreCache.load(cache_path, bulk_analyze.scoring_key()).entries) == 5
+
+    def test_organize_uses_cached_scores(self, staging, capsys, monkeypatch):
+        """Tier folders are filled from cached scores without re-extraction"""
+        results = analyze_all_jobs(staging, workers=1)
+        monkeypatch.setattr(bulk_analyze, 'extract_job_info_from_mhtml',
+                            lambda filepath: pytest.fail(f"{filepath} was re-extracted"))
+
+        counts = organize_by_tier(analyze_all_jobs(staging, workers=1), staging)
+
+        assert sum(counts.values()) == len(results) == 4
+        assert (staging / "tier1-apply-now" / "Director of Product @ Booking.mhtml").exists()
+        assert (staging / "archive" / "Software Engineer @ Initech.mhtml").exists()
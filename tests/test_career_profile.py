@@ -0,0 +1,169 @@
+"""
+Tests for the career-preferences.md compiler (scripts/career_profile.py)
+
+Verifies that:
+- Locations, industries, seniority and role titles are compiled into the profile
+- Role types to avoid and industry keyword weights are compiled too
+- Template placeholders are skipped and empty fields keep the defaults
+- The compiled profile is cached and only recompiled when the file changes
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+import career_profile
+from career_profile import DEFAULT_PREFERENCES, ScoringProfile, compile_profile, load_profile
+
+
+PREFERENCES = """# Career Preferences & Constraints
+
+## Geographic Preferences
+
+### Primary Locations (Preferred)
+- **London, UK** - Current location (Shoreditch)
+- **Remote (UK-based)** - Flexible work arrangements
+
+### Open to Relocation
+- ✅ **Singapore** - Open to relocation
+- ✅ **EU (Polish citizen)** - Easy relocation
+  - Amsterdam
+  - Berlin
+  - Other EU cities
+
+### Not Open to Relocation
+- ❌ **North America** (US, Canada, etc.)
+- ❌ **Middle East** (Saudi Arabia, etc.) - Exception: UAE ✅
+
+## Role Preferences
+
+### Ideal Role Types (Priority Order)
+
+**1. Data Platform Product Leadership** (Fit: 9-10)
+- Director of Product, Data Platform
+- Head of Product - CDP
+
+**Note on AI Roles:**
+- ✅ **Open to:** AI product roles
+- ⚠️ **Avoid:** Engineering management, B2B-only roles
+
+## Industry Preferences
+
+### Preferred Industries (Strong Fit)
+
+**Tier 1 - Highest Interest:**
+- ✅ **Travel & Hospitality** - 8 years at Booking
+- ✅ **MarTech/AdTech** - CDP experience
+
+**Tier 2 - Good Fit:**
+- ✅ **Fintech** - Payments exposure
+
+### Industries to Avoid
+- ❌ **Gaming** - Not interested
+
+## Seniority Level
+
+### Target Levels
+- ✅ **Director** - Preferred
+- ✅ **Head of Product** - Preferred
+- ✅ **VP Product** - Stretch but interested
+
+### Avoid
+- ❌ **Mid-level PM** - Step back
+"""
+
+
+@pytest.fixture
+def preferences_file(tmp_path):
+    path = tmp_path / "career-preferences.md"
+    path.write_text(PREFERENCES, encoding='utf-8')
+    return path
+
+
+class TestCompileProfile:
+    """Test markdown parsing"""
+
+    def test_locations(self):
+        """Primary, relocation and rejected locations (with listed countries)"""
+        profile = compile_profile(PREFERENCES)
+
+        assert profile.locations_high_priority == ['london', 'uk', 'remote uk']
+        assert profile.locations_medium_priority == ['singapore', 'eu', 'amsterdam', 'berlin']
+        assert profile.locations_reject == ['north america', 'us', 'canada', 'middle east', 'saudi arabia']
+
+    def test_industries_and_seniority(self):
+        """Industry tiers become keyword weights; avoid lists are kept"""
+        profile = compile_profile(PREFERENCES)
+
+        assert profile.keywords_high_value == ['travel', 'hospitality', 'martech', 'adtech']
+        assert profile.keywords_medium_value == ['fintech']
+        assert profile.industries_avoid == ['gaming']
+        assert profile.seniority_target == ['director', 'head of product', 'vp product']
+
+    def test_role_rejects_and_weights(self):
+        """Avoided role types and seniority levels; keywords weighted by tier"""
+        profile = compile_profile(PREFERENCES)
+
+        assert profile.role_reject_keywords == ['engineering management', 'b2b-only roles', 'mid-level pm']
+        assert profile.keyword_weights == {'travel': 1.5, 'hospitality': 1.5, 'martech': 1.5, 'adtech': 1.5,
+                                           'fintech': 0.5}
+        assert profile.preferences()['industries_avoid'] == ['gaming']
+
+    def test_searches_from_role_titles(self):
+        """Each ideal role title is searched in the first primary location"""
+        searches = [query.to_dict() for query in compile_profile(PREFERENCES).searches]
+
+        assert searches == [
+            {'keywords': 'Director of Product, Data Platform', 'location': 'London, UK',
+             'experience_level': ['director', 'executive']},
+            {'keywords': 'Head of Product - CDP', 'location': 'London, UK',
+             'experience_level': ['director', 'executive']},
+        ]
+
+    def test_template_keeps_defaults(self):
+        """The unfilled template only contains placeholders"""
+        template = Path(__file__).parent.parent / "career-preferences.template.md"
+
+        profile = compile_profile(template.read_text(encoding='utf-8'))
+
+        assert profile.preferences() == DEFAULT_PREFERENCES
+        assert profile.searches == []
+
+
+class TestLoadProfile:
+    """Test the compiled-profile cache"""
+
+    def test_missing_file_gives_defaults(self, tmp_path):
+        """Without career-preferences.md nothing is compiled or cached"""
+        profile = load_profile(tmp_path / "missing.md", tmp_path / "cache.json")
+
+        assert profile == ScoringProfile()
+        assert not (tmp_path / "cache.json").exists()
+
+    def test_cached_until_file_changes(self, preferences_file, tmp_path, monkeypatch):
+        """Unchanged files are served from the cache; edits recompile"""
+        cache_path = tmp_path / "insights" / ".career-profile.json"
+        compiled = load_profile(preferences_file, cache_path)
+
+        def fail(content, source=None):
+            raise AssertionError("profile was recompiled")
+        monkeypatch.setattr(career_profile, 'compile_profile', fail)
+        assert load_profile(preferences_file, cache_path) == compiled
+
+        monkeypatch.undo()
+        preferences_file.write_text(PREFERENCES.replace("**Singapore**", "**Dubai**"), encoding='utf-8')
+        stat = preferences_file.stat()
+        os.utime(preferences_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert load_profile(preferences_file, cache_path).locations_medium_priority[0] == 'dubai'
+
+    def test_corrupt_cache_recompiles(self, preferences_file, tmp_path, capsys):
+        """An unreadable cache is ignored and rewritten"""
+        cache_path = tmp_path / ".career-profile.json"
+        cache_path.write_text("{not json", encoding='utf-8')
+
+        profile = load_profile(preferences_file, cache_path)
+
+        assert profile.keywords_medium_value == ['fintech']
+        assert "Ignoring unreadable profile cache" in capsys.readouterr().out
+        assert load_profile(preferences_file, cache_path) == profile
@@ -0,0 +1,126 @@
+"""
+Tests for the job deduplication index (scripts/dedup_index.py)
+
+Verifies that:
+- Company names and folder names normalize to the same keys
+- Application folders are indexed at any depth (status-folder layout)
+- Title matching accepts partial and reordered titles of the same role,
+  but not a longer title containing an application's title
+- Jobs added during a batch are caught as duplicates
+- A saved index is reused until an application folder is added
+- process_saved_jobs flags existing and repeated jobs through the index
+"""
+
+import pytest
+from pathlib import Path
+
+from dedup_index import DedupIndex, company_key, title_tokens
+from process_saved_jobs import JobProcessor
+
+
+@pytest.fixture
+def applications(tmp_path):
+    root = tmp_path / "applications"
+    for folder in ("active/applied/2025-11-BookingCom-DirectorProductDataPlatform",
+                   "active/interview/2025-10-Kraken-SeniorProductManager",
+                   "archive/2025-01-Monzo-Head-of-Product",
+                   "_example-application"):
+        (root / folder).mkdir(parents=True)
+    return root
+
+
+class TestNormalization:
+    """Test company keys and title tokens"""
+
+    def test_company_key(self):
+        assert company_key("Booking.com Ltd") == company_key("BookingCom") == "bookingcom"
+        assert company_key("BookingcomLtd") == company_key("Bookingcom-Limited") == "bookingcom"
+        assert company_key("Monzo Bank") == "monzobank"
+        assert company_key("Inc") == "inc"
+
+    def test_title_tokens(self):
+        """Punctuation, hyphens and CamelCase all split into the same words"""
+        assert title_tokens("Director, Product - Data Platform") == \
+               title_tokens("DirectorProductDataPlatform") == \
+               {"director", "product", "data", "platform"}
+        assert title_tokens("VP, AI/ML Product") == {"vp", "ai", "ml", "product"}
+
+
+class TestDedupIndex:
+    """Test index build and lookups"""
+
+    def test_indexes_nested_folders(self, applications):
+        """Status folders are walked; templates and non-application folders are not indexed"""
+        index = DedupIndex.build(applications)
+
+        assert len(index) == 3
+        assert Path(index.find("Monzo", "Head of Product")).name == "2025-01-Monzo-Head-of-Product"
+
+    def test_title_matching(self, applications):
+        """Leading words or the whole existing title must match"""
+        index = DedupIndex.build(applications)
+
+        assert index.find("Booking.com", "Director of Product, Data Platform") is not None
+        assert index.find("Booking.com", "Director of Product") is None
+        assert index.find("Kraken", "Senior Product Manager - Payments") is not None
+        assert index.find("Kraken", "Product Manager") is not None
+        assert index.find("Kraken", "Director of Engineering") is None
+        assert index.find("Revolut", "Senior Product Manager") is None
+        assert index.find("Kraken", "") is None
+        assert index.find("Kraken", "Product Manager, Senior") is not None
+
+    def test_longer_title_is_another_role(self, tmp_path):
+        """A title that only contains an application's title is not a duplicate"""
+        index = DedupIndex.build(tmp_path / "missing")
+        index.add("BookingcomLtd", "ProductManager", tmp_path / "2025-11-BookingcomLtd-ProductManager")
+
+        assert index.find("Booking.com", "Senior Product Manager") is None
+        assert index.find("Booking.com", "Product Manager") is not None
+
+    def test_added_jobs_are_found(self, tmp_path):
+        """Jobs accepted earlier in a batch count as existing"""
+        index = DedupIndex.build(tmp_path / "missing")
+        index.add("Angi", "Group Product Manager", tmp_path / "batch" / "2025-11-Angi-GroupProductManager")
+
+        assert index.find("ANGI", "Group Product Manager, Growth").endswith("2025-11-Angi-GroupProductManager")
+
+    def test_saved_index_until_folders_change(self, applications, tmp_path, monkeypatch):
+        """The saved index is reused while folder mtimes are unchanged"""
+        index_path = tmp_path / "insights" / ".dedup-index.json"
+        DedupIndex.load(applications, index_path)
+
+        monkeypatch.setattr(DedupIndex, 'build', classmethod(lambda cls, root: pytest.fail("rebuilt")))
+        assert len(DedupIndex.load(applications, index_path)) == 3
+        monkeypatch.undo()
+
+        (applications / "active" / "applied" / "2025-11-Angi-GroupProductManager").mkdir()
+        index = DedupIndex.load(applications, index_path)
+
+        assert len(index) == 4
+        assert index.find("Angi", "Group Product Manager") is not None
+
+
+def saved_job(folder, name, title, company):
+    (folder / name).write_text(f"# {title}\n\n**Company:** {company}\n**Location:** London\n\nRole\n",
+                               encoding='utf-8')
+
+
+class TestProcessSavedJobs:
+    """Test deduplication during batch processing"""
+
+    def test_existing_and_repeated_jobs(self, applications, tmp_path, capsys):
+        """Tracked roles and repeats within the batch are both duplicates"""
+        saves = tmp_path / "staging" / "manual-saves"
+        saves.mkdir(parents=True)
+        saved_job(saves, "1.md", "Senior Product Manager", "Kraken")
+        saved_job(saves, "2.md", "Group Product Manager", "Angi")
+        saved_job(saves, "3.md", "Group Product Manager", "Angi Inc")
+
+        results = JobProcessor(tmp_path).process_batch(saves, dry_run=True)
+
+        assert (results['processed'], results['duplicates']) == (1, 2)
+        statuses = {job['company']: job['status'] for job in results['jobs']}
+        assert statuses['Kraken'] == 'duplicate'
+        assert sorted([statuses['Angi'], statuses['Angi Inc']]) == ['duplicate', 'processed']
+        kraken = next(job for job in results['jobs'] if job['company'] == "Kraken")
+        assert kraken['existing_folder'].endswith("2025-10-Kraken-SeniorProductManager")
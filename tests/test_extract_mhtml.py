@@ -0,0 +1,187 @@
+"""
+Tests for the streaming MHTML reader (deprecated/automation/extract_mhtml.py)
+
+Verifies that:
+- MIME parts are walked in order with their headers
+- Only the text/html part is decoded (quoted-printable, base64, charset)
+- Boundaries split across read blocks are still found
+- Visible text skips scripts/styles and decodes entities
+- LinkedIn/Greenhouse/Lever description containers are recognised and
+  parsing stops once the description has been read
+- Job info is extracted from a saved page
+"""
+
+import base64
+import io
+import quopri
+import pytest
+
+from extract_mhtml import (MhtmlReader, extract_job_info_from_mhtml, extract_text_from_html,
+                           iter_visible_text, read_html_from_mhtml)
+
+
+BOUNDARY = "----MultipartBoundary--Q2kLjd----"
+
+HTML = ("<html><body><nav>Home Jobs</nav><h2>About the job</h2>"
+        "<p>Kraken is hiring a Product Manager – Payments. Café culture.</p>"
+        "<button>Show more</button></body></html>")
+
+
+def build_mhtml(parts):
+    """Chrome-style multipart/related file from (content type, encoding, body bytes)"""
+    out = (f"From: <Saved by Blink>\r\nSubject: Job\r\nMIME-Version: 1.0\r\n"
+           f"Content-Type: multipart/related;\r\n\ttype=\"text/html\";\r\n\tboundary=\"{BOUNDARY}\"\r\n"
+           f"\r\n\r\n").encode()
+    for content_type, encoding, body in parts:
+        out += (f"--{BOUNDARY}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Transfer-Encoding: {encoding}\r\nContent-Location: https://example.com/x\r\n"
+                f"\r\n").encode()
+        out += body + b"\r\n"
+    return out + f"--{BOUNDARY}--\r\n".encode()
+
+
+def html_part():
+    return ("text/html", "quoted-printable",
+            quopri.encodestring(HTML.encode('utf-8')).replace(b"\n", b"\r\n"))
+
+
+def image_part(size=50000):
+    return ("image/png", "base64", base64.encodebytes(bytes(range(256)) * (size // 256)))
+
+
+class TestMhtmlReader:
+    """Test MIME part streaming"""
+
+    def test_parts_in_order(self):
+        """Every part is visited with its content type"""
+        data = build_mhtml([image_part(), ("text/css", "quoted-printable", b"body{}"), html_part()])
+
+        types = [part.content_type for part in MhtmlReader(io.BytesIO(data)).parts()]
+
+        assert types == ["image/png", "text/css", "text/html"]
+
+    def test_decodes_quoted_printable_as_utf8(self):
+        """Multi-byte UTF-8 escapes decode to the original characters"""
+        data = build_mhtml([html_part()])
+        part = next(MhtmlReader(io.BytesIO(data)).parts())
+
+        assert "".join(part.iter_text()).strip() == HTML
+
+    def test_base64_round_trip(self):
+        """Binary parts decode to their original bytes when read"""
+        data = build_mhtml([image_part(size=25600)])
+        part = next(MhtmlReader(io.BytesIO(data)).parts())
+
+        assert b"".join(part.iter_bytes()) == bytes(range(256)) * 100
+
+    @pytest.mark.parametrize("read_size", [1, 7, 36, 37, 38, 4096])
+    def test_small_read_blocks(self, read_size):
+        """Boundaries split across blocks are found"""
+        data = build_mhtml([image_part(), html_part(), image_part()])
+
+        parts = [(part.content_type, b"".join(part.iter_bytes()))
+                 for part in MhtmlReader(io.BytesIO(data), read_size=read_size).parts()]
+        expected = [(part.content_type, b"".join(part.iter_bytes()))
+                    for part in MhtmlReader(io.BytesIO(data)).parts()]
+
+        assert parts == expected
+
+    def test_stops_after_html_part(self):
+        """Reading the HTML does not consume the image parts after it"""
+        data = build_mhtml([html_part()] + [image_part(size=200000)] * 5)
+        stream = io.BytesIO(data)
+        reader = MhtmlReader(stream)
+
+        for part in reader.parts():
+            if part.content_type == "text/html":
+                "".join(part.iter_text())
+                break
+
+        assert stream.tell() < len(data) // 4
+
+
+def description_of(html):
+    return " ".join(text.strip() for text, in_description in iter_visible_text([html]) if in_description)
+
+
+class TestVisibleText:
+    """Test the incremental HTML text extractor"""
+
+    def test_visible_text_only(self):
+        """Scripts, styles and tags are dropped; entities are decoded"""
+        html = ("<html><head><title>Job</title><style>p{color:red}</style></head><body>"
+                "<script>var s = '<p>hidden</p>';</script><p>Salary &amp; benefits&nbsp;included</p>"
+                "<svg><text>icon</text></svg><br>Apply</body></html>")
+
+        assert extract_text_from_html(html) == "Job Salary & benefits included Apply"
+
+    @pytest.mark.parametrize("container", [
+        '<div class="jobs-description__content jobs-description-content">',
+        '<div class="show-more-less-html__markup relative">',
+        '<div class="job__description body">',
+        '<div class="content-wrapper posting-page">',
+    ])
+    def test_description_containers(self, container):
+        """LinkedIn, Greenhouse and Lever containers are recognised"""
+        html = f"<nav>Jobs Home</nav>{container}<p>Own the <b>payments</b> roadmap</p></div><footer>More</footer>"
+
+        assert description_of(html) == "Own the payments roadmap"
+
+    def test_greenhouse_content_needs_app_body(self):
+        """id="content" only counts inside Greenhouse's #app_body"""
+        assert description_of('<div id="content"><p>Whole page</p></div>') == ""
+        assert description_of('<div id="app_body"><div id="content"><p>Role</p></div>'
+                              '<div id="application">Form</div></div>') == "Role"
+
+    def test_stops_after_description(self):
+        """Text after the description container is never parsed"""
+        html = ('<div class="jobs-description__content"><h2>About the job</h2><p>Role</p></div>'
+                + "<li>Similar job</li>" * 5000)
+
+        texts = [text for text, _ in iter_visible_text([html])]
+
+        assert texts == ["About the job", "Role"]
+        assert len(texts) < len(list(iter_visible_text([html], stop_at_description=False)))
+
+    def test_empty_placeholder_does_not_stop(self):
+        """An empty container (not yet loaded) is skipped"""
+        html = ('<div class="show-more-less-html__markup"></div><p>Chrome</p>'
+                '<div class="jobs-description__content"><p>Real description</p></div>')
+
+        assert description_of(html) == "Real description"
+
+
+class TestExtractJobInfo:
+    """Test job info extraction from a saved page"""
+
+    def test_extracts_description(self, tmp_path):
+        """Company, title and the 'About the job' section are extracted"""
+        path = tmp_path / "Product Manager @ Kraken.mhtml"
+        path.write_bytes(build_mhtml([html_part(), image_part()]))
+
+        info = extract_job_info_from_mhtml(path)
+
+        assert info['company'] == "Kraken"
+        assert info['job_title'] == "Product Manager"
+        assert info['description'] == "Kraken is hiring a Product Manager – Payments. Café culture."
+
+    def test_uses_description_container(self, tmp_path):
+        """The container text is used without the 'About the job' heading"""
+        html = ("<nav>Save Apply</nav><div class='jobs-description__content'><h2>About the job</h2>"
+                "<p>Lead our Save &amp; Apply flows.</p></div><footer>Footer</footer>")
+        path = tmp_path / "Product Manager @ Kraken.mhtml"
+        path.write_bytes(build_mhtml([("text/html", "8bit", html.encode('utf-8'))]))
+
+        info = extract_job_info_from_mhtml(path)
+
+        assert info['description'] == "Lead our Save & Apply flows."
+        # Parsing stopped after the description: the footer was never read
+        assert info['extracted_text_length'] == len("Save Apply About the job Lead our Save & Apply flows.")
+
+    def test_no_html_part(self, tmp_path):
+        """Files without a text/html part give no HTML"""
+        path = tmp_path / "Empty @ Nowhere.mhtml"
+        path.write_bytes(build_mhtml([image_part()]))
+
+        assert read_html_from_mhtml(path) is None
+        assert extract_job_info_from_mhtml(path) is None
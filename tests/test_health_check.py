@@ -0,0 +1,136 @@
+"""
+Tests for the health check scanning stage (scripts/health_check.py)
+
+Verifies that:
+- The tree is scanned once into per-folder snapshots
+- Checks run against the snapshot (missing CVs, missing files, orphans)
+- Terminal statuses with a trailing note still flag job files left in staging
+- A missing applications/ folder gives an empty snapshot
+"""
+
+import pytest
+
+from health_check import HealthChecker, load_snapshot
+
+
+def make_folder(applications, name, status=None, files=()):
+    folder = applications / name
+    folder.mkdir(parents=True)
+    if status:
+        (folder / "status.md").write_text(
+            f"# Application Status - {name} - PM\n\n**Current Status:** {status}\n", encoding='utf-8')
+    for filename in files:
+        (folder / filename).write_text("x", encoding='utf-8')
+    return folder
+
+
+@pytest.fixture
+def root(tmp_path):
+    applications = tmp_path / "applications"
+    make_folder(applications, "2025-01-Kraken-PM", status="applied",
+                files=("analysis.md", "job-description.md", "ArturSwadzba_CV_Kraken.pdf"))
+    make_folder(applications, "2025-01-Angi-PM", status="applied", files=("analysis.md",))
+    make_folder(applications, "notes", status="applied")
+    return tmp_path
+
+
+class TestScan:
+    """Test the single-pass snapshot"""
+
+    def test_scan_loads_matching_folders(self, root):
+        """Only 2025-* folders are snapshotted, each with its parsed status"""
+        checker = HealthChecker(root, max_workers=2)
+
+        snapshots = checker.scan()
+
+        assert [app.name for app in snapshots] == ["2025-01-Angi-PM", "2025-01-Kraken-PM"]
+        assert all(app.status.status == "applied" for app in snapshots)
+        assert checker.scan() is snapshots
+
+    def test_snapshot_contents(self, root):
+        """Snapshot holds the folder listing and job description text"""
+        app = load_snapshot(root / "applications" / "2025-01-Kraken-PM")
+
+        assert app.has("analysis.md")
+        assert app.matching("*_CV_*.pdf") == ["ArturSwadzba_CV_Kraken.pdf"]
+        assert app.job_description == "x"
+
+    def test_missing_applications_folder(self, tmp_path):
+        """No applications/ folder gives an empty snapshot"""
+        assert HealthChecker(tmp_path).scan() == []
+
+
+class TestChecksUseSnapshot:
+    """Test checks against the in-memory snapshot"""
+
+    def test_missing_cv_and_files(self, root):
+        """Applied without a CV and incomplete folders are reported"""
+        checker = HealthChecker(root)
+        checker.check_missing_cvs()
+        checker.check_missing_analysis_files()
+
+        assert checker.issues['missing_cvs'] == [
+            "2025-01-Angi-PM: Status is 'applied' but no CV PDF found"
+        ]
+        assert checker.warnings['missing_files'] == [
+            "2025-01-Angi-PM: Missing job-description.md"
+        ]
+
+    def test_orphaned_job_file(self, root):
+        """A job file matching no folder is an orphan"""
+        applying = root / "staging" / "3-applying"
+        applying.mkdir(parents=True)
+        (applying / "Kraken Director.mhtml").write_text("x", encoding='utf-8')
+        (applying / "Unrelated Company.mhtml").write_text("x", encoding='utf-8')
+
+        checker = HealthChecker(root)
+        checker.check_orphaned_files()
+
+        assert checker.issues['orphaned_files'] == [
+            "Unrelated Company.mhtml in staging/3-applying/ has no corresponding application folder"
+        ]
+
+    def test_terminal_status_with_note(self, tmp_path):
+        """'Rejected (no response)' is a terminal status like 'Rejected'"""
+        make_folder(tmp_path / "applications", "2025-01-Kraken", status="Rejected (no response)")
+        applying = tmp_path / "staging" / "3-applying"
+        applying.mkdir(parents=True)
+        (applying / "Kraken Director.mhtml").write_text("x", encoding='utf-8')
+
+        checker = HealthChecker(tmp_path)
+        checker.check_status_file_location_consistency()
+
+        assert checker.issues['status_consistency'] == [
+            "2025-01-Kraken: Status is 'rejected' but job file still in staging/3-applying/ (should be in rejected/)"
+        ]
+
+
+class TestMatchIndex:
+    """Test the inverted indexes used for orphan detection"""
+
+    def test_source_file_reference(self, tmp_path):
+        """A job file named in job-description.md matches that folder"""
+        applications = tmp_path / "applications"
+        folder = make_folder(applications, "2025-02-Angi-Director")
+        (folder / "job-description.md").write_text(
+            '---\nsource_file: "Director of Product Management, Platform at Angi.mhtml"\n---\n',
+            encoding='utf-8')
+
+        checker = HealthChecker(tmp_path)
+        job_file = tmp_path / "Director of Product Management, Platform at Angi.mhtml"
+
+        assert checker._find_matching_application(job_file) == folder
+        assert checker.match_index().find_by_reference("Platform at Angi.mhtml") == folder
+        assert checker.match_index().find_by_reference("Other.mhtml") is None
+
+    def test_token_match_prefers_first_folder_on_ties(self, tmp_path):
+        """Equal token overlap keeps the first folder in scan order"""
+        applications = tmp_path / "applications"
+        first = make_folder(applications, "2025-01-Kraken-Payments")
+        make_folder(applications, "2025-02-Payments-Kraken")
+        make_folder(applications, "2025-03-Monzo-Growth")
+
+        checker = HealthChecker(tmp_path)
+
+        assert checker._find_matching_application(tmp_path / "Kraken Payments.mhtml") == first
+        assert checker._find_matching_application(tmp_path / "Stripe Risk.mhtml") is None
@@ -0,0 +1,87 @@
+"""
+Tests for the compiled keyword matcher (deprecated/automation/keyword_matcher.py)
+
+Verifies that:
+- Terms only match whole words ("uk" is not found in "bulk")
+- Overlapping phrases and their component words are all found in one pass
+- Plurals of longer words match their term; other derived words do not
+- calculate_fit_score gives the same scores through the matcher
+"""
+
+import pytest
+
+from bulk_analyze import PREFERENCE_MATCHER, calculate_fit_score
+from keyword_matcher import KeywordMatcher
+
+
+@pytest.fixture
+def matcher():
+    return KeywordMatcher(['uk', 'london', 'platform', 'data platform', 'customer data platform',
+                           'head of', 'lead', 'product lead', 'hotel'])
+
+
+class TestKeywordMatcher:
+    """Test compiled vocabulary matching"""
+
+    def test_whole_words_only(self, matcher):
+        """Short terms inside longer words are not matches"""
+        assert matcher.find_all("Bulk hiring, misleading replatforming ads") == set()
+        assert matcher.find_all("Based in the UK (London)") == {'uk', 'london'}
+
+    def test_overlapping_phrases(self, matcher):
+        """Every phrase ending at the same word is reported"""
+        found = matcher.find_all("Own our Customer Data Platform")
+
+        assert found == {'customer data platform', 'data platform', 'platform'}
+
+    def test_phrase_words_must_be_adjacent(self, matcher):
+        """Words of a phrase separated by another word do not match"""
+        assert matcher.find_all("head office of the data team") == set()
+        assert matcher.find_all("Head of Product") == {'head of'}
+
+    def test_plural_forms(self, matcher):
+        """Longer words also match their plurals"""
+        assert matcher.find_all("Product Leads for hotels") == {'product lead', 'lead', 'hotel'}
+        assert matcher.find_all("Across data platforms") == {'data platform', 'platform'}
+        assert matcher.find_all("UKs") == set()
+
+    def test_derived_words_are_other_terms(self, matcher):
+        """'leadership', 'leader' and 'heading' are not the vocabulary words they start with"""
+        assert matcher.find_all("Product Leader with leadership skills") == set()
+        assert matcher.find_all("Heading of the hotelier page") == set()
+
+    def test_several_texts(self, matcher):
+        """Matches from all texts are combined; empty texts are ignored"""
+        assert matcher.find_all("Product Lead", "", "London") == {'product lead', 'lead', 'london'}
+
+
+class TestCalculateFitScore:
+    """Test scoring through the compiled preference matcher"""
+
+    def test_every_preference_is_compiled(self):
+        """All preference and domain terms are in the vocabulary"""
+        assert {'london', 'head of', 'marketing technology', 'booking'} <= set(PREFERENCE_MATCHER.terms)
+
+    def test_travel_director_in_london(self):
+        """Location, seniority, keywords and domain all score"""
+        score, reasons, concerns = calculate_fit_score({
+            'job_title': 'Director of Product',
+            'description': 'Hotels marketplace in London: growth, experimentation and data platform.',
+            'company': 'Booking',
+        })
+
+        assert score == 10.0
+        assert "✅ Location: London" in reasons
+        assert "✅ Travel/hospitality domain (strong fit)" in reasons
+        assert concerns == []
+
+    def test_substrings_do_not_reject(self):
+        """'uk' inside 'bulk' no longer counts as a location"""
+        score, reasons, _ = calculate_fit_score({
+            'job_title': 'Product Manager',
+            'description': 'Bulk ordering tools for small shops.',
+            'company': 'Acme',
+        })
+
+        assert not any(reason.startswith("✅ Location") for reason in reasons)
+        assert score == 4.0
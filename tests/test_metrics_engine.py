@@ -0,0 +1,114 @@
+"""
+Tests for the single-pass dashboard metrics engine (scripts/metrics_engine.py)
+
+Verifies that:
+- KPIs, fit buckets and conversion rates are counted from the snapshot columns
+- Pipeline stages count recorded events, also when their date does not parse
+- Recent activity keeps rows analyzed in the last 7 days, most recent first
+- The top 10 is the same as a full sort by fit score (ties in input order)
+- Dashboards rendered from the engine's metrics match the sections' own computation
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from application_snapshot import ApplicationSnapshot
+from dashboard_sections import METRICS_REPORT, SECTIONS
+from metrics_engine import compute_metrics
+from report_writer import render_report
+
+
+TODAY = date.today()
+
+
+def make_app(n, status, fit_score=None, applied=None, rejected=None, withdrawn=None,
+             interviews=(), analyzed_days_ago=30, cv=False):
+    return {
+        'folder_name': f"2025-01-Company{n}-Role", 'company': f"Company{n}", 'role': "Director of Product",
+        'status': status, 'fit_score': fit_score, 'last_updated': "2025-02-01 10:00",
+        'analyzed_date': (TODAY - timedelta(days=analyzed_days_ago)).isoformat() if analyzed_days_ago is not None else None,
+        'applied_date': applied, 'rejected_date': rejected, 'withdrawn_date': withdrawn,
+        'interview_dates': list(interviews), 'cv_generated': cv, 'cover_letter_generated': False,
+        'location': "London", 'file_path': f"Company{n}/status.md", 'days_waiting': 0, 'outcome': None,
+    }
+
+
+@pytest.fixture
+def applications():
+    apps = [
+        make_app(0, 'rejected', 8.5, applied="2025-01-08", rejected="2025-01-20",
+                 interviews=["2025-01-14"], cv=True, analyzed_days_ago=2),
+        make_app(1, 'analysis phase', 7.0, analyzed_days_ago=0),
+        make_app(2, 'applied', None, applied="2025-02-03", cv=True, analyzed_days_ago=7),
+        make_app(3, 'withdrawn', 9.0, applied="2025-02-01", withdrawn="2025-02-10", analyzed_days_ago=None),
+    ]
+    # Enough scored applications for the top 10 to drop some, with ties
+    apps += [make_app(n, 'analysis phase', [6.0, 8.5, 7.5][n % 3], analyzed_days_ago=n) for n in range(4, 20)]
+    return apps
+
+
+class TestComputeMetrics:
+    """Test the aggregates computed in one pass"""
+
+    def test_kpis(self, applications):
+        metrics = compute_metrics(ApplicationSnapshot.from_applications(applications), applications, TODAY)
+
+        assert metrics['total'] == 20
+        assert metrics['by_status'] == {'rejected': 1, 'analysis phase': 17, 'applied': 1, 'withdrawn': 1}
+        assert metrics['scored_count'] == 19
+        assert metrics['high_priority_count'] == 8
+        assert (metrics['applied_count'], metrics['interview_count'], metrics['rejected_count'],
+                metrics['withdrawn_count'], metrics['cv_generated_count']) == (3, 1, 1, 1, 2)
+        assert metrics['analysis_phase_count'] == 17
+        assert list(metrics['fit_distribution']) == [9, 8, 7, 6]
+        assert metrics['conversion'] == {'analysis_to_high_priority': 40.0, 'high_priority_to_applied': 37.5,
+                                         'applied_to_interview': 33.3}
+
+    def test_undated_events_count(self):
+        """Applied/rejected/withdrawn events count even without a parseable date"""
+        apps = [make_app(0, 'rejected', 8.0, applied="last week", rejected="yes (by email)"),
+                make_app(1, 'withdrawn', 7.0, applied="2025-01-08", withdrawn="TBD")]
+
+        metrics = compute_metrics(ApplicationSnapshot.from_applications(apps), apps, TODAY)
+
+        assert (metrics['applied_count'], metrics['rejected_count'], metrics['withdrawn_count']) == (2, 1, 1)
+
+    def test_recent_activity(self, applications):
+        metrics = compute_metrics(ApplicationSnapshot.from_applications(applications), applications, TODAY)
+
+        recent = [(app['company'], days_ago) for app, days_ago in metrics['recent_activity']]
+        assert recent == [("Company1", 0), ("Company0", 2), ("Company4", 4), ("Company5", 5),
+                          ("Company6", 6), ("Company2", 7), ("Company7", 7)]
+
+    def test_top_10_matches_full_sort(self, applications):
+        metrics = compute_metrics(ApplicationSnapshot.from_applications(applications), applications, TODAY)
+
+        expected = sorted([a for a in applications if a['fit_score']],
+                          key=lambda a: a['fit_score'], reverse=True)[:10]
+        assert metrics['top_10'] == expected
+
+    def test_rows_without_applications(self, applications):
+        """Without the dicts, rows are returned as snapshot indices"""
+        metrics = compute_metrics(ApplicationSnapshot.from_applications(applications), today=TODAY)
+
+        assert metrics['top_10'][0] == 3
+        assert metrics['recent_activity'][0] == (1, 0)
+
+    def test_empty(self):
+        metrics = compute_metrics(ApplicationSnapshot.from_applications([]), [], TODAY)
+
+        assert (metrics['total'], metrics['avg_fit_score'], metrics['top_10']) == (0, 0, [])
+
+
+class TestDashboard:
+    """Test that sections render the same report from precomputed metrics"""
+
+    def test_same_dashboard(self, applications, sync_status):
+        metrics = sync_status.calculate_metrics(applications)
+        fallback = {key: value for key, value in metrics.items()
+                    if key not in ('scored_count', 'conversion', 'fit_distribution', 'recent_activity', 'top_10')}
+
+        sections = [name for name in METRICS_REPORT if name != 'metrics_header']
+        assert "".join(render_report(SECTIONS, sections, applications, metrics)) == \
+               "".join(render_report(SECTIONS, sections, applications, fallback))
@@ -0,0 +1,102 @@
+"""
+Tests for the status-folder migration (scripts/migrate-to-status-folders.py)
+
+Verifies that:
+- The plan maps every flat folder to its status target from one parse pass
+- Executing the plan moves every folder and writes the rollback journal first
+- Existing targets are skipped, never overwritten or nested into
+- Rollback restores the original layout, including after a partial migration
+"""
+
+import json
+import pytest
+
+
+def application(applications, name, status=None, updated="2025-08-14"):
+    folder = applications / name
+    folder.mkdir(parents=True)
+    if status:
+        (folder / "status.md").write_text(
+            f"# Application Status\n\n**Current Status:** {status}\n**Last Updated:** {updated}\n",
+            encoding='utf-8')
+    (folder / "analysis.md").write_text("analysis", encoding='utf-8')
+    return folder
+
+
+@pytest.fixture
+def applications(tmp_path):
+    applications = tmp_path / "applications"
+    application(applications, "2025-10-Kraken-SeniorPM", "Applied")
+    application(applications, "2025-08-Monzo-HeadOfProduct", "Rejected")
+    application(applications, "2025-11-Revolut-ProductLead", "Interviewing")
+    application(applications, "2025-11-Wise-GroupPM")
+    (applications / "_example-application").mkdir()
+    (applications / "active").mkdir()
+    return applications
+
+
+def layout(root):
+    return sorted(path.relative_to(root).as_posix() for path in root.rglob("analysis.md"))
+
+
+class TestPlan:
+    """Test planning without moving anything"""
+
+    def test_plan_targets(self, migrate, applications):
+        plan = migrate.plan_migration(applications, workers=4)
+
+        targets = {move.source.name: move.target.relative_to(applications).as_posix() for move in plan}
+        assert targets == {
+            "2025-08-Monzo-HeadOfProduct": "archive/2025-Q3/rejected/2025-08-Monzo-HeadOfProduct",
+            "2025-10-Kraken-SeniorPM": "active/applied/2025-10-Kraken-SeniorPM",
+            "2025-11-Revolut-ProductLead": "active/interviewing/2025-11-Revolut-ProductLead",
+            "2025-11-Wise-GroupPM": "active/analyzing/2025-11-Wise-GroupPM",
+        }
+        assert [move.source.name for move in plan] == sorted(targets)
+        assert len(migrate.group_by_target(plan)) == 4
+        assert (applications / "2025-10-Kraken-SeniorPM").exists()
+
+
+class TestExecute:
+    """Test concurrent execution and rollback"""
+
+    def test_execute_and_rollback(self, migrate, applications, tmp_path):
+        before = layout(applications)
+        journal = tmp_path / "insights" / ".migration-journal.json"
+        plan = migrate.plan_migration(applications)
+
+        results = migrate.execute_plan(plan, journal, workers=4)
+
+        assert [result['action'] for result in results] == ['MOVED'] * 4
+        assert all(move.target.is_dir() and not move.source.exists() for move in plan)
+        assert len(json.loads(journal.read_text(encoding='utf-8'))['moves']) == 4
+
+        restored = migrate.rollback(journal, workers=4)
+
+        assert [result['action'] for result in restored] == ['MOVED'] * 4
+        assert layout(applications) == before
+        assert not journal.exists()
+
+    def test_existing_target_skipped(self, migrate, applications, tmp_path):
+        application(applications / "active" / "applied", "2025-10-Kraken-SeniorPM", "Applied")
+        plan = migrate.plan_migration(applications)
+
+        results = migrate.execute_plan(plan, tmp_path / "journal.json")
+
+        actions = {move.source.name: result['action'] for move, result in zip(plan, results)}
+        assert actions["2025-10-Kraken-SeniorPM"] == 'SKIPPED (target exists)'
+        assert (applications / "2025-10-Kraken-SeniorPM" / "analysis.md").exists()
+        assert not (applications / "active" / "applied" / "2025-10-Kraken-SeniorPM" / "2025-10-Kraken-SeniorPM").exists()
+
+    def test_rollback_after_partial_migration(self, migrate, applications, tmp_path):
+        """Only folders that actually moved are moved back"""
+        before = layout(applications)
+        journal = tmp_path / "journal.json"
+        plan = migrate.plan_migration(applications)
+        migrate.write_journal(journal, plan)
+        migrate.execute_moves(plan[:2])
+
+        restored = migrate.rollback(journal)
+
+        assert len(restored) == 2
+        assert layout(applications) == before
@@ -0,0 +1,140 @@
+"""
+Tests for near-duplicate job detection (scripts/near_duplicates.py)
+
+Verifies that:
+- Reposted descriptions (new title, board metadata, small edits) are found
+- Unrelated descriptions and empty text are not
+- refresh() signs new and edited application descriptions and drops removed ones
+- The saved index round-trips and is reused without re-signing
+- process_saved_jobs flags reposts of tracked and same-batch jobs
+- bulk_analyze flags repeated postings within a batch
+"""
+
+import random
+
+from near_duplicates import NearDuplicateIndex, application_descriptions, minhash, similarity
+from bulk_analyze import flag_near_duplicates
+from process_saved_jobs import JobProcessor
+
+
+WORDS = ("product strategy roadmap customers growth data platform teams stakeholders discovery "
+         "experimentation metrics delivery vision marketplace payments partners analytics scale "
+         "engineering design research launch pricing retention mobile web api insights").split()
+
+
+def description(seed, length=200):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def job_markdown(title, company, body, url="https://example.com/job/1"):
+    return f"# {title}\n\n**Company:** {company}\n**Location:** London\n**URL:** {url}\n\n---\n\n{body}\n"
+
+
+def edited(body, every=60):
+    """A few words changed, as boards do when reposting"""
+    words = body.split()
+    return " ".join("updated" if i % every == 0 else word for i, word in enumerate(words))
+
+
+class TestSignatures:
+    """Test MinHash similarity estimates and LSH lookups"""
+
+    def test_similarity_estimates(self):
+        body = description(1)
+
+        assert similarity(minhash(body), minhash(body)) == 1.0
+        assert similarity(minhash(body), minhash(edited(body))) > 0.6
+        assert similarity(minhash(body), minhash(description(2))) < 0.2
+        assert minhash("") is None
+
+    def test_repost_found(self):
+        """Title and metadata lines are ignored; the description decides"""
+        body = description(1)
+        index = NearDuplicateIndex()
+        index.add("applications/2025-10-Kraken-SeniorProductManager",
+                  job_markdown("Senior Product Manager", "Kraken", body))
+
+        match = index.find(job_markdown("Product Lead, Payments", "Kraken Technologies", body,
+                                        url="https://otherboard.example/42"))
+
+        assert match == ("applications/2025-10-Kraken-SeniorProductManager", 1.0)
+        assert index.find(job_markdown("Product Lead", "Kraken", description(2))) is None
+        assert index.find("") is None
+
+
+class TestRefresh:
+    """Test keeping the index in sync with application folders"""
+
+    def test_refresh_and_reload(self, tmp_path):
+        applications = tmp_path / "applications"
+        kraken = applications / "active" / "2025-10-Kraken-SeniorProductManager"
+        monzo = applications / "2025-09-Monzo-HeadOfProduct"
+        for folder, seed in ((kraken, 1), (monzo, 2)):
+            folder.mkdir(parents=True)
+            (folder / "job-description.md").write_text(job_markdown("Role", "Co", description(seed)))
+        index_path = tmp_path / "insights" / ".near-duplicates.json"
+
+        index = NearDuplicateIndex.load(index_path)
+        assert index.refresh(application_descriptions(applications)) == 2
+        index.save(index_path)
+
+        reloaded = NearDuplicateIndex.load(index_path)
+        assert reloaded.refresh(application_descriptions(applications)) == 0
+        assert reloaded.find(description(2))[0] == str(monzo)
+
+        (kraken / "job-description.md").write_text(description(3))
+        (monzo / "job-description.md").unlink()
+        assert reloaded.refresh(application_descriptions(applications)) == 1
+        assert len(reloaded) == 1
+        assert reloaded.find(description(3))[0] == str(kraken)
+        assert reloaded.find(description(1)) is None
+
+    def test_unreadable_index_ignored(self, tmp_path, capsys):
+        index_path = tmp_path / ".near-duplicates.json"
+        index_path.write_text("{not json")
+
+        assert len(NearDuplicateIndex.load(index_path)) == 0
+
+
+class TestProcessSavedJobs:
+    """Test near-duplicate checks during batch processing"""
+
+    def test_reposts_flagged(self, tmp_path, capsys):
+        tracked = tmp_path / "applications" / "2025-10-Kraken-SeniorProductManager"
+        tracked.mkdir(parents=True)
+        (tracked / "job-description.md").write_text(job_markdown("Senior Product Manager", "Kraken", description(1)))
+        saves = tmp_path / "staging" / "manual-saves"
+        saves.mkdir(parents=True)
+        (saves / "1.md").write_text(job_markdown("Lead PM, Energy Platform", "Kraken", edited(description(1))))
+        (saves / "2.md").write_text(job_markdown("Director of Product", "Monzo", description(2)))
+        (saves / "3.md").write_text(job_markdown("Head of Product", "Monzo Bank", description(2)))
+
+        results = JobProcessor(tmp_path).process_batch(saves)
+
+        assert (results['processed'], results['duplicates']) == (1, 2)
+        kraken = next(job for job in results['jobs'] if job['company'] == "Kraken")
+        assert kraken['existing_folder'] == str(tracked)
+        assert kraken['similarity'] >= 0.8
+        assert (tmp_path / "insights" / ".near-duplicates.json").exists()
+
+        # The accepted Monzo job is remembered for the next batch
+        later = NearDuplicateIndex.load(tmp_path / "insights" / ".near-duplicates.json")
+        assert "Monzo" in later.find(description(2))[0]
+
+
+class TestBulkAnalyze:
+    """Test flagging within a bulk-analysis batch"""
+
+    def test_repeated_postings_flagged(self):
+        results = [{'filename': name, 'description': body, 'concerns': []}
+                   for name, body in (("a.mhtml", description(1)), ("b.mhtml", description(2)),
+                                      ("c.mhtml", edited(description(1))))]
+        known = NearDuplicateIndex()
+        known.add("applications/2025-09-Monzo-HeadOfProduct", description(2))
+
+        assert flag_near_duplicates(results, known) == 2
+        assert 'duplicate_of' not in results[0]
+        assert results[1]['duplicate_of'] == "2025-09-Monzo-HeadOfProduct"
+        assert results[2]['duplicate_of'] == "a.mhtml"
+        assert results[2]['concerns'][0].startswith("⚠️ Near-duplicate of a.mhtml")
@@ -0,0 +1,162 @@
+"""
+Tests for the in-process PDF metadata reader (scripts/pdf_metadata.py)
+
+Builds small PDFs in the three layouts found in practice:
+- Classic xref table + trailer
+- Cross-reference stream with compressed object stream (PDF 1.5, XeLaTeX)
+- Damaged xref (recovered by scanning object headers)
+"""
+
+import struct
+import zlib
+import pytest
+
+from pdf_metadata import PdfInfo, get_pdf_info, pdfinfo_text, read_pdf_info
+
+
+def page_objects(pages=2, media_box="[0 0 595.276 841.89]", rotate=None):
+    """Catalog, page tree and pages as {num: body}"""
+    kids = " ".join(f"{4 + i} 0 R" for i in range(pages))
+    extra = f" /Rotate {rotate}" if rotate is not None else ""
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        2: f"<< /Type /Pages /Kids [{kids}] /Count {pages} /MediaBox {media_box}{extra} >>",
+        3: "<< /Creator (LaTeX with \\(hyperref\\)) /Producer <FEFF00580065004C0061005400650058> >>",
+    }
+    for i in range(pages):
+        objects[4 + i] = "<< /Type /Page /Parent 2 0 R >>"
+    return objects
+
+
+def build_classic_pdf(objects, corrupt_xref=False):
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = {}
+    for num, body in sorted(objects.items()):
+        offsets[num] = len(out)
+        out += f"{num} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref_offset = len(out)
+    size = max(objects) + 1
+    out += f"xref\n0 {size}\n0000000000 65535 f \n".encode()
+    for num in range(1, size):
+        out += f"{offsets.get(num, 0):010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {size} /Root 1 0 R /Info 3 0 R >>\n".encode()
+    out += f"startxref\n{xref_offset + 7 if corrupt_xref else xref_offset}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def build_xref_stream_pdf(objects):
+    """All objects except the catalog live in a compressed object stream"""
+    out = bytearray(b"%PDF-1.5\n")
+    offsets = {}
+    offsets[1] = len(out)
+    out += f"1 0 obj\n{objects[1]}\nendobj\n".encode()
+
+    packed = [num for num in sorted(objects) if num != 1]
+    stream_num = max(objects) + 1
+    header, body = [], b""
+    for num in packed:
+        header.append(f"{num} {len(body)}")
+        body += objects[num].encode("latin-1") + b"\n"
+    header_bytes = (" ".join(header) + "\n").encode()
+    data = zlib.compress(header_bytes + body)
+    offsets[stream_num] = len(out)
+    out += (f"{stream_num} 0 obj\n<< /Type /ObjStm /N {len(packed)} /First {len(header_bytes)} "
+            f"/Filter /FlateDecode /Length {len(data)} >>\nstream\n").encode()
+    out += data + b"\nendstream\nendobj\n"
+
+    xref_num = stream_num + 1
+    offsets[xref_num] = len(out)
+    rows, previous = b"", bytes(4)
+    for num in range(xref_num + 1):
+        if num in packed:
+            row = struct.pack(">BHB", 2, stream_num, packed.index(num))
+        elif num in offsets:
+            row = struct.pack(">BHB", 1, offsets[num], 0)
+        else:
+            row = struct.pack(">BHB", 0, 0, 0)
+        # PNG "Up" predictor, as written by most producers
+        rows += b"\x02" + bytes((a - b) & 0xFF for a, b in zip(row, previous))
+        previous = row
+    data = zlib.compress(rows)
+    out += (f"{xref_num} 0 obj\n<< /Type /XRef /Size {xref_num + 1} /W [1 2 1] /Root 1 0 R /Info 3 0 R "
+            f"/Filter /FlateDecode /DecodeParms << /Columns 4 /Predictor 12 >> /Length {len(data)} >>\n"
+            "stream\n").encode()
+    out += data + b"\nendstream\nendobj\n"
+    out += f"startxref\n{offsets[xref_num]}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+@pytest.fixture
+def write_pdf(tmp_path):
+    def write(content, name="ArturSwadzba_CV_Test.pdf"):
+        path = tmp_path / name
+        path.write_bytes(content)
+        return path
+    return write
+
+
+class TestNativeReader:
+    """Test metadata extraction without pdfinfo"""
+
+    def test_classic_xref(self, write_pdf):
+        """Page count, size and info strings from a classic xref table"""
+        info = read_pdf_info(write_pdf(build_classic_pdf(page_objects(pages=2))))
+
+        assert info.pages == 2
+        assert (info.width, info.height) == (595.276, 841.89)
+        assert info.paper_name == "A4"
+        assert info.creator == "LaTeX with (hyperref)"
+        assert info.producer == "XeLaTeX"
+        assert info.source == "native"
+
+    def test_xref_stream_with_object_stream(self, write_pdf):
+        """PDF 1.5 xref streams and compressed objects are supported"""
+        info = read_pdf_info(write_pdf(build_xref_stream_pdf(page_objects(pages=3))))
+
+        assert info.pages == 3
+        assert info.paper_name == "A4"
+        assert info.producer == "XeLaTeX"
+
+    def test_rotated_page_swaps_size(self, write_pdf):
+        """Inherited /Rotate 90 swaps width and height"""
+        objects = page_objects(pages=1, media_box="[0 0 612 792]", rotate=90)
+        info = read_pdf_info(write_pdf(build_classic_pdf(objects)))
+
+        assert (info.width, info.height) == (792.0, 612.0)
+
+    def test_damaged_xref_is_recovered(self, write_pdf):
+        """A wrong startxref offset falls back to scanning object headers"""
+        info = read_pdf_info(write_pdf(build_classic_pdf(page_objects(pages=1), corrupt_xref=True)))
+
+        assert info.pages == 1
+
+    def test_not_a_pdf(self, write_pdf):
+        """Non-PDF and empty files are not parsed"""
+        assert read_pdf_info(write_pdf(b"hello", name="notes.pdf")) is None
+        assert read_pdf_info(write_pdf(b"", name="empty.pdf")) is None
+
+
+class TestPdfinfoCompatibility:
+    """Test the pdfinfo-style text consumed by the validators"""
+
+    def test_text_matches_validator_patterns(self, write_pdf):
+        """Rendered text uses pdfinfo field names and layout"""
+        text = pdfinfo_text(write_pdf(build_classic_pdf(page_objects(pages=2))))
+
+        assert "Pages:           2\n" in text
+        assert "Page size:       595.276 x 841.89 pts (A4)\n" in text
+        assert "Producer:        XeLaTeX\n" in text
+
+    def test_unreadable_without_pdfinfo(self, write_pdf, monkeypatch):
+        """Unparseable files fall back to pdfinfo, None if it is missing"""
+        monkeypatch.setenv("PATH", "")
+        path = write_pdf(b"%PDF-1.4\ngarbage", name="broken.pdf")
+
+        assert get_pdf_info(path) is None
+        assert pdfinfo_text(path) is None
+
+    def test_letter_size_label(self):
+        """US Letter pages are labelled like pdfinfo does"""
+        text = PdfInfo(pages=1, width=612.0, height=792.0).to_pdfinfo_text()
+
+        assert text == "Pages:           1\nPage size:       612 x 792 pts (letter)\n"
@@ -0,0 +1,162 @@
+"""
+Tests for journaled batch processing (deprecated/automation/process_saved_jobs.py)
+
+Verifies that:
+- Every finished file, duplicates included, is appended to PROCESSING-JOURNAL.jsonl
+  as it finishes; PROCESSING-SUMMARY.json is written at the end
+- The batch folder is named after the input folder, not the date
+- Results do not depend on the number of worker threads
+- A failed copy is retried on the next run, also after its folder was created;
+  finished files are not redone
+- An interrupted run keeps the copies and duplicates finished before it
+- Repeats of jobs finished by an earlier run are still caught
+- Dry runs write nothing
+"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from process_saved_jobs import JobProcessor
+
+
+def saved_job(folder, name, title, company, body="Role description"):
+    (folder / name).write_text(f"# {title}\n\n**Company:** {company}\n**Location:** London\n\n{body}\n",
+                               encoding='utf-8')
+
+
+@pytest.fixture
+def saves(tmp_path):
+    saves = tmp_path / "staging" / "manual-saves"
+    saves.mkdir(parents=True)
+    saved_job(saves, "1.md", "Director of Product", "Booking.com", "Travel marketplace")
+    saved_job(saves, "2.md", "Senior Product Manager", "Kraken", "Energy platform")
+    saved_job(saves, "3.md", "Head of Product", "Monzo", "Banking app")
+    (saves / "4.md").write_text("no title or company", encoding='utf-8')
+    return saves
+
+
+def batch_dir(tmp_path):
+    [batch] = (tmp_path / "staging").glob("*-processed-batch")
+    return batch
+
+
+def summary_of(tmp_path):
+    return json.loads((batch_dir(tmp_path) / 'PROCESSING-SUMMARY.json').read_text(encoding='utf-8'))
+
+
+def journal_of(tmp_path):
+    lines = (batch_dir(tmp_path) / 'PROCESSING-JOURNAL.jsonl').read_text(encoding='utf-8').splitlines()
+    return [json.loads(line) for line in lines]
+
+
+class TestJournal:
+    """Test the per-file journal"""
+
+    def test_finished_files_journaled(self, tmp_path, saves, capsys):
+        results = JobProcessor(tmp_path).process_batch(saves, workers=4)
+
+        assert (results['processed'], results['duplicates'], results['errors']) == (3, 0, 1)
+        summary = summary_of(tmp_path)
+        assert [job['file'] for job in summary['jobs']] == ["1.md", "2.md", "3.md"]
+        for job in summary['jobs']:
+            assert (batch_dir(tmp_path) / job['folder'] / 'job-description.md').exists()
+        assert batch_dir(tmp_path).name == "manual-saves-processed-batch"
+        assert sorted(job['file'] for job in journal_of(tmp_path)) == ["1.md", "2.md", "3.md"]
+
+    def test_workers_do_not_change_results(self, tmp_path, saves, capsys):
+        serial = JobProcessor(tmp_path / "a").process_batch(saves, dry_run=True, workers=1)
+        pooled = JobProcessor(tmp_path / "b").process_batch(saves, dry_run=True, workers=4)
+
+        assert serial == pooled
+        assert not (tmp_path / "a" / "staging").exists()
+
+
+class TestResume:
+    """Test resuming an interrupted batch"""
+
+    def test_failed_copy_retried(self, tmp_path, saves, capsys, monkeypatch):
+        save_job = JobProcessor._save_job
+
+        def flaky(job_file, job_folder):
+            if job_file.name == "2.md":
+                raise OSError("disk full")
+            save_job(job_file, job_folder)
+
+        monkeypatch.setattr(JobProcessor, '_save_job', staticmethod(flaky))
+        first = JobProcessor(tmp_path).process_batch(saves)
+        assert (first['processed'], first['errors']) == (2, 2)
+        monkeypatch.undo()
+
+        parsed = []
+        parse = JobProcessor._parse_job_file
+        monkeypatch.setattr(JobProcessor, '_parse_job_file',
+                            lambda self, path: parsed.append(path.name) or parse(self, path))
+        second = JobProcessor(tmp_path).process_batch(saves)
+
+        assert sorted(parsed) == ["2.md", "4.md"]
+        assert (second['processed'], second['errors']) == (3, 1)
+        assert [job['file'] for job in summary_of(tmp_path)['jobs']] == ["1.md", "2.md", "3.md"]
+
+    def test_interrupted_run_journals_finished_files(self, tmp_path, saves, capsys, monkeypatch):
+        """Copies and duplicates finished before an interruption are journaled and not redone"""
+        saved_job(saves, "15.md", "Director of Product", "Booking.com", "Travel marketplace")
+        check_job = JobProcessor._check_job
+
+        def interrupted(self, job_file, job_data, output_dir):
+            if job_file.name == "3.md":
+                raise KeyboardInterrupt
+            return check_job(self, job_file, job_data, output_dir)
+
+        monkeypatch.setattr(JobProcessor, '_check_job', interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            JobProcessor(tmp_path).process_batch(saves, workers=2)
+        monkeypatch.undo()
+
+        journaled = {job['file']: job['status'] for job in journal_of(tmp_path)}
+        assert journaled == {"1.md": 'processed', "15.md": 'duplicate', "2.md": 'processed'}
+        assert not (batch_dir(tmp_path) / 'PROCESSING-SUMMARY.json').exists()
+
+        with open(batch_dir(tmp_path) / 'PROCESSING-JOURNAL.jsonl', 'a', encoding='utf-8') as journal:
+            journal.write('{"file": "3.md", "sta')  # cut short
+        parsed = []
+        parse = JobProcessor._parse_job_file
+        monkeypatch.setattr(JobProcessor, '_parse_job_file',
+                            lambda self, path: parsed.append(path.name) or parse(self, path))
+        results = JobProcessor(tmp_path).process_batch(saves)
+
+        assert sorted(parsed) == ["3.md", "4.md"]
+        assert (results['processed'], results['duplicates'], results['errors']) == (3, 1, 1)
+
+    def test_partial_copy_not_tracked(self, tmp_path, saves, capsys, monkeypatch):
+        """A copy failing after its folder was created is retried, not matched against that folder"""
+        copy2 = shutil.copy2
+
+        def failing(source, target):
+            if Path(source).name == "2.md":
+                raise OSError("disk full")
+            return copy2(source, target)
+
+        monkeypatch.setattr(shutil, 'copy2', failing)
+        first = JobProcessor(tmp_path).process_batch(saves)
+        monkeypatch.undo()
+        assert (first['processed'], first['errors']) == (2, 2)
+
+        second = JobProcessor(tmp_path).process_batch(saves)
+
+        assert (second['processed'], second['duplicates'], second['errors']) == (3, 0, 1)
+        kraken = next(job for job in summary_of(tmp_path)['jobs'] if job['file'] == "2.md")
+        assert (batch_dir(tmp_path) / kraken['folder'] / 'job-description.md').exists()
+
+    def test_repeats_of_journaled_jobs(self, tmp_path, saves, capsys):
+        JobProcessor(tmp_path).process_batch(saves)
+        saved_job(saves, "5.md", "Head of Product", "Monzo Bank", "Banking app")
+        saved_job(saves, "6.md", "Director of Product, Stays", "Booking.com")
+
+        results = JobProcessor(tmp_path).process_batch(saves)
+
+        assert (results['processed'], results['duplicates']) == (3, 2)
+        statuses = {job['file']: job['status'] for job in results['jobs']}
+        assert statuses["5.md"] == statuses["6.md"] == 'duplicate'
@@ -0,0 +1,186 @@
+"""
+Tests for the streaming report renderer (scripts/report_writer.py)
+and the dashboard sections (scripts/dashboard_sections.py)
+
+Verifies that:
+- Sections are rendered in the requested order with separators
+- Unknown or duplicate section names are rejected
+- Reports are streamed to disk
+- Unchanged reports (ignoring timestamp lines) are not rewritten
+- Dashboard sections can be combined into custom reports
+- A section cache only re-renders sections whose declared inputs changed
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+from report_writer import SectionCache, SectionRegistry, render_report, write_report
+from dashboard_sections import SECTIONS, STATUS_REPORT, METRICS_REPORT
+
+
+def make_app(company, status='applied', fit_score=8.0):
+    return {
+        'company': company, 'role': 'PM', 'status': status, 'fit_score': fit_score,
+        'location': 'London', 'analyzed_date': '2025-01-05', 'cv_generated': True,
+        'cover_letter_generated': False, 'applied_date': '2025-01-08', 'interview_dates': [],
+        'rejected_date': None, 'withdrawn_date': None,
+    }
+
+
+@pytest.fixture
+def registry():
+    registry = SectionRegistry()
+
+    @registry.section('intro')
+    def intro(name):
+        yield f"# {name}\n"
+
+    @registry.section('body')
+    def body(name):
+        yield "line 1\n"
+        yield "line 2\n"
+
+    return registry
+
+
+class TestSectionRegistry:
+    """Test section registration and rendering"""
+
+    def test_render_in_order_with_separator(self, registry):
+        """Sections are joined by a horizontal rule"""
+        text = "".join(render_report(registry, ['intro', 'body'], "Report"))
+
+        assert text == "# Report\n\n---\n\nline 1\nline 2\n"
+
+    def test_unknown_section_raises(self, registry):
+        """Asking for an unregistered section is an error"""
+        with pytest.raises(ValueError):
+            list(render_report(registry, ['intro', 'missing'], "Report"))
+
+    def test_duplicate_section_raises(self, registry):
+        """Section names are unique"""
+        with pytest.raises(ValueError):
+            registry.section('intro')(lambda name: iter(()))
+
+    def test_write_report_streams_to_file(self, registry, tmp_path):
+        """Chunks end up in the output file, creating parent folders"""
+        path = tmp_path / "insights" / "report.md"
+
+        assert write_report(path, render_report(registry, ['body'], "Report")) is True
+        assert path.read_text(encoding='utf-8') == "line 1\nline 2\n"
+
+
+class TestSkipIfUnchanged:
+    """Test atomic, skip-if-unchanged report writes"""
+
+    def test_timestamp_only_change_is_skipped(self, tmp_path):
+        """A new Generated: line alone does not rewrite the file"""
+        path = tmp_path / "report.md"
+        write_report(path, ["# Report\n\n**Generated:** 2025-01-01 09:00\n", "body\n"])
+        os.utime(path, ns=(0, 0))
+
+        written = write_report(path, ["# Report\n\n**Generated:** 2025-01-02 10:30\n", "body\n"])
+
+        assert written is False
+        assert path.stat().st_mtime_ns == 0
+        assert "2025-01-01 09:00" in path.read_text(encoding='utf-8')
+
+    def test_content_change_is_written(self, tmp_path):
+        """Real changes replace the file"""
+        path = tmp_path / "report.md"
+        write_report(path, ["**Last Updated:** 2025-01-01\n", "3 applications\n"])
+
+        written = write_report(path, ["**Last Updated:** 2025-01-02\n", "4 app", "lications\n"])
+
+        assert written is True
+        assert path.read_text(encoding='utf-8') == "**Last Updated:** 2025-01-02\n4 applications\n"
+
+    def test_report_mode(self, tmp_path):
+        """Reports are rw-r--r--, not mkstemp's owner-only mode"""
+        path = tmp_path / "report.md"
+        write_report(path, ["content\n"])
+
+        assert path.stat().st_mode & 0o777 == 0o644
+
+    def test_no_temp_files_left_behind(self, tmp_path):
+        """Temp files are cleaned up on skip and on errors"""
+        path = tmp_path / "report.md"
+        write_report(path, ["same\n"])
+        write_report(path, ["same\n"])
+
+        def failing_chunks():
+            yield "partial\n"
+            raise RuntimeError("render failed")
+
+        with pytest.raises(RuntimeError):
+            write_report(path, failing_chunks())
+
+        assert [p.name for p in tmp_path.iterdir()] == ["report.md"]
+        assert path.read_text(encoding='utf-8') == "same\n"
+
+
+class TestDashboardSections:
+    """Test the STATUS.md / metrics dashboard sections"""
+
+    def test_reports_use_registered_sections(self):
+        """Every section named in the dashboard layouts exists"""
+        for name in STATUS_REPORT + METRICS_REPORT:
+            assert name in SECTIONS
+
+    def test_sections_can_be_reused(self):
+        """A custom report can combine existing sections"""
+        applications = [make_app("Kraken", fit_score=9.0), make_app("Angi", fit_score=6.0)]
+        metrics = {'by_status': {'applied': 2}}
+
+        text = "".join(render_report(SECTIONS, ['status_counts', 'top_10'], applications, metrics))
+
+        assert "| Applied | 2 |" in text
+        assert text.index("Kraken") < text.index("Angi")
+        assert "\n---\n\n## Top 10 Applications by Fit Score" in text
+
+
+class TestSectionCache:
+    """Test re-rendering only the sections a change affects"""
+
+    def test_only_affected_sections_rerendered(self):
+        applications = [make_app("Kraken", fit_score=9.0), make_app("Angi", fit_score=6.0)]
+        metrics = {'by_status': {'applied': 2}}
+        report = ['status_counts', 'top_10', 'high_priority']
+        cache = SectionCache(SECTIONS)
+
+        first = "".join(cache.render(report, applications, metrics))
+        assert (cache.rendered, cache.reused) == (3, 0)
+
+        # A location edit only affects the sections listing locations
+        applications[0]['location'] = "Remote"
+        second = "".join(cache.render(report, applications, metrics, changed_fields={'location'}))
+        assert (cache.rendered, cache.reused) == (5, 1)
+        assert second == "".join(render_report(SECTIONS, report, applications, metrics)) != first
+
+        # A changed metric re-renders the sections reading it
+        metrics['by_status'] = {'applied': 1, 'rejected': 1}
+        "".join(cache.render(report, applications, metrics, changed_fields=set()))
+        assert (cache.rendered, cache.reused) == (6, 3)
+
+    def test_undeclared_sections_always_rendered(self):
+        cache = SectionCache(SECTIONS)
+        metrics = {'total': 0}
+        for _ in range(2):
+            "".join(cache.render(['status_header'], [], metrics, changed_fields=set()))
+
+        assert (cache.rendered, cache.reused) == (2, 0)
+
+    def test_changed_fields_of_watch_batch(self, sync_status):
+        """sync-status --watch passes the fields that differ between record maps"""
+        from status_parser import parse_status_text
+
+        def record(location, path="a/status.md"):
+            return parse_status_text(f"# Application Status - Kraken - PM\n\n**Current Status:** Applied\n"
+                                     f"**Location:** {location}\n", Path(path))
+
+        before = {Path("a/status.md"): record("London")}
+        assert sync_status.changed_fields(before, dict(before)) == set()
+        assert sync_status.changed_fields(before, {Path("a/status.md"): record("Remote")}) == {'location'}
+        assert sync_status.changed_fields(before, {Path("b/status.md"): record("London", "b/status.md")}) is None
+
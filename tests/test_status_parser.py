@@ -0,0 +1,152 @@
+"""
+Tests for the shared status.md parser (scripts/status_parser.py)
+
+Verifies that a single pass over status.md extracts:
+- Title (company, role)
+- Header fields (current status, dates, fit score, location)
+- CV / cover letter generation flags
+- Timeline events in file order
+"""
+
+import pytest
+
+from status_parser import parse_status_file, parse_status_text, extract_date
+
+
+SAMPLE_STATUS = """# Application Status - Kraken - Director of Product
+
+**Current Status:** Rejected
+**Last Updated:** 2025-01-20 09:15
+**Fit Score:** 8.5/10
+**Analyzed On:** 2025-01-05
+**Applied On:** 2025-01-08
+**Days in Process:** 12
+**Location:** London, UK
+**CV Version:** ArturSwadzba_CV_Kraken.pdf
+**Cover Letter:** Not generated
+
+## Status Timeline
+
+### Rejected - 2025-01-20 09:15
+**Notes:** Rejection email received
+
+### Interview Round 1 - 2025-01-14
+**Notes:** Hiring manager call
+
+### Applied - 2025-01-08 14:00
+**Notes:** Application submitted
+**Fit Score:** 3/10
+"""
+
+
+class TestHeaderFields:
+    """Test extraction of title and **Field:** lines"""
+
+    def test_extracts_title(self):
+        """Company and role come from the title line"""
+        record = parse_status_text(SAMPLE_STATUS)
+
+        assert record.company == "Kraken"
+        assert record.role == "Director of Product"
+
+    def test_extracts_fields(self):
+        """All known header fields are captured"""
+        record = parse_status_text(SAMPLE_STATUS)
+
+        assert record.current_status == "Rejected"
+        assert record.status == "rejected"
+        assert record.last_updated == "2025-01-20 09:15"
+        assert record.analyzed_on == "2025-01-05"
+        assert record.applied_on == "2025-01-08"
+        assert record.days_in_process == 12
+        assert record.location == "London, UK"
+
+    def test_first_field_occurrence_wins(self):
+        """Fit score repeated in timeline notes does not override header"""
+        record = parse_status_text(SAMPLE_STATUS)
+
+        assert record.fit_score == 8.5
+
+    def test_generation_flags(self):
+        """'Not generated' values are reported as not generated"""
+        record = parse_status_text(SAMPLE_STATUS)
+
+        assert record.cv_generated is True
+        assert record.cover_letter_generated is False
+
+    def test_missing_fields_default_to_none(self):
+        """Minimal status file parses without errors"""
+        record = parse_status_text("# Application Status\n\n**Current Status:** drafting\n")
+
+        assert record.company is None
+        assert record.fit_score is None
+        assert record.status == "drafting"
+        assert record.timeline == []
+
+    def test_unknown_status_when_missing(self):
+        """No Current Status line yields 'unknown'"""
+        record = parse_status_text("# Notes only\n")
+
+        assert record.current_status is None
+        assert record.status == "unknown"
+
+
+class TestTimeline:
+    """Test timeline event tokenization"""
+
+    def test_events_in_file_order(self):
+        """Timeline events keep file order"""
+        record = parse_status_text(SAMPLE_STATUS)
+
+        assert [event.label for event in record.timeline] == [
+            "Rejected", "Interview Round 1", "Applied"
+        ]
+
+    def test_event_dates(self):
+        """Event dates drop the time of day"""
+        record = parse_status_text(SAMPLE_STATUS)
+
+        assert record.first_event("Applied").when == "2025-01-08 14:00"
+        assert record.first_event("Applied").date == "2025-01-08"
+
+    def test_first_event_matches_any_label(self):
+        """first_event returns the earliest matching event in the file"""
+        record = parse_status_text(SAMPLE_STATUS)
+
+        event = record.first_event("Interview-Invited", "Rejected")
+        assert event.label == "Rejected"
+
+    def test_interview_events(self):
+        """Interview events are found by label prefix"""
+        record = parse_status_text(SAMPLE_STATUS)
+
+        interviews = record.events_starting_with("Interview ")
+        assert [event.date for event in interviews] == ["2025-01-14"]
+
+
+class TestParseStatusFile:
+    """Test file-based parsing"""
+
+    def test_parse_file_sets_path(self, tmp_path):
+        """Record remembers the source path and folder name"""
+        app_folder = tmp_path / "2025-01-Kraken-Director"
+        app_folder.mkdir()
+        status_file = app_folder / "status.md"
+        status_file.write_text(SAMPLE_STATUS, encoding="utf-8")
+
+        record = parse_status_file(status_file)
+
+        assert record.path == status_file
+        assert record.folder_name == "2025-01-Kraken-Director"
+        assert record.company == "Kraken"
+
+    def test_missing_file_raises(self, tmp_path):
+        """Unreadable files raise so callers can report them"""
+        with pytest.raises(OSError):
+            parse_status_file(tmp_path / "missing" / "status.md")
+
+    def test_extract_date(self):
+        """extract_date finds an ISO date inside free text"""
+        assert extract_date("2025-01-10 14:00") == "2025-01-10"
+        assert extract_date("Not applied") is None
+        assert extract_date(None) is None
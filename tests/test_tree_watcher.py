@@ -0,0 +1,83 @@
+"""
+Tests for the file tree watcher (scripts/tree_watcher.py)
+
+Verifies that:
+- Polling detects created, edited and deleted tracked files
+- inotify reports changes in subdirectories created after startup
+- Bursts of edits are delivered as a single debounced batch
+"""
+
+import sys
+import pytest
+
+from tree_watcher import InotifyWatcher, PollingWatcher, watch_batches
+
+
+@pytest.fixture
+def app_folder(tmp_path):
+    folder = tmp_path / "active" / "applied" / "2025-01-Kraken-PM"
+    folder.mkdir(parents=True)
+    (folder / "status.md").write_text("**Current Status:** applied\n", encoding='utf-8')
+    return folder
+
+
+class TestPollingWatcher:
+    """Test snapshot-diff change detection"""
+
+    def test_detects_edit(self, tmp_path, app_folder):
+        """Changed status.md is reported"""
+        watcher = PollingWatcher(tmp_path, interval=0.01)
+        (app_folder / "status.md").write_text("**Current Status:** rejected, see notes\n", encoding='utf-8')
+
+        assert watcher.poll(1.0) == {app_folder / "status.md"}
+
+    def test_detects_new_and_deleted_files(self, tmp_path, app_folder):
+        """Created and removed tracked files are both reported"""
+        watcher = PollingWatcher(tmp_path, interval=0.01)
+        (app_folder / "analysis.md").write_text("## Fit Score: 8/10\n", encoding='utf-8')
+        (app_folder / "status.md").unlink()
+
+        assert watcher.poll(1.0) == {app_folder / "analysis.md", app_folder / "status.md"}
+
+    def test_ignores_untracked_files(self, tmp_path, app_folder):
+        """Files the dashboards do not read are not reported"""
+        watcher = PollingWatcher(tmp_path, interval=0.01)
+        (app_folder / "notes.txt").write_text("call recruiter", encoding='utf-8')
+
+        assert watcher.poll(0.05) == set()
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason="inotify is Linux only")
+class TestInotifyWatcher:
+    """Test recursive inotify watching"""
+
+    def test_new_folder_is_watched(self, tmp_path, app_folder):
+        """Folders created after startup are watched too"""
+        watcher = InotifyWatcher(tmp_path)
+        try:
+            new_folder = tmp_path / "active" / "interviewing" / "2025-02-Angi-PM"
+            new_folder.mkdir(parents=True)
+            assert new_folder.parent in watcher.poll(1.0)
+
+            (new_folder / "status.md").write_text("**Current Status:** interviewing\n", encoding='utf-8')
+            changed = watcher.poll(1.0)
+            while new_folder / "status.md" not in changed:
+                more = watcher.poll(1.0)
+                assert more, "status.md change not reported"
+                changed |= more
+        finally:
+            watcher.close()
+
+
+class TestWatchBatches:
+    """Test debouncing of bursts"""
+
+    def test_burst_is_one_batch(self, tmp_path, app_folder):
+        """Several edits in quick succession arrive together"""
+        watcher = PollingWatcher(tmp_path, interval=0.01)
+        (app_folder / "status.md").write_text("**Current Status:** rejected\n", encoding='utf-8')
+        (app_folder / "analysis.md").write_text("## Fit Score: 6/10\n", encoding='utf-8')
+
+        batch = next(watch_batches(watcher, debounce=0.05))
+
+        assert batch == {app_folder / "status.md", app_folder / "analysis.md"}
@@ -0,0 +1,122 @@
+"""
+Tests for batch PDF validation (scripts/validation_batch.py)
+
+Verifies that:
+- CVs and cover letters are discovered with their markdown partners
+- Documents are validated in a process pool with the single-file checks
+- Unchanged documents are served from the validation cache
+- JSON and JUnit reports aggregate all results
+- Re-running with the same results leaves the JSON report untouched
+"""
+
+import json
+import xml.etree.ElementTree as ET
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+import validation_batch
+from validation_batch import discover, run_batch, validate_all, write_json_report
+
+
+@pytest.fixture
+def applications(tmp_path):
+    root = tmp_path / "applications"
+    for company in ("Kraken", "Angi"):
+        folder = root / f"2025-01-{company}-PM"
+        folder.mkdir(parents=True)
+        (folder / f"ArturSwadzba_CV_{company}.pdf").write_bytes(b"%PDF-1.4\n")
+        (folder / f"ArturSwadzba_CoverLetter_{company}.pdf").write_bytes(b"%PDF-1.4\n")
+    (root / "2025-01-Kraken-PM" / "ArturSwadzba_CV_Kraken.md").write_text(
+        "---\ntitle: CV\n---\nBody\n", encoding='utf-8')
+    (root / "2025-01-Kraken-PM" / "job-description.pdf").write_bytes(b"%PDF-1.4\n")
+    return root
+
+
+class TestDiscovery:
+    """Test artifact discovery"""
+
+    def test_finds_both_kinds_with_markdown(self, applications):
+        """PDFs are paired with <stem>.md when it exists"""
+        artifacts = discover(applications)
+
+        assert [(a.kind, Path(a.pdf_path).name) for a in artifacts] == [
+            ("cv", "ArturSwadzba_CV_Angi.pdf"),
+            ("cv", "ArturSwadzba_CV_Kraken.pdf"),
+            ("cover-letter", "ArturSwadzba_CoverLetter_Angi.pdf"),
+            ("cover-letter", "ArturSwadzba_CoverLetter_Kraken.pdf"),
+        ]
+        assert artifacts[0].md_path is None
+        assert Path(artifacts[1].md_path).name == "ArturSwadzba_CV_Kraken.md"
+
+    def test_single_kind(self, applications):
+        """Discovery can be restricted to one document kind"""
+        assert {a.kind for a in discover(applications, ['cover-letter'])} == {"cover-letter"}
+
+
+class TestBatchValidation:
+    """Test pooled validation and reports"""
+
+    def test_pool_matches_serial_run(self, applications, tmp_path):
+        """Process pool results equal a single-process run, in discovery order"""
+        artifacts = discover(applications)
+
+        pooled = validate_all(artifacts, jobs=2, cache_path=tmp_path / "pooled.json")
+        serial = validate_all(artifacts, jobs=1, cache_path=tmp_path / "serial.json")
+
+        assert [r.pdf_path for r in pooled] == [a.pdf_path for a in artifacts]
+        assert [(r.passed, r.failed, r.warnings) for r in pooled] == \
+               [(r.passed, r.failed, r.warnings) for r in serial]
+        # 9-byte placeholder PDFs are far below the minimum file size
+        assert all(r.status == 'failed' for r in pooled)
+        assert "Checking file existence..." in pooled[0].output
+
+    def test_unchanged_documents_use_cache(self, applications, tmp_path):
+        """Second run only re-validates the regenerated PDF"""
+        artifacts = discover(applications)
+        cache_path = tmp_path / ".validation-cache.json"
+        validate_all(artifacts, jobs=1, cache_path=cache_path)
+
+        Path(artifacts[0].pdf_path).write_bytes(b"%PDF-1.4\n% regenerated\n")
+        results = validate_all(artifacts, jobs=1, cache_path=cache_path)
+
+        assert [r.cached for r in results] == [False, True, True, True]
+        assert not any(r.cached for r in validate_all(artifacts, jobs=1, force=True,
+                                                      cache_path=cache_path))
+
+    def test_reports(self, applications, tmp_path, capsys):
+        """JSON summary and JUnit suites cover every document"""
+        json_path = tmp_path / "report.json"
+        junit_path = tmp_path / "report.xml"
+
+        exit_code = run_batch(applications, ['cv', 'cover-letter'], jobs=1,
+                              json_path=json_path, junit_path=junit_path,
+                              cache_path=tmp_path / "cache.json")
+
+        assert exit_code == 1
+        report = json.loads(json_path.read_text(encoding='utf-8'))
+        assert report['summary']['documents'] == 4
+        assert report['summary']['failed'] == 4
+        assert '\x1b[' not in report['results'][0]['output']
+
+        suites = ET.parse(junit_path).getroot()
+        assert [s.get('name') for s in suites] == ["cv", "cover-letter"]
+        assert suites[0].get('tests') == "2"
+        assert suites[0][0].get('name') == "2025-01-Angi-PM/ArturSwadzba_CV_Angi.pdf"
+        assert suites[0][0].find('failure') is not None
+        assert "Failed:  4" in capsys.readouterr().out
+
+    def test_json_report_not_rewritten(self, applications, tmp_path, monkeypatch):
+        """Only the 'generated' timestamp differs between runs: the file is left alone"""
+        results = validate_all(discover(applications), jobs=1, cache_path=tmp_path / "cache.json")
+        json_path = tmp_path / "report.json"
+        assert write_json_report(results, json_path)
+
+        class Later(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2030, 1, 1)
+
+        monkeypatch.setattr(validation_batch, 'datetime', Later)
+        assert not write_json_report(results, json_path)
+
@@ -0,0 +1,114 @@
+"""
+Tests for the validation result cache (scripts/validation_cache.py)
+
+Verifies that:
+- Unchanged PDFs are served from the cache with their stored report
+- Regenerated PDFs, edited markdown and validator version bumps re-validate
+- --force re-validates and refreshes the cached result
+- Corrupt cache files are ignored
+"""
+
+import pytest
+
+from validation_cache import ValidationCache, capture_output
+
+
+@pytest.fixture
+def files(tmp_path):
+    pdf = tmp_path / "ArturSwadzba_CoverLetter_Kraken.pdf"
+    md = tmp_path / "ArturSwadzba_CoverLetter_Kraken.md"
+    pdf.write_bytes(b"%PDF-1.4\nnot really a pdf\n")
+    md.write_text("Dear Hiring Manager,\n\nBody\n\nBest regards\n", encoding='utf-8')
+    return pdf, md
+
+
+class TestValidationCache:
+    """Test cache keys and persistence"""
+
+    def test_round_trip(self, files, tmp_path):
+        """Stored results are found again after save/load"""
+        pdf, md = files
+        cache_path = tmp_path / "insights" / ".validation-cache.json"
+        cache = ValidationCache.load(cache_path)
+        key = cache.key_for('validate-cv', 1, pdf, md)
+        cache.put(pdf, key, (5, 0, 1), "report\n")
+        cache.save()
+
+        cached = ValidationCache.load(cache_path).get(pdf, key)
+
+        assert cached.counts == (5, 0, 1)
+        assert cached.output == "report\n"
+
+    def test_key_changes_with_inputs(self, files):
+        """PDF content, markdown content and validator version all affect the key"""
+        pdf, md = files
+        key = ValidationCache.key_for('validate-cv', 1, pdf, md)
+
+        assert ValidationCache.key_for('validate-cv', 1, pdf, md) == key
+        assert ValidationCache.key_for('validate-cv', 2, pdf, md) != key
+        assert ValidationCache.key_for('validate-cv', 1, pdf, None) != key
+
+        md.write_text("Dear Hiring Manager,\n\nEdited\n", encoding='utf-8')
+        edited = ValidationCache.key_for('validate-cv', 1, pdf, md)
+        assert edited != key
+
+        pdf.write_bytes(b"%PDF-1.4\nregenerated\n")
+        assert ValidationCache.key_for('validate-cv', 1, pdf, md) != edited
+
+    def test_touch_does_not_invalidate(self, files):
+        """Only content matters, not modification time"""
+        pdf, md = files
+        key = ValidationCache.key_for('validate-cv', 1, pdf, md)
+        pdf.write_bytes(pdf.read_bytes())
+
+        assert ValidationCache.key_for('validate-cv', 1, pdf, md) == key
+
+    def test_corrupt_cache_is_ignored(self, tmp_path):
+        """An unreadable cache file gives an empty cache"""
+        cache_path = tmp_path / ".validation-cache.json"
+        cache_path.write_text("{not json", encoding='utf-8')
+
+        assert ValidationCache.load(cache_path).entries == {}
+
+    def test_deleted_pdfs_are_pruned(self, files, tmp_path):
+        """Entries for PDFs that no longer exist are dropped on save"""
+        pdf, md = files
+        cache_path = tmp_path / ".validation-cache.json"
+        cache = ValidationCache.load(cache_path)
+        cache.put(pdf, "key", (1, 0, 0), "")
+        pdf.unlink()
+        cache.save()
+
+        assert ValidationCache.load(cache_path).entries == {}
+
+    def test_capture_output_echoes(self, capsys):
+        """Captured output is still printed live"""
+        result, output = capture_output(lambda: print("checking") or 42)
+
+        assert (result, output) == (42, "checking\n")
+        assert capsys.readouterr().out == "checking\n"
+
+
+class TestValidatorCaching:
+    """Test the cover letter validator with the cache"""
+
+    def test_unchanged_pdf_is_not_rechecked(self, validate_cl, files, tmp_path, capsys, monkeypatch):
+        """The second run replays the report without running checks"""
+        pdf, md = files
+        cache_path = tmp_path / ".validation-cache.json"
+
+        first = validate_cl.run_cached_checks(str(pdf), str(md), cache_path=cache_path)
+        first_output = capsys.readouterr().out
+
+        calls = []
+        monkeypatch.setattr(validate_cl, 'run_checks', lambda *args: calls.append(args))
+        second = validate_cl.run_cached_checks(str(pdf), str(md), cache_path=cache_path)
+        second_output = capsys.readouterr().out
+
+        assert calls == []
+        assert second == first
+        assert second_output.startswith(first_output)
+        assert "cached result" in second_output
+
+        validate_cl.run_cached_checks(str(pdf), str(md), force=True, cache_path=cache_path)
+        assert len(calls) == 1